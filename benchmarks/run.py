@@ -0,0 +1,304 @@
+"""
+Benchmarks de los caminos más usados de `Table` y `TableSection`.
+
+Mide `Table.section_*`, `Table.section`, `TableSection.gn_section_*`, `get_column`, `section_values`, la validación
+del setter `table` y `create_table` con distintos tamaños de tabla, direcciones, longitudes de selección, modos de
+ejecución y motores de almacenamiento. Los resultados se escriben en JSON para comparar dos ejecuciones, por ejemplo
+antes y después de un cambio o entre dos versiones.
+
+Uso, desde la raíz del repositorio:
+
+    python -m benchmarks.run --output resultados.json
+    python -m benchmarks.run --filter section --sizes 10 100 --output nuevo.json --compare resultados.json
+
+Con `--compare` se muestra la relación entre el tiempo nuevo y el de la ejecución anterior de cada caso, y el proceso
+termina con código 1 si algún caso es más lento que `--threshold` veces el anterior.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+from tabulate import tabulate
+
+from src.mystical import table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Lados de las tablas cuadradas de cada benchmark.
+SIZES = (10, 100, 1000)
+
+# Longitudes de selección. Las mayores que el lado de la tabla se reemplazan por el lado.
+LENGTHS = (1, 3, 16, 1000)
+
+# Motores de almacenamiento: opciones del constructor de `Table`. 'mmap' se abre desde un archivo temporal.
+BACKENDS = {
+    'list': {},
+    'array': {'dtype': 'q'},
+    'sparse': {'sparse': True},
+    'mmap': None,
+}
+
+ENGINES = tuple(engine for engine in table.ENGINES if engine != 'numpy' or numpy is not None)
+GENERATORS = ('python', 'numpy') if numpy is not None else ('python',)
+
+# Benchmarks registrados con `benchmark`: nombre -> función que genera los casos.
+BENCHMARKS = {}
+
+
+def benchmark(name: str):
+    """Registra una función que genera los casos `(params, función a medir)` del benchmark `name`."""
+    def register(cases):
+        BENCHMARKS[name] = cases
+        return cases
+    return register
+
+
+def _numbers(size: int) -> list:
+    return [[r * size + c for c in range(size)] for r in range(size)]
+
+
+def _tables(size: int, workspace: str):
+    """Genera `(backend, tabla)` con el mismo contenido en cada motor de almacenamiento."""
+    numbers = _numbers(size)
+    for backend, options in BACKENDS.items():
+        if options is None:
+            path = os.path.join(workspace, f'table-{size}.bin')
+            table.Table(numbers, dtype='q').save(path)
+            object_table = table.Table.open(path)
+            # Los casos se miden a medida que se generan, así que al volver aquí ya no se usa la tabla.
+            yield backend, object_table
+            object_table.storage.close()
+        else:
+            yield backend, table.Table([row.copy() for row in numbers], **options)
+
+
+def _selections(size: int):
+    """Genera `(direction, length, row, column)` válidos para cada dirección y longitud en una tabla de `size`."""
+    for direction in table.TYPES:
+        d_row, d_column = table.VECTORS[direction]
+        for length in sorted({min(length, size) for length in LENGTHS}):
+            row = size - 1 if d_row < 0 else 0
+            column = size - 1 if d_column < 0 else 0
+            yield direction, length, row, column
+
+
+def _method(direction: str) -> str:
+    return direction.lower().replace('-', '_')
+
+
+@benchmark('section')
+def _section(sizes, workspace):
+    for size in sizes:
+        for engine in ENGINES:
+            object_table = table.Table(size, size, engine=engine)
+            for direction, length, row, column in _selections(size):
+                method = getattr(object_table, 'section_' + _method(direction))
+                params = {'size': size, 'engine': engine, 'direction': direction, 'length': length}
+                yield params, lambda method=method, row=row, column=column, length=length: method(row, column, length)
+
+
+@benchmark('section_name')
+def _section_name(sizes, workspace):
+    for size in sizes:
+        for engine in ENGINES:
+            object_table = table.Table(size, size, engine=engine)
+            for direction, length, row, column in _selections(size):
+                params = {'size': size, 'engine': engine, 'direction': direction, 'length': length}
+                yield params, partial(object_table.section, direction.lower(), row, column, length)
+
+
+@benchmark('gn_section')
+def _gn_section(sizes, workspace):
+    for size in sizes:
+        numbers = _numbers(size)
+        for direction, length, row, column in _selections(size):
+            method = 'gn_section_' + _method(direction)
+
+            def run(row=row, column=column, cells=length - 1, method=method):
+                for _ in getattr(table.TableSection(row, column, cells, numbers), method)():
+                    pass
+
+            yield {'size': size, 'direction': direction, 'length': length}, run
+
+
+@benchmark('section_values')
+def _section_values(sizes, workspace):
+    for size in sizes:
+        for backend, object_table in _tables(size, workspace):
+            for direction in (table.RIGHT, table.DOWN, table.DIAGONAL_YR):
+                def run(object_table=object_table, direction=direction):
+                    for _ in object_table.section_values(direction, 0, 0, size):
+                        pass
+
+                yield {'size': size, 'backend': backend, 'direction': direction, 'length': size}, run
+
+
+@benchmark('get_column')
+def _get_column(sizes, workspace):
+    for size in sizes:
+        for backend, object_table in _tables(size, workspace):
+            def run(object_table=object_table):
+                for column in range(size):
+                    object_table.get_column(column)
+
+            yield {'size': size, 'backend': backend, 'columns': size}, run
+
+
+@benchmark('table_setter')
+def _table_setter(sizes, workspace):
+    for size in sizes:
+        numbers = _numbers(size)
+        for backend, options in BACKENDS.items():
+            if options is None:
+                continue
+            object_table = table.Table(1, 1, **options)
+
+            def run(object_table=object_table):
+                object_table.table = numbers
+
+            yield {'size': size, 'backend': backend}, run
+
+
+@benchmark('create_table')
+def _create_table(sizes, workspace):
+    for size in sizes:
+        yield {'size': size, 'fill': 'constant'}, lambda size=size: table.create_table(size, size, fill=1)
+        for generator in GENERATORS:
+            for dtype in (None, 'q'):
+                def run(size=size, generator=generator, dtype=dtype):
+                    create = table.create_table if dtype is None else partial(table.create_storage, dtype=dtype)
+                    create(size, size, random_fill=True, seed=1, generator=generator)
+
+                yield {'size': size, 'fill': 'random', 'generator': generator, 'dtype': dtype}, run
+        yield ({'size': size, 'fill': 'random', 'generator': 'python', 'exclude': 50},
+               lambda size=size: table.create_table(size, size, random_fill=True, seed=1, exclude=range(0, 100, 2)))
+
+
+def measure(function, repeat: int = 5, min_time: float = 0.02) -> dict:
+    """Mide `function` como `timeit`: calibra la cantidad de llamadas de cada medición para que dure al menos
+    `min_time` segundos y repite la medición `repeat` veces.
+
+    :return: Diccionario con la cantidad de llamadas por medición y los segundos por llamada mínimo, mediano y medio.
+    :rtype: dict
+    """
+    function()  # La primera llamada puede incluir importaciones diferidas y construcción de índices.
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        times.append((time.perf_counter() - start) / number)
+    return {'number': number, 'best': min(times), 'median': statistics.median(times), 'mean': statistics.fmean(times)}
+
+
+def run(names=None, sizes=SIZES, pattern: str = None, repeat: int = 5, min_time: float = 0.02) -> dict:
+    """Ejecuta los benchmarks `names` (todos por defecto) y devuelve los resultados en un diccionario serializable
+    en JSON.
+
+    :param str pattern: Si se pasa, solo se ejecutan los casos cuya clave (ver `key`) contiene `pattern`.
+    :rtype: dict
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as workspace:
+        for name in names or BENCHMARKS:
+            for params, function in BENCHMARKS[name](sizes, workspace):
+                result = {'benchmark': name, 'params': params}
+                if pattern and pattern not in key(result):
+                    continue
+                result.update(measure(function, repeat, min_time))
+                results.append(result)
+                print(f'{key(result)}: {result["best"] * 1e6:.2f} us', file=sys.stderr)
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'numpy': numpy.__version__ if numpy is not None else None,
+            'repeat': repeat,
+            'min_time': min_time,
+        },
+        'results': results,
+    }
+
+
+def key(result: dict) -> str:
+    """Identifica un caso por su benchmark y sus parámetros, para comparar dos ejecuciones."""
+    params = ' '.join(f'{name}={value}' for name, value in sorted(result['params'].items()))
+    return f'{result["benchmark"]} {params}'
+
+
+def compare(current: dict, baseline: dict, threshold: float = 1.2):
+    """Compara el tiempo mínimo de cada caso con el de `baseline`.
+
+    :return: Una tupla `(filas, regresiones)`: una fila `(caso, anterior, actual, relación)` por caso presente en las
+        dos ejecuciones y la cantidad de casos cuya relación supera `threshold`.
+    :rtype: tuple
+    """
+    previous = {key(result): result['best'] for result in baseline['results']}
+    rows = []
+    regressions = 0
+    for result in current['results']:
+        name = key(result)
+        if name not in previous:
+            continue
+        ratio = result['best'] / previous[name] if previous[name] else float('inf')
+        regressions += ratio > threshold
+        rows.append((name, previous[name] * 1e6, result['best'] * 1e6, ratio))
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('benchmarks', nargs='*', metavar='benchmark',
+                        help=f'Benchmarks a ejecutar: {", ".join(BENCHMARKS)}. Por defecto, todos.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES, help='Lados de las tablas cuadradas.')
+    parser.add_argument('--filter', dest='pattern', help='Solo los casos cuya clave contiene este texto.')
+    parser.add_argument('--repeat', type=int, default=5, help='Mediciones por caso.')
+    parser.add_argument('--min-time', type=float, default=0.02, help='Segundos mínimos de cada medición.')
+    parser.add_argument('--output', help='Archivo JSON de resultados. Por defecto, la salida estándar.')
+    parser.add_argument('--compare', help='Archivo JSON de una ejecución anterior con el que comparar.')
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help='Relación actual/anterior a partir de la cual un caso se considera una regresión.')
+    arguments = parser.parse_args(argv)
+    unknown = set(arguments.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f'benchmarks desconocidos: {", ".join(sorted(unknown))}')
+
+    results = run(arguments.benchmarks, arguments.sizes, arguments.pattern, arguments.repeat, arguments.min_time)
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if arguments.compare:
+        with open(arguments.compare, encoding='utf-8') as file:
+            rows, regressions = compare(results, json.load(file), arguments.threshold)
+        print(tabulate(rows, ('caso', 'anterior (us)', 'actual (us)', 'relación'), floatfmt='.2f'), file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
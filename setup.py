@@ -26,5 +26,8 @@ setuptools.setup(
     python_requires=">=3.6",
     install_requires=[
         "tabulate>=0.8.9"
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy>=1.17"]
+    }
 )
@@ -0,0 +1,144 @@
+"""
+Selecciones por lotes sobre una `Table`.
+
+`section_many` resuelve muchas consultas `(direction, row, column, cell)` de una vez y devuelve todas las posiciones en
+un único resultado por columnas (`SectionBatch`). Las direcciones se normalizan una sola vez por valor distinto, los
+límites se comprueban de forma analítica a partir de la primera y la última celda de cada selección y las consultas
+inválidas se marcan en el resultado en lugar de lanzar una excepción por cada una.
+"""
+
+from array import array
+from itertools import accumulate, repeat
+
+from .table import VECTORS
+
+
+class SectionBatch:
+    """Resultado de un lote de selecciones, organizado por columnas.
+
+    Las posiciones de la consulta i son `zip(rows[offsets[i]:offsets[i + 1]], columns[offsets[i]:offsets[i + 1]])`.
+    Las consultas inválidas tienen `valid[i] == 0`, `types[i] is None` y ninguna posición.
+    """
+
+    __slots__ = ('types', 'offsets', 'rows', 'columns', 'valid')
+
+    def __init__(self, types, offsets, rows, columns, valid):
+        """
+        :param list types: Dirección normalizada de cada consulta, o None si la consulta es inválida.
+        :param offsets: `len(types) + 1` desplazamientos sobre `rows` y `columns`.
+        :param rows: Índices de fila de todas las posiciones seleccionadas.
+        :param columns: Índices de columna de todas las posiciones seleccionadas.
+        :param valid: 1 si la consulta es válida, 0 si no lo es.
+        """
+        self.types = types
+        self.offsets = offsets
+        self.rows = rows
+        self.columns = columns
+        self.valid = valid
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, index):
+        """Devuelve la consulta `index` con la forma de los métodos `section_*`, o None si la consulta es inválida."""
+        if not self.valid[index]:
+            return None
+        start, stop = int(self.offsets[index]), int(self.offsets[index + 1])
+        return {'type': self.types[index],
+                'position': list(zip(self.rows[start:stop].tolist(), self.columns[start:stop].tolist()))}
+
+    def __iter__(self):
+        for index in range(len(self.types)):
+            yield self[index]
+
+    @classmethod
+    def concat(cls, batches):
+        """Une varios lotes, en orden, en un único lote."""
+        types = []
+        offsets = array('q', [0])
+        rows = array('q')
+        columns = array('q')
+        valid = array('b')
+        for batch in batches:
+            total = offsets[-1]
+            types += batch.types
+            offsets.extend(total + offset for offset in batch.offsets[1:])
+            rows.extend(batch.rows)
+            columns.extend(batch.columns)
+            valid.extend(batch.valid)
+        return cls(types, offsets, rows, columns, valid)
+
+    @property
+    def invalid(self) -> list:
+        """Índices de las consultas inválidas."""
+        return [index for index, valid in enumerate(self.valid) if not valid]
+
+
+def columnar(queries):
+    """Devuelve las consultas como cuatro secuencias: direcciones, filas, columnas y celdas.
+
+    :param queries: Un diccionario con las llaves 'direction', 'row', 'column' y 'cell', cada una con una secuencia, o
+        un iterable de tuplas `(direction, row, column, cell)`.
+    :rtype: tuple
+    """
+    if isinstance(queries, dict):
+        return queries['direction'], queries['row'], queries['column'], queries['cell']
+    queries = list(queries)
+    if not queries:
+        return (), (), (), ()
+    return tuple(zip(*queries))
+
+
+def section_many(rows: int, columns: int, queries) -> SectionBatch:
+    """Resuelve un lote de selecciones sobre una tabla de `rows` x `columns`.
+
+    Una consulta es inválida si su dirección no es uno de `TYPES`, si `row`, `column` o `cell` no son enteros mayores
+    o iguales a 0, o si la primera o la última celda de la selección quedan fuera de la tabla.
+
+    :param int rows: Número de filas de la tabla.
+    :param int columns: Número de columnas de la tabla.
+    :param queries: Consultas en cualquiera de los formatos que admite `columnar`.
+    :rtype: SectionBatch
+    """
+    directions, starts_row, starts_column, cells = columnar(queries)
+
+    normalized = {}
+    types = []
+    lengths = []
+    out_rows = []
+    out_columns = []
+    add_type = types.append
+    add_length = lengths.append
+    for direction, row, column, cell in zip(directions, starts_row, starts_column, cells):
+        try:
+            _type = normalized[direction]
+        except KeyError:
+            _type = direction.upper() if isinstance(direction, str) else None
+            _type = normalized[direction] = _type if _type in VECTORS else None
+        except TypeError:
+            _type = None
+
+        if _type is None or not (isinstance(row, int) and isinstance(column, int) and isinstance(cell, int)) or \
+                row < 0 or column < 0 or cell < 0:
+            add_type(None)
+            add_length(0)
+            continue
+
+        if cell:
+            d_row, d_column = VECTORS[_type]
+            last = cell - 1
+            if not (row < rows and column < columns and 0 <= row + d_row * last < rows and
+                    0 <= column + d_column * last < columns):
+                add_type(None)
+                add_length(0)
+                continue
+            out_rows += range(row, row + d_row * cell, d_row) if d_row else repeat(row, cell)
+            out_columns += range(column, column + d_column * cell, d_column) if d_column else repeat(column, cell)
+
+        add_type(_type)
+        add_length(cell)
+
+    offsets = array('q', [0])
+    offsets.extend(accumulate(lengths))
+    valid = array('b', [_type is not None for _type in types])
+    return SectionBatch(types, offsets, array('q', out_rows), array('q', out_columns), valid)
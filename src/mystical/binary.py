@@ -0,0 +1,131 @@
+"""
+Formato binario de una tabla en disco.
+
+El archivo empieza con una cabecera de `HEADER_SIZE` bytes seguida del contenido de las celdas en orden por filas
+(row-major), en little-endian y con el tipo de dato declarado en la cabecera:
+
+    offset  tamaño  campo
+    0       4       firma b'MYST'
+    4       1       versión del formato
+    5       1       dtype, código de tipo del módulo array
+    6       1       tamaño en bytes de cada celda
+    7       1       banderas: `FLAG_ZLIB` si el contenido está comprimido con zlib
+    8       8       número de filas
+    16      8       número de columnas
+    24      8       relleno hasta `HEADER_SIZE`, para que las celdas queden alineadas
+
+Un archivo sin comprimir se puede proyectar en memoria (ver `MmapStorage`).
+"""
+
+import struct
+import sys
+import zlib
+from array import array
+
+MAGIC = b'MYST'
+VERSION = 1
+HEADER = struct.Struct('<4sBcBBQQ')
+HEADER_SIZE = 32
+FLAG_ZLIB = 1
+
+# Tamaño en bytes de cada bloque que se lee, comprime o descomprime.
+CHUNK_SIZE = 1 << 20
+
+
+def pack_header(rows: int, columns: int, dtype: str, flags: int = 0) -> bytes:
+    """Construye la cabecera de una tabla de `rows` x `columns` celdas de tipo `dtype`.
+
+    :rtype: bytes
+    """
+    header = HEADER.pack(MAGIC, VERSION, dtype.encode('ascii'), array(dtype).itemsize, flags, rows, columns)
+    return header.ljust(HEADER_SIZE, b'\0')
+
+
+def unpack_header(buffer) -> tuple:
+    """Lee y valida la cabecera al principio de `buffer`.
+
+    :return: Una tupla `(rows, columns, dtype, flags)`.
+    :rtype: tuple
+
+    :raise ValueError: Si `buffer` no empieza con una cabecera válida o el tamaño de celda no coincide con el de
+        esta plataforma.
+    """
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError('El archivo no contiene una tabla: cabecera incompleta.')
+    magic, version, dtype, itemsize, flags, rows, columns = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError('El archivo no contiene una tabla: firma desconocida.')
+    if version > VERSION:
+        raise ValueError(f'Versión de formato {version} no admitida, la última admitida es {VERSION}.')
+    dtype = dtype.decode('ascii')
+    try:
+        native = array(dtype).itemsize
+    except ValueError:
+        raise ValueError(f'dtype {dtype!r} no admitido.') from None
+    if native != itemsize:
+        raise ValueError(f"El dtype {dtype!r} ocupa {itemsize} bytes en el archivo y {native} en esta plataforma.")
+    return rows, columns, dtype, flags
+
+
+def write(path, rows: int, columns: int, dtype: str, buffer, compress=False) -> None:
+    """Escribe una tabla en `path`.
+
+    :param path: Ruta del archivo.
+    :param int rows: Número de filas.
+    :param int columns: Número de columnas.
+    :param str dtype: Código de tipo del módulo array de las celdas.
+    :param buffer: Objeto con el protocolo buffer que contiene las celdas en orden por filas, en el orden de bytes de
+        la plataforma.
+    :param compress: False para no comprimir, True para comprimir con zlib o un nivel de compresión de 0 a 9.
+    """
+    view = memoryview(buffer).cast('B')
+    if sys.byteorder != 'little':
+        swapped = array(dtype)
+        swapped.frombytes(view)
+        swapped.byteswap()
+        view = memoryview(swapped).cast('B')
+    with open(path, 'wb') as file:
+        file.write(pack_header(rows, columns, dtype, FLAG_ZLIB if compress else 0))
+        if compress:
+            compressor = zlib.compressobj(-1 if compress is True else compress)
+            for start in range(0, len(view), CHUNK_SIZE):
+                file.write(compressor.compress(view[start:start + CHUNK_SIZE]))
+            file.write(compressor.flush())
+        else:
+            file.write(view)
+
+
+def read(path) -> tuple:
+    """Lee una tabla de `path` con una sola lectura en bloque hacia un buffer ya reservado.
+
+    :return: Una tupla `(rows, columns, dtype, data)`, donde `data` es un `array.array` con las celdas.
+    :rtype: tuple
+
+    :raise ValueError: Si el archivo no contiene una tabla o su contenido está incompleto.
+    """
+    with open(path, 'rb') as file:
+        rows, columns, dtype, flags = unpack_header(file.read(HEADER_SIZE))
+        data = array(dtype, [0]) * (rows * columns)
+        view = memoryview(data).cast('B')
+        if flags & FLAG_ZLIB:
+            decompressor = zlib.decompressobj()
+            position = 0
+            chunk = file.read(CHUNK_SIZE)
+            while True:
+                output = decompressor.decompress(chunk, CHUNK_SIZE) if chunk else decompressor.flush()
+                if position + len(output) > len(view):
+                    raise ValueError('El archivo no contiene una tabla: contenido de más.')
+                view[position:position + len(output)] = output
+                position += len(output)
+                if not chunk or decompressor.eof:
+                    break
+                chunk = decompressor.unconsumed_tail or file.read(CHUNK_SIZE)
+            read_size = position
+        else:
+            read_size = file.readinto(view)
+        view.release()
+    if read_size != len(data) * data.itemsize:
+        raise ValueError('El archivo no contiene una tabla: contenido incompleto.')
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return rows, columns, dtype, data
@@ -0,0 +1,59 @@
+"""
+Caché LRU de resultados de `Table.section`.
+
+Las consultas repetidas `(direction, row, column, cell)` se resuelven con una búsqueda en un diccionario en lugar de
+recalcular las posiciones. La caché tiene un tamaño máximo; al llenarse se descarta la consulta usada hace más tiempo.
+"""
+
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'evictions', 'size', 'maxsize'))
+CacheInfo.__doc__ = """Estadísticas de una `SectionCache`: aciertos, fallos, consultas descartadas por falta de
+espacio, consultas almacenadas y tamaño máximo."""
+
+
+class SectionCache:
+    """Caché LRU acotada con contadores de aciertos, fallos y descartes."""
+
+    def __init__(self, maxsize: int):
+        """
+        :param int maxsize: Cantidad máxima de resultados almacenados. Debe ser mayor que 0.
+
+        :raise ValueError: Si `maxsize` no es un entero mayor que 0.
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError('maxsize debe ser un número y debe ser mayor que 0')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__data = OrderedDict()
+
+    def __len__(self):
+        return len(self.__data)
+
+    def get(self, key):
+        """Devuelve el resultado de `key` y lo marca como el más reciente, o None si no está almacenado."""
+        try:
+            value = self.__data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.__data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        """Almacena el resultado de `key`, descartando el menos reciente si la caché está llena."""
+        self.__data[key] = value
+        if len(self.__data) > self.maxsize:
+            self.__data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Descarta todos los resultados. Los contadores se conservan."""
+        self.__data.clear()
+
+    def info(self) -> CacheInfo:
+        """Devuelve las estadísticas de la caché."""
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self.__data), self.maxsize)
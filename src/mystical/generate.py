@@ -0,0 +1,217 @@
+"""
+Generación rápida y reproducible de tablas con contenido aleatorio.
+
+Los números se toman directamente del conjunto de valores permitidos (`_min` a `_max` sin `exclude`), sin volver a
+sortear los excluidos, y se generan por bloques de filas completas en lugar de celda por celda. Cada bloque usa su
+propio generador, derivado de la semilla y del número de bloque, así que el resultado para una semilla no depende de
+cómo se repartan los bloques entre procesos.
+
+Hay dos motores: 'python', basado en `random.Random`, y 'numpy', que genera cada bloque con una sola operación sobre
+arreglos. Cada motor es reproducible con su semilla, pero no producen los mismos números entre sí.
+
+`parallel_table` reparte los bloques entre varios procesos que escriben directamente en un segmento de memoria
+compartida (ver `mystical.shared`); el resultado es el mismo que el de `random_table` con cualquier cantidad de
+procesos.
+"""
+
+import random
+from array import array
+from multiprocessing import Pool, cpu_count
+
+from .binary import HEADER_SIZE, pack_header, unpack_header
+from .shared import _attach
+from .storage import DTYPES, ArrayStorage
+
+# Motores de generación.
+ENGINES = ('python', 'numpy')
+
+# Cantidad aproximada de celdas de cada bloque.
+BLOCK_CELLS = 1 << 18
+
+# Segmento y parámetros de generación del proceso del grupo, asignados por `_initialize`.
+_task = None
+
+
+def allowed(_min: int, _max: int, exclude=None):
+    """Devuelve los valores permitidos, de `_min` (incluido) a `_max` (excluido) sin los de `exclude`.
+
+    Sin `exclude` es un `range`, que no ocupa memoria; con `exclude` es una lista ordenada.
+
+    :raise ValueError: Si no queda ningún valor permitido.
+    """
+    pool = range(_min, _max)
+    if exclude:
+        excluded = set(exclude)
+        pool = [number for number in pool if number not in excluded]
+    if not pool:
+        raise ValueError(f'No hay números entre {_min} y {_max} que no estén excluidos.')
+    return pool
+
+
+def blocks(rows: int, columns: int) -> list:
+    """Divide las filas en bloques de unas `BLOCK_CELLS` celdas. Solo depende de las dimensiones de la tabla.
+
+    :return: Lista de tuplas `(start, stop)` con las filas de cada bloque.
+    :rtype: list
+    """
+    size = max(1, BLOCK_CELLS // max(columns, 1))
+    return [(start, min(start + size, rows)) for start in range(0, rows, size)]
+
+
+def base_seed(seed=None) -> int:
+    """Devuelve la semilla de la que se derivan las de los bloques; sin `seed`, una aleatoria."""
+    return random.SystemRandom().getrandbits(64) if seed is None else seed
+
+
+def hash_seed(seed) -> int:
+    """Convierte una semilla entera o de texto en un entero no negativo estable, como admite NumPy."""
+    if isinstance(seed, int) and seed >= 0:
+        return seed
+    return int.from_bytes(random.Random(str(seed)).getrandbits(128).to_bytes(16, 'little'), 'little')
+
+
+def block_values(pool, count: int, seed, index: int, engine: str = 'python'):
+    """Genera `count` valores de `pool` para el bloque `index` con la semilla `seed`.
+
+    :return: Una lista con el motor 'python' o un `numpy.ndarray` con el motor 'numpy'.
+
+    :raise ValueError: Si `engine` no es uno de `ENGINES`.
+    :raise ImportError: Si `engine` es 'numpy' y NumPy no está instalado.
+    """
+    if engine == 'python':
+        return random.Random(f'{seed}:{index}').choices(pool, k=count)
+    if engine != 'numpy':
+        raise ValueError(f"engine debe ser uno de {ENGINES} y se paso {engine!r}")
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise ImportError('El motor "numpy" requiere NumPy: pip install mystical[numpy]') from None
+
+    generator = numpy.random.default_rng([hash_seed(seed), index])
+    if isinstance(pool, range):
+        return generator.integers(pool.start, pool.stop, size=count, dtype=numpy.int64)
+    return numpy.asarray(pool, dtype=numpy.int64)[generator.integers(0, len(pool), size=count)]
+
+
+def check_dtype(pool, dtype: str) -> None:
+    """Comprueba que todos los valores de `pool` quepan en el tipo `dtype`, antes de generar nada, para que los dos
+    motores rechacen igual un rango que no cabe (NumPy lo truncaría sin avisar).
+
+    :raise ValueError: Si `dtype` no es uno de `DTYPES` o los valores no caben en ese tipo.
+    """
+    if dtype not in DTYPES:
+        raise ValueError(f"dtype debe ser uno de {DTYPES} y se paso {dtype!r}")
+    if dtype in ('f', 'd'):
+        return
+    bits = array(dtype).itemsize * 8
+    low, high = (0, 2 ** bits - 1) if dtype.isupper() else (-2 ** (bits - 1), 2 ** (bits - 1) - 1)
+    if pool[0] < low or pool[-1] > high:
+        raise ValueError(f'Los números de {pool[0]} a {pool[-1]} no caben en el tipo {dtype!r} ({low} a {high}).')
+
+
+def random_block(columns: int, start: int, stop: int, pool, seed, index: int, dtype: str = None,
+                 engine: str = 'python'):
+    """Genera el bloque `index`, que abarca las filas `start` a `stop` (ver `blocks`).
+
+    :return: Un `array.array` de tipo `dtype` con las celdas del bloque en orden por filas o, sin `dtype`, una lista
+        de filas.
+    """
+    values = block_values(pool, (stop - start) * columns, seed, index, engine)
+    if dtype is not None:
+        if engine == 'numpy':
+            output = array(dtype)
+            output.frombytes(values.astype(dtype).tobytes())
+            return output
+        return array(dtype, values)
+    if engine == 'numpy':
+        return values.reshape(-1, columns).tolist()
+    return [values[cell:cell + columns] for cell in range(0, len(values), columns)]
+
+
+def random_table(rows: int, columns: int, _min: int = 0, _max: int = 100, exclude=None, seed=None,
+                 dtype: str = None, engine: str = 'python'):
+    """Genera una tabla de `rows` x `columns` con números aleatorios de `allowed(_min, _max, exclude)`.
+
+    :param seed: Semilla (entero o texto). Con la misma semilla, dimensiones y motor se obtiene la misma tabla.
+    :param str dtype: Si se pasa, las celdas se escriben directamente en un `array.array` de ese tipo.
+    :param str engine: 'python' o 'numpy'.
+
+    :return: Una lista de listas o, con `dtype`, un `array.array` con las celdas en orden por filas.
+
+    :raise ValueError: Si no hay valores permitidos, no caben en `dtype` o `engine` no es uno de `ENGINES`.
+    """
+    pool = allowed(_min, _max, exclude)
+    if dtype is not None:
+        check_dtype(pool, dtype)
+    seed = base_seed(seed)
+    output = [] if dtype is None else array(dtype)
+    for index, (start, stop) in enumerate(blocks(rows, columns)):
+        output += random_block(columns, start, stop, pool, seed, index, dtype, engine)
+    return output
+
+
+def _initialize(name: str, rows: int, columns: int, pool, seed, dtype: str, engine: str) -> None:
+    global _task
+    _task = (_attach(name), columns, blocks(rows, columns), pool, seed, dtype, engine)
+
+
+def _fill(index: int) -> None:
+    segment, columns, bounds, pool, seed, dtype, engine = _task
+    start, stop = bounds[index]
+    values = random_block(columns, start, stop, pool, seed, index, dtype, engine)
+    offset = HEADER_SIZE + start * columns * values.itemsize
+    segment.buf[offset:offset + len(values) * values.itemsize] = memoryview(values).cast('B')
+
+
+def parallel_table(rows: int, columns: int, _min: int = 0, _max: int = 100, exclude=None, seed=None,
+                   dtype: str = 'q', engine: str = 'python', processes: int = None, name: str = None):
+    """Genera la misma tabla que `random_table` repartiendo los bloques entre `processes` procesos.
+
+    Cada proceso escribe sus bloques directamente en un segmento de memoria compartida con el formato de
+    `shared.publish`, así que las celdas no se serializan entre procesos.
+
+    :param str dtype: Código de tipo del módulo array de las celdas.
+    :param int processes: Cantidad de procesos. Por defecto, la cantidad de núcleos.
+    :param str name: Nombre del segmento. Si no se pasa, se genera uno.
+
+    :return: El segmento con la tabla, al que se adjunta con `SharedStorage` o `Table.attach`. El proceso que llama
+        es responsable de liberarlo con `close` y `unlink`.
+    :rtype: SharedMemory
+
+    :raise ValueError: Si no hay valores permitidos, `engine` no es uno de `ENGINES`, `dtype` no es válido o los
+        valores no caben en `dtype`.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    pool = allowed(_min, _max, exclude)
+    seed = base_seed(seed)
+    if engine not in ENGINES:
+        raise ValueError(f"engine debe ser uno de {ENGINES} y se paso {engine!r}")
+    check_dtype(pool, dtype)
+    header = pack_header(rows, columns, dtype)
+    segment = SharedMemory(name, create=True, size=HEADER_SIZE + max(rows * columns * array(dtype).itemsize, 1))
+    try:
+        segment.buf[:HEADER_SIZE] = header
+        with Pool(processes or cpu_count(), _initialize,
+                  (segment.name, rows, columns, pool, seed, dtype, engine)) as workers:
+            workers.map(_fill, range(len(blocks(rows, columns))), 1)
+    except BaseException:
+        segment.close()
+        segment.unlink()
+        raise
+    return segment
+
+
+def take(segment) -> ArrayStorage:
+    """Copia la tabla de un segmento creado con `parallel_table` en un `ArrayStorage` y libera el segmento.
+
+    :rtype: ArrayStorage
+    """
+    try:
+        rows, columns, dtype, flags = unpack_header(segment.buf)
+        data = array(dtype)
+        data.frombytes(segment.buf[HEADER_SIZE:HEADER_SIZE + rows * columns * data.itemsize])
+    finally:
+        segment.close()
+        segment.unlink()
+    return ArrayStorage(rows, columns, dtype, data)
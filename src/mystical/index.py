@@ -0,0 +1,261 @@
+"""
+Índices de sumas acumuladas para agregar el contenido numérico de una `Table` en tiempo constante.
+
+`PrefixIndex` guarda, para cada familia de líneas (filas, columnas, diagonales y antidiagonales), la suma acumulada
+de cada celda con todas las anteriores de su línea. La suma de cualquier selección es entonces la diferencia de dos
+sumas acumuladas, sin importar su longitud. Cada familia se construye la primera vez que se usa.
+
+Tras modificar celdas, los índices se actualizan con `update` a partir de los cambios `(row, column, old, new)`. Cada
+índice solo recorre la parte afectada por cada cambio y, si eso costara más que construirlo de nuevo, se descarta y se
+vuelve a construir cuando se use.
+"""
+
+from array import array
+from itertools import accumulate
+
+from .scan import lines
+
+# Vector de avance de cada familia de líneas. La dirección contraria recorre las mismas líneas.
+FAMILIES = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def _typecode(storage) -> str:
+    """Código de tipo de las sumas acumuladas: enteros de 64 bits para contenido entero y 'd' en otro caso."""
+    if storage.dtype is None:
+        return 'q'
+    return 'd' if storage.dtype in ('f', 'd') else 'q'
+
+
+def _remaining(rows: int, columns: int, d_row: int, d_column: int, row: int, column: int) -> int:
+    """Cantidad de celdas desde (`row`, `column`), incluida, hasta el final de su línea en dirección
+    (`d_row`, `d_column`).
+    """
+    limits = []
+    if d_row:
+        limits.append(rows - row if d_row > 0 else row + 1)
+    if d_column:
+        limits.append(columns - column if d_column > 0 else column + 1)
+    return min(limits)
+
+
+def _shift(values: array, start: int, stop: int, step: int, delta) -> None:
+    """Suma `delta` a `values[start:stop:step]`."""
+    values[start:stop:step] = array(values.typecode, [value + delta for value in values[start:stop:step]])
+
+
+class PrefixIndex:
+    """Sumas acumuladas por dirección sobre un motor de almacenamiento (ver `mystical.storage`)."""
+
+    def __init__(self, storage):
+        """
+        :param storage: Motor de almacenamiento con contenido numérico.
+        """
+        self.storage = storage
+        self.__families = {}
+
+    def family(self, d_row: int, d_column: int) -> array:
+        """Devuelve, construyéndolas si hace falta, las sumas acumuladas de la familia (`d_row`, `d_column`).
+
+        La posición `r * columns + c` contiene la suma de la celda (r, c) y de todas las anteriores de su línea.
+        """
+        prefix = self.__families.get((d_row, d_column))
+        if prefix is None:
+            prefix = self.__families[d_row, d_column] = self.__build(d_row, d_column)
+        return prefix
+
+    def __build(self, d_row: int, d_column: int) -> array:
+        storage = self.storage
+        rows, columns = storage.rows, storage.columns
+        step = d_row * columns + d_column
+        typecode = _typecode(storage)
+        while True:
+            prefix = array(typecode, [0]) * (rows * columns)
+            try:
+                for row, column, length in lines(rows, columns, d_row, d_column):
+                    start = row * columns + column
+                    sums = array(typecode, accumulate(storage.values(row, column, d_row, d_column, length)))
+                    if length == 1:
+                        prefix[start] = sums[0]
+                    else:
+                        prefix[start:start + step * (length - 1) + 1:step] = sums
+                return prefix
+            except (TypeError, OverflowError):
+                # Contenido no entero o fuera del rango de 64 bits en una lista de listas.
+                if typecode == 'd':
+                    raise
+                typecode = 'd'
+
+    def sum(self, row: int, column: int, d_row: int, d_column: int, cell: int):
+        """Suma el contenido de `cell` celdas desde (`row`, `column`) avanzando (`d_row`, `d_column`).
+        La selección debe estar dentro de la tabla.
+        """
+        if not cell:
+            return 0
+        last = cell - 1
+        end_row, end_column = row + d_row * last, column + d_column * last
+        if (d_row, d_column) not in FAMILIES:
+            d_row, d_column = -d_row, -d_column
+            row, column, end_row, end_column = end_row, end_column, row, column
+        prefix = self.family(d_row, d_column)
+        columns = self.storage.columns
+        return prefix[end_row * columns + end_column] - prefix[row * columns + column] + self.storage.get(row, column)
+
+    def update(self, changes) -> None:
+        """Actualiza las familias construidas tras modificar celdas del almacenamiento.
+
+        Cada cambio suma su diferencia a las sumas acumuladas de las celdas que le siguen en su línea. Una familia cuyo
+        tipo de dato no admite el contenido nuevo, o en la que actualizar cuesta más que construirla, se descarta.
+
+        :param changes: Secuencia de tuplas `(row, column, old, new)` con el contenido anterior y el actual de cada
+            celda modificada.
+        """
+        rows, columns = self.storage.rows, self.storage.columns
+        for d_row, d_column in list(self.__families):
+            length = columns if not d_row else rows if not d_column else min(rows, columns)
+            if len(changes) * length > rows * columns:
+                del self.__families[d_row, d_column]
+                continue
+            prefix = self.__families[d_row, d_column]
+            step = d_row * columns + d_column
+            try:
+                for row, column, old, new in changes:
+                    if new == old:
+                        continue
+                    start = row * columns + column
+                    count = _remaining(rows, columns, d_row, d_column, row, column)
+                    if count == 1:
+                        # Línea de una sola celda: en una tabla de una fila o columna el paso puede ser 0.
+                        prefix[start] += new - old
+                    else:
+                        _shift(prefix, start, start + step * (count - 1) + 1, step, new - old)
+            except (TypeError, OverflowError):
+                del self.__families[d_row, d_column]
+
+
+class SummedAreaTable:
+    """Tabla de áreas sumadas (summed-area table) sobre un motor de almacenamiento (ver `mystical.storage`).
+
+    La posición `r * (columns + 1) + c` contiene la suma de todas las celdas de las filas menores que r y columnas
+    menores que c, por lo que la suma de cualquier región rectangular se obtiene con cuatro lecturas.
+    """
+
+    def __init__(self, storage):
+        """
+        :param storage: Motor de almacenamiento con contenido numérico.
+        """
+        self.storage = storage
+        self.__sums = None
+        self.__squares = None
+
+    def __build(self, square: bool) -> array:
+        storage = self.storage
+        rows, columns = storage.rows, storage.columns
+        width = columns + 1
+        typecode = _typecode(storage)
+        while True:
+            sums = array(typecode, [0]) * ((rows + 1) * width)
+            try:
+                above = sums[0:width]
+                for row in range(rows):
+                    values = storage.get_row(row)
+                    if square:
+                        values = [value * value for value in values]
+                    current = array(typecode, [0])
+                    current.extend(a + b for a, b in zip(accumulate(values), above[1:]))
+                    start = (row + 1) * width
+                    sums[start:start + width] = current
+                    above = current
+                return sums
+            except (TypeError, OverflowError):
+                # Contenido no entero o fuera del rango de 64 bits.
+                if typecode == 'd':
+                    raise
+                typecode = 'd'
+
+    def __region(self, sums, row_start, column_start, row_stop, column_stop):
+        width = self.storage.columns + 1
+        return sums[(row_stop + 1) * width + column_stop + 1] - sums[row_start * width + column_stop + 1] - \
+            sums[(row_stop + 1) * width + column_start] + sums[row_start * width + column_start]
+
+    def update(self, changes) -> None:
+        """Actualiza las tablas construidas tras modificar celdas del almacenamiento.
+
+        Cada cambio suma su diferencia a las sumas de las filas y columnas posteriores a la celda, así que cuesta lo
+        mismo que el área de esa esquina. Si entre todos los cambios eso supera el área de la tabla, o el tipo de dato
+        no admite el contenido nuevo, las tablas se descartan y se construyen de nuevo cuando se usen.
+
+        :param changes: Secuencia de tuplas `(row, column, old, new)`, como en `PrefixIndex.update`.
+        """
+        rows, columns = self.storage.rows, self.storage.columns
+        if sum((rows - row) * (columns - column) for row, column, _, _ in changes) > rows * columns:
+            self.__sums = self.__squares = None
+            return
+        width = columns + 1
+        for sums, square in ((self.__sums, False), (self.__squares, True)):
+            if sums is None:
+                continue
+            try:
+                for row, column, old, new in changes:
+                    delta = new * new - old * old if square else new - old
+                    if delta:
+                        for r in range(row + 1, rows + 1):
+                            _shift(sums, r * width + column + 1, (r + 1) * width, 1, delta)
+            except (TypeError, OverflowError):
+                if square:
+                    self.__squares = None
+                else:
+                    self.__sums = None
+
+    def sum(self, row_start: int, column_start: int, row_stop: int, column_stop: int):
+        """Suma el contenido de la región de (`row_start`, `column_start`) a (`row_stop`, `column_stop`), ambas
+        esquinas incluidas. La región debe estar dentro de la tabla.
+        """
+        if self.__sums is None:
+            self.__sums = self.__build(False)
+        return self.__region(self.__sums, row_start, column_start, row_stop, column_stop)
+
+    def sum_squares(self, row_start: int, column_start: int, row_stop: int, column_stop: int):
+        """Suma los cuadrados del contenido de la región. La tabla de cuadrados se construye la primera vez que se
+        usa.
+        """
+        if self.__squares is None:
+            self.__squares = self.__build(True)
+        return self.__region(self.__squares, row_start, column_start, row_stop, column_stop)
+
+
+class SparseRegions:
+    """Agregados de regiones rectangulares sobre un `SparseStorage`.
+
+    Una tabla de áreas sumadas sería densa, así que se recorren solo las celdas almacenadas y el resto de la región
+    se cuenta como contenido de relleno. Cuesta lo mismo que la cantidad de celdas almacenadas.
+    """
+
+    def __init__(self, storage):
+        """
+        :param SparseStorage storage: Motor de almacenamiento disperso con contenido numérico.
+        """
+        self.storage = storage
+
+    def __aggregate(self, row_start, column_start, row_stop, column_stop, square: bool):
+        fill = self.storage.fill
+        total = 0
+        stored = 0
+        for row, cells in self.storage.data.items():
+            if row_start <= row <= row_stop:
+                for column, value in cells.items():
+                    if column_start <= column <= column_stop:
+                        total += value * value if square else value
+                        stored += 1
+        implicit = (row_stop - row_start + 1) * (column_stop - column_start + 1) - stored
+        return total + (fill * fill if square else fill) * implicit
+
+    def update(self, changes) -> None:
+        """No hace nada: los agregados se calculan siempre sobre las celdas almacenadas."""
+
+    def sum(self, row_start: int, column_start: int, row_stop: int, column_stop: int):
+        """Suma el contenido de la región, ambas esquinas incluidas."""
+        return self.__aggregate(row_start, column_start, row_stop, column_stop, False)
+
+    def sum_squares(self, row_start: int, column_start: int, row_stop: int, column_stop: int):
+        """Suma los cuadrados del contenido de la región, ambas esquinas incluidas."""
+        return self.__aggregate(row_start, column_start, row_stop, column_stop, True)
@@ -0,0 +1,107 @@
+"""
+Construcción de una `Table` a partir de un flujo de filas.
+
+Las filas se leen por bloques de `CHUNK_ROWS` filas. Cada fila se valida (misma cantidad de celdas que la primera) y
+se convierte en cuanto llega, y cada bloque se vuelca directamente en el motor de almacenamiento elegido. Nunca se
+construye una lista de listas intermedia con toda la tabla, así que la memoria máxima es la de la tabla final más la
+de un bloque.
+"""
+
+import csv
+from array import array
+from itertools import chain, islice
+
+from .storage import DTYPES, ListStorage, ArrayStorage, SparseStorage
+from .table import TableStructureError
+
+# Cantidad de filas de cada bloque.
+CHUNK_ROWS = 1024
+
+
+def build(rows, dtype: str = None, sparse: bool = False, fill=0, convert=None, chunk_size: int = CHUNK_ROWS):
+    """Construye un motor de almacenamiento leyendo `rows` por bloques.
+
+    :param rows: Iterable de filas; cada fila es un iterable de celdas.
+    :param str dtype: Código de tipo del módulo array. Si se pasa, se construye un `ArrayStorage`.
+    :param bool sparse: Si es True, se construye un `SparseStorage` con relleno `fill`.
+    :param fill: Contenido de relleno del almacenamiento disperso. Solo se usa con `sparse`.
+    :param convert: Función que se aplica a cada celda antes de almacenarla, por ejemplo `int`.
+    :param int chunk_size: Cantidad de filas de cada bloque.
+
+    :return: El motor de almacenamiento con el contenido de `rows`.
+
+    :raise ValueError: Si se pasa `sparse` junto con `dtype`, `dtype` no es un tipo admitido, `chunk_size` no es
+        mayor que 0 o alguna celda no se puede almacenar con `dtype`.
+    :raise TableStructureError: Si no hay filas, alguna fila está vacía o no tiene las mismas celdas que la primera.
+    """
+    if sparse and dtype is not None:
+        raise ValueError('No se permite usar sparse y dtype de forma simultanea.')
+    if dtype is not None and dtype not in DTYPES:
+        raise ValueError(f"dtype debe ser uno de {DTYPES} y se paso {dtype!r}")
+    if chunk_size <= 0:
+        raise ValueError('chunk_size debe ser mayor que 0.')
+
+    if dtype is not None:
+        data = array(dtype)
+    elif sparse:
+        data = {}
+    else:
+        data = []
+    rows = iter(rows)
+    columns = None
+    count = 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        for offset, row in enumerate(chunk):
+            row = list(row) if convert is None else [convert(value) for value in row]
+            if columns is None:
+                columns = len(row)
+            if not row or len(row) != columns:
+                raise TableStructureError(f'La fila {count + offset} tiene {len(row)} celdas y se esperaban '
+                                          f'{columns or "más de 0"}.')
+            chunk[offset] = row
+
+        if dtype is not None:
+            try:
+                data.extend(chain.from_iterable(chunk))
+            except (TypeError, OverflowError) as error:
+                raise ValueError(f'Las filas {count} a {count + len(chunk) - 1} no se pueden almacenar con dtype '
+                                 f'{dtype!r}: {error}') from None
+        elif sparse:
+            for offset, row in enumerate(chunk):
+                cells = {c: value for c, value in enumerate(row) if value != fill}
+                if cells:
+                    data[count + offset] = cells
+        else:
+            data.extend(chunk)
+        count += len(chunk)
+
+    if not count:
+        raise TableStructureError('La tabla no tiene filas.')
+    if dtype is not None:
+        return ArrayStorage(count, columns, dtype, data)
+    if sparse:
+        return SparseStorage(count, columns, fill, data)
+    return ListStorage(data)
+
+
+def read_csv(path, dtype: str = None, sparse: bool = False, fill=0, convert=None, header: bool = False,
+             chunk_size: int = CHUNK_ROWS, encoding: str = 'utf-8', **fmtparams):
+    """Construye un motor de almacenamiento leyendo el archivo CSV `path` por bloques (ver `build`).
+
+    Si se pasa `dtype` y no `convert`, cada celda se convierte con `float` para 'f' y 'd', y con `int` para el resto.
+    Sin ninguno de los dos, las celdas se almacenan como cadenas.
+
+    :param bool header: Si es True, se descarta la primera fila del archivo.
+    :param str encoding: Codificación del archivo.
+    :param fmtparams: Parámetros de formato de `csv.reader`, por ejemplo `delimiter`.
+    """
+    if convert is None and dtype is not None:
+        convert = float if dtype in ('f', 'd') else int
+    with open(path, newline='', encoding=encoding) as file:
+        reader = csv.reader(file, **fmtparams)
+        if header:
+            next(reader, None)
+        return build(reader, dtype, sparse, fill, convert, chunk_size)
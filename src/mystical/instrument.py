@@ -0,0 +1,261 @@
+"""
+Instrumentación opcional de `Table` y `TableSection`.
+
+Una `Metrics` cuenta las llamadas y las celdas producidas por método y dirección, guarda un histograma de la latencia
+de cada par y cuenta los fallos (`TableSectionError`, `ValueError`, ...) por causa. Cada medición se entrega además a
+los hooks registrados con `add_hook`, para enviarla a un sistema de métricas externo.
+
+La instrumentación se activa por instancia: `Table.metrics` y `TableSection(..., metrics=...)` reemplazan los métodos
+medidos de esa instancia por envoltorios. Sin instrumentación no hay envoltorios, así que los métodos no tienen ningún
+costo adicional.
+"""
+
+from bisect import bisect_left
+from collections import Counter, namedtuple
+from inspect import signature
+from threading import local
+from time import perf_counter
+
+from .table import TYPES, TableSectionError
+
+# Límites superiores, en segundos, de las clases del histograma de latencia. La última clase no tiene límite.
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# Métodos de `Table` medidos: nombre -> (dirección fija, parámetros con la dirección, parámetro con la cantidad de
+# celdas o función que la calcula a partir del resultado). Sin ninguno de los dos, se usa el largo del resultado.
+TABLE_METHODS = {
+    **{'section_' + _type.lower().replace('-', '_'): (_type, (), 'cell') for _type in TYPES},
+    'section': (None, ('direction',), 'cell'),
+    'section_vector': (None, ('d_row', 'd_column'), 'cell'),
+    'section_values': (None, ('direction',), 'cell'),
+    'section_sum': (None, ('direction',), 'cell'),
+    'section_count': (None, ('direction',), 'cell'),
+    'section_mean': (None, ('direction',), 'cell'),
+    'section_many': (None, (), lambda batch: len(batch.rows)),
+    'get_row': (None, (), None),
+    'get_column': (None, (), None),
+}
+
+# Métodos de `TableSection` medidos: nombre -> dirección.
+SECTION_METHODS = {'gn_section_' + _type.lower().replace('-', '_'): _type for _type in TYPES}
+
+Event = namedtuple('Event', ('method', 'direction', 'cells', 'seconds', 'error'))
+Event.__doc__ = """Una medición: método, dirección (o None), celdas producidas, segundos y la excepción lanzada, o None
+si la llamada terminó bien."""
+
+
+def cause(error: BaseException) -> str:
+    """Describe la causa de un fallo con el tipo de la excepción y su mensaje, sin las posiciones de la selección."""
+    return f'{type(error).__name__}: {getattr(error, "message", None) or error}'
+
+
+def _arguments(function, names) -> list:
+    """Devuelve `(posición, nombre)` de cada parámetro `names` de `function`, para leerlos en cada llamada."""
+    parameters = list(signature(function).parameters)
+    return [(parameters.index(name), name) for name in names]
+
+
+def _argument(args, kwargs, position: int, name: str):
+    return args[position] if position < len(args) else kwargs.get(name)
+
+
+def _label(value) -> str:
+    if isinstance(value, str):
+        return value.upper()
+    return ','.join(map(str, value)) if isinstance(value, tuple) else str(value)
+
+
+class Histogram:
+    """Histograma acumulado de latencias con los límites de `buckets`."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Agrega una medición de `seconds` segundos."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def as_dict(self) -> dict:
+        return {'buckets': list(self.buckets), 'counts': list(self.counts), 'count': self.count, 'sum': self.sum}
+
+
+class Metrics:
+    """Contadores, histogramas de latencia y fallos por método y dirección."""
+
+    def __init__(self, buckets=BUCKETS):
+        """
+        :param buckets: Límites superiores, en segundos y en orden creciente, de las clases del histograma.
+
+        :raise ValueError: Si `buckets` está vacío o no está en orden creciente.
+        """
+        buckets = tuple(buckets)
+        if not buckets or list(buckets) != sorted(buckets):
+            raise ValueError('buckets debe tener al menos un límite y estar en orden creciente')
+        self.buckets = buckets
+        self.calls = Counter()
+        self.cells = Counter()
+        self.failures = Counter()
+        self.latency = {}
+        self.__hooks = []
+        self.__nested = local()
+
+    def add_hook(self, hook) -> None:
+        """Registra `hook`, que se llama con un `Event` en cada medición."""
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook) -> None:
+        """Quita un hook registrado con `add_hook`.
+
+        :raise ValueError: Si `hook` no está registrado.
+        """
+        self.__hooks.remove(hook)
+
+    def record(self, method: str, direction, cells: int, seconds: float, error: BaseException = None) -> None:
+        """Registra una llamada a `method` en la dirección `direction` y la entrega a los hooks."""
+        key = (method, direction)
+        self.calls[key] += 1
+        self.cells[key] += cells
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram(self.buckets)
+        histogram.observe(seconds)
+        if error is not None:
+            self.failures[(method, direction, cause(error))] += 1
+        for hook in self.__hooks:
+            hook(Event(method, direction, cells, seconds, error))
+
+    def reset(self) -> None:
+        """Descarta todas las mediciones. Los hooks se conservan."""
+        self.calls.clear()
+        self.cells.clear()
+        self.failures.clear()
+        self.latency.clear()
+
+    def snapshot(self) -> dict:
+        """Devuelve las mediciones en un diccionario que se puede serializar en JSON.
+
+        :return: Un diccionario con las llaves:
+            * operations: Lista con un diccionario por método y dirección con las llaves method, direction, calls,
+              cells y latency (ver `Histogram.as_dict`).
+            * failures: Lista con un diccionario por método, dirección y causa con las llaves method, direction, cause
+              y count.
+        :rtype: dict
+        """
+        return {
+            'operations': [
+                {'method': method, 'direction': direction, 'calls': calls, 'cells': self.cells[(method, direction)],
+                 'latency': self.latency[(method, direction)].as_dict()}
+                for (method, direction), calls in self.calls.items()
+            ],
+            'failures': [
+                {'method': method, 'direction': direction, 'cause': reason, 'count': count}
+                for (method, direction, reason), count in self.failures.items()
+            ],
+        }
+
+    def wrap(self, function, method: str, direction=None, parameters=(), cells=None):
+        """Envuelve `function` para registrar cada llamada como `method`.
+
+        :param str direction: Dirección fija de `method`. Si es None, se toma de los argumentos `parameters`.
+        :param tuple parameters: Nombres de los parámetros de `function` con la dirección.
+        :param cells: Nombre del parámetro con la cantidad de celdas, o una función que la calcula a partir del
+            resultado. Si es None, se usa el largo del resultado.
+        """
+        record = self.record
+        nested = self.__nested
+        parameters = _arguments(function, parameters)
+        counter = cells if callable(cells) else None
+        cells = _arguments(function, (cells,))[0] if isinstance(cells, str) else None
+
+        def wrapper(*args, **kwargs):
+            # Las llamadas entre métodos medidos (por ejemplo, `section` llama a `section_up`) solo se registran una
+            # vez, como la llamada exterior.
+            if getattr(nested, 'active', False):
+                return function(*args, **kwargs)
+            nested.active = True
+            start = perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as error:
+                seconds = perf_counter() - start
+                record(method, label(args, kwargs), 0, seconds, error)
+                raise
+            finally:
+                nested.active = False
+            seconds = perf_counter() - start
+            if counter is not None:
+                count = counter(result)
+            elif cells is None:
+                count = len(result) if hasattr(result, '__len__') else 0
+            else:
+                count = _argument(args, kwargs, *cells) or 0
+            record(method, label(args, kwargs), count, seconds)
+            return result
+
+        def label(args, kwargs):
+            if direction is not None or not parameters:
+                return direction
+            values = [_argument(args, kwargs, *parameter) for parameter in parameters]
+            return _label(values[0] if len(values) == 1 else tuple(values))
+
+        wrapper.__wrapped__ = function
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+
+    def wrap_generator(self, function, method: str, direction=None):
+        """Envuelve un método que devuelve un generador de posiciones para registrar cada recorrido como `method`.
+
+        La latencia es el tiempo que pasa dentro del generador, sin contar el del código que lo consume, y se
+        registra al agotarlo o al descartarlo. Un generador agotado sin posiciones se registra como un fallo por
+        `TableSectionError`, ya que `TableSection` no genera posiciones cuando la selección no se puede realizar.
+        """
+        record = self.record
+
+        def wrapper(*args, **kwargs):
+            generator = function(*args, **kwargs)
+            cells = 0
+            seconds = 0.0
+            error = None
+            try:
+                while True:
+                    start = perf_counter()
+                    try:
+                        position = next(generator)
+                    except StopIteration:
+                        if not cells:
+                            error = TableSectionError(message='Limites excedidos.')
+                        break
+                    finally:
+                        seconds += perf_counter() - start
+                    cells += 1
+                    yield position
+            finally:
+                record(method, direction, cells, seconds, error)
+
+        wrapper.__wrapped__ = function
+        wrapper.__doc__ = function.__doc__
+        return wrapper
+
+    def instrument_table(self, table) -> None:
+        """Reemplaza los métodos de `TABLE_METHODS` de la instancia `table` por envoltorios que registran en esta
+        `Metrics`."""
+        for name, (direction, parameters, cells) in TABLE_METHODS.items():
+            method = getattr(type(table), name).__get__(table)
+            setattr(table, name, self.wrap(method, name, direction, parameters, cells))
+
+    def instrument_section(self, section) -> None:
+        """Reemplaza los métodos de `SECTION_METHODS` de la instancia `section` por envoltorios que registran en esta
+        `Metrics`."""
+        for name, direction in SECTION_METHODS.items():
+            setattr(section, name, self.wrap_generator(getattr(type(section), name).__get__(section), name, direction))
+
+
+def uninstrument(instance) -> None:
+    """Quita los envoltorios instalados con `Metrics.instrument_table` o `Metrics.instrument_section`."""
+    for name in (*TABLE_METHODS, *SECTION_METHODS):
+        instance.__dict__.pop(name, None)
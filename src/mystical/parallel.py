@@ -0,0 +1,131 @@
+"""
+Ejecución en paralelo de lotes de selecciones y agregados sobre una `Table`.
+
+El contenido de la tabla se copia una sola vez en un segmento de memoria compartida (ver `mystical.shared`) y cada
+proceso del grupo se adjunta a él al arrancar, así que la tabla no se serializa en ninguna tarea: cada tarea solo
+transporta un fragmento de las consultas y devuelve su resultado por columnas. Los procesos no se crean por lote, el
+mismo grupo atiende todos los lotes hasta que se cierra.
+"""
+
+from multiprocessing import Pool, cpu_count
+
+from .batch import SectionBatch, columnar, section_many
+from .shared import SharedStorage, publish
+from .table import VECTORS, TableSectionError, _check_limits
+
+# Operaciones de agregado admitidas por `ParallelExecutor.aggregate_many`.
+OPERATIONS = ('sum', 'count', 'mean')
+
+# Fragmentos en que se divide cada lote por proceso, para repartir mejor la carga entre los procesos.
+SHARDS_PER_PROCESS = 4
+
+# Almacenamiento compartido del proceso del grupo, asignado por `_initialize`.
+_storage = None
+
+
+def _initialize(name: str) -> None:
+    global _storage
+    _storage = SharedStorage(name)
+
+
+def _sections(queries) -> SectionBatch:
+    return section_many(_storage.rows, _storage.columns, queries)
+
+
+def _aggregates(task) -> list:
+    operation, queries = task
+    storage = _storage
+    rows, columns = storage.rows, storage.columns
+    output = []
+    for direction, row, column, cell in queries:
+        try:
+            d_row, d_column = VECTORS[direction.upper()]
+            if not (isinstance(row, int) and isinstance(column, int) and isinstance(cell, int)) or \
+                    row < 0 or column < 0 or cell < 0:
+                raise TableSectionError()
+            _check_limits(rows, columns, d_row, d_column, row, column, cell)
+        except (KeyError, AttributeError, TableSectionError):
+            output.append(None)
+            continue
+        if operation == 'count':
+            output.append(cell)
+        elif operation == 'sum':
+            output.append(sum(storage.values(row, column, d_row, d_column, cell)))
+        else:
+            output.append(sum(storage.values(row, column, d_row, d_column, cell)) / cell if cell else None)
+    return output
+
+
+class ParallelExecutor:
+    """Grupo de procesos que resuelve lotes de consultas sobre una copia compartida de una tabla.
+
+    La copia se toma al crear el grupo: los cambios posteriores en la tabla no se ven en los lotes. Se debe cerrar con
+    `close` o usarse como gestor de contexto para liberar los procesos y el segmento compartido.
+    """
+
+    def __init__(self, storage, processes: int = None, shards: int = None):
+        """
+        :param storage: Motor de almacenamiento con contenido numérico.
+        :param int processes: Cantidad de procesos. Por defecto, la cantidad de núcleos.
+        :param int shards: Cantidad de fragmentos en que se divide cada lote. Por defecto, `SHARDS_PER_PROCESS` por
+            proceso.
+
+        :raise ValueError: Si el contenido no es numérico.
+        """
+        self.processes = processes or cpu_count()
+        self.shards = shards or self.processes * SHARDS_PER_PROCESS
+        self.__segment = publish(storage)
+        try:
+            self.__pool = Pool(self.processes, _initialize, (self.__segment.name,))
+        except BaseException:
+            self.__release()
+            raise
+
+    def __release(self):
+        self.__segment.close()
+        self.__segment.unlink()
+
+    def __split(self, queries) -> list:
+        queries = list(zip(*columnar(queries)))
+        size = max(1, -(-len(queries) // self.shards))
+        return [queries[start:start + size] for start in range(0, len(queries), size)]
+
+    def section_many(self, queries) -> SectionBatch:
+        """Resuelve un lote de selecciones en paralelo, con el mismo resultado que `Table.section_many`.
+
+        :param queries: Consultas en cualquiera de los formatos que admite `Table.section_many`.
+        :rtype: SectionBatch
+        """
+        return SectionBatch.concat(self.__pool.map(_sections, self.__split(queries), 1))
+
+    def aggregate_many(self, queries, operation: str = 'sum') -> list:
+        """Calcula en paralelo un agregado del contenido de cada selección de un lote.
+
+        :param queries: Consultas en cualquiera de los formatos que admite `Table.section_many`.
+        :param str operation: 'sum', 'count' o 'mean', como `section_sum`, `section_count` y `section_mean`.
+
+        :return: El agregado de cada consulta, o None si la consulta es inválida (o vacía, para 'mean').
+        :rtype: list
+
+        :raise ValueError: Si `operation` no es uno de `OPERATIONS`.
+        """
+        if operation not in OPERATIONS:
+            raise ValueError(f"operation debe ser uno de {OPERATIONS} y se paso {operation!r}")
+        output = []
+        for values in self.__pool.map(_aggregates, [(operation, shard) for shard in self.__split(queries)], 1):
+            output += values
+        return output
+
+    def close(self) -> None:
+        """Termina los procesos y libera el segmento compartido."""
+        if self.__pool is not None:
+            self.__pool.close()
+            self.__pool.join()
+            self.__pool = None
+            self.__release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,89 @@
+"""
+Representación de tablas en texto, por filas y con filas y columnas omitidas.
+
+`render` escribe la tabla en formato de cuadrícula ('grid') línea por línea en un archivo, sin construir antes el texto
+completo. Con `max_rows` y `max_cols` solo se muestran las primeras y las últimas filas y columnas, y las omitidas se
+reemplazan por una fila y una columna de `ELLIPSIS`, así que el tiempo y la memoria dependen de los límites y no del
+tamaño de la tabla.
+"""
+
+# Contenido de las celdas de la fila y la columna que reemplazan a las omitidas.
+ELLIPSIS = '...'
+
+# Filas y columnas que muestra `str(table)` como máximo. Las tablas más grandes se muestran con omisiones.
+DISPLAY_ROWS = 60
+DISPLAY_COLUMNS = 20
+
+
+def _window(count: int, limit: int) -> tuple:
+    """Devuelve los índices que se muestran de `count` filas o columnas y la posición de la marca de omisión, o None
+    si no se omite ninguna."""
+    if limit is None or count <= limit:
+        return range(count), None
+    head = (limit + 1) // 2
+    return [*range(head), *range(count - (limit - head), count)], head
+
+
+def _number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _cells(storage, rows, row_mark, columns, column_mark):
+    """Genera cada fila de la ventana como una lista de celdas, con las marcas de omisión ya insertadas."""
+    whole = len(columns) == storage.columns
+    for position, row in enumerate(rows):
+        if position == row_mark:
+            yield None
+        values = storage.get_row(row) if whole else [storage.get(row, column) for column in columns]
+        if column_mark is not None:
+            values.insert(column_mark, ELLIPSIS)
+        yield values
+    if row_mark is not None and row_mark == len(rows):
+        yield None
+
+
+def _text(value) -> str:
+    return '' if value is None else str(value)
+
+
+def render(storage, file, max_rows: int = None, max_cols: int = None) -> None:
+    """Escribe el contenido de `storage` en `file` en formato de cuadrícula, una línea a la vez.
+
+    Las columnas numéricas se alinean a la derecha y las demás a la izquierda. La tabla se recorre dos veces: la
+    primera para calcular el ancho de cada columna y la segunda para escribirla.
+
+    :param storage: Motor de almacenamiento (ver `mystical.storage`).
+    :param file: Objeto con un método `write`, por ejemplo `sys.stdout` o un archivo abierto en modo texto.
+    :param int max_rows: Cantidad máxima de filas que se muestran, o None para mostrarlas todas.
+    :param int max_cols: Cantidad máxima de columnas que se muestran, o None para mostrarlas todas.
+
+    :raise ValueError: Si `max_rows` o `max_cols` no son None ni un entero mayor que 0.
+    """
+    for name, limit in (('max_rows', max_rows), ('max_cols', max_cols)):
+        if limit is not None and (not isinstance(limit, int) or limit <= 0):
+            raise ValueError(f'{name} debe ser None o un número mayor que 0')
+    if not storage.rows or not storage.columns:
+        return
+    rows, row_mark = _window(storage.rows, max_rows)
+    columns, column_mark = _window(storage.columns, max_cols)
+    size = len(columns) + (column_mark is not None)
+    widths = [len(ELLIPSIS) if row_mark is not None else 0] * size
+    numeric = [True] * size
+    for values in _cells(storage, rows, row_mark, columns, column_mark):
+        if values is None:
+            continue
+        for column, value in enumerate(values):
+            widths[column] = max(widths[column], len(_text(value)))
+            if value is not None and value is not ELLIPSIS and not _number(value):
+                numeric[column] = False
+    if column_mark is not None:
+        numeric[column_mark] = False
+
+    border = '+' + '+'.join('-' * (width + 2) for width in widths) + '+\n'
+    ellipsis = [ELLIPSIS] * size
+    file.write(border)
+    for values in _cells(storage, rows, row_mark, columns, column_mark):
+        texts = (_text(value) for value in (ellipsis if values is None else values))
+        file.write('| ' + ' | '.join(text.rjust(width) if number else text.ljust(width)
+                                     for text, width, number in zip(texts, widths, numeric)) + ' |\n')
+        file.write(border)
@@ -0,0 +1,80 @@
+"""
+Recorrido de todas las ventanas de una longitud dada sobre una `Table`.
+
+En lugar de llamar a `Table.section` para cada celda y cada dirección, se recorre una sola vez cada línea de la tabla
+(filas, columnas, diagonales y antidiagonales), se lee su contenido una vez y se obtienen de ella todas las ventanas
+de `cell` celdas en ambos sentidos. Las ventanas de una misma línea comparten la lectura del contenido.
+"""
+
+from .table import DOWN, RIGHT, DIAGONAL_YR, DIAGONAL_XR, UP, LEFT, DIAGONAL_Y, DIAGONAL_X, TYPES, VECTORS
+
+# Cada dirección de avance y la dirección que recorre las mismas líneas en sentido contrario.
+OPPOSITES = {
+    DOWN: UP,
+    RIGHT: LEFT,
+    DIAGONAL_YR: DIAGONAL_Y,
+    DIAGONAL_XR: DIAGONAL_X
+}
+
+
+def lines(rows: int, columns: int, d_row: int, d_column: int):
+    """Genera todas las líneas de una tabla de `rows` x `columns` en la dirección (`d_row`, `d_column`).
+
+    Una línea empieza en una celda cuya celda anterior en esa dirección queda fuera de la tabla y continúa hasta
+    salir de ella. Cada celda de la tabla pertenece a exactamente una línea.
+
+    :return: Un generador de tuplas `(row, column, length)` con la celda inicial y la longitud de cada línea.
+    :rtype: generator
+    """
+    starts = set()
+    if d_row:
+        edge = 0 if d_row > 0 else rows - 1
+        starts.update((edge, c) for c in range(columns))
+    if d_column:
+        edge = 0 if d_column > 0 else columns - 1
+        starts.update((r, edge) for r in range(rows))
+    for row, column in sorted(starts):
+        length = min(
+            (rows - row if d_row > 0 else row + 1) if d_row else rows * columns,
+            (columns - column if d_column > 0 else column + 1) if d_column else rows * columns
+        )
+        yield row, column, length
+
+
+def scan(storage, cell: int, directions=TYPES):
+    """Genera todas las ventanas válidas de `cell` celdas de la tabla en las direcciones pedidas.
+
+    Cada línea se recorre una única vez aunque se pidan las dos direcciones que la atraviesan.
+
+    :param storage: Motor de almacenamiento de la tabla (ver `mystical.storage`).
+    :param int cell: Longitud de las ventanas. Debe ser mayor que 0.
+    :param directions: Direcciones a recorrer, un subconjunto de `TYPES` sin distinguir mayúsculas.
+
+    :return: Un generador de tuplas `(direction, row, column, values)`, donde (`row`, `column`) es la primera celda
+        de la ventana, es decir, los argumentos de `Table.section(direction, row, column, cell)`, y `values` es una
+        tupla con el contenido de las celdas de la ventana.
+    :rtype: generator
+
+    :raise ValueError: Si alguna dirección no es uno de `TYPES`.
+    """
+    directions = {direction.upper() for direction in directions}
+    if not directions.issubset(TYPES):
+        raise ValueError(f'Direcciones no válidas: {sorted(directions.difference(TYPES))}')
+    rows, columns = storage.rows, storage.columns
+    for forward, backward in OPPOSITES.items():
+        want_forward, want_backward = forward in directions, backward in directions
+        if not (want_forward or want_backward):
+            continue
+        d_row, d_column = VECTORS[forward]
+        for row, column, length in lines(rows, columns, d_row, d_column):
+            if length < cell:
+                continue
+            line = tuple(storage.values(row, column, d_row, d_column, length))
+            if want_forward:
+                for i in range(length - cell + 1):
+                    yield forward, row + d_row * i, column + d_column * i, line[i:i + cell]
+            if want_backward:
+                reverse = line[::-1]
+                last = length - 1
+                for i in range(length - cell + 1):
+                    yield backward, row + d_row * (last - i), column + d_column * (last - i), reverse[i:i + cell]
@@ -0,0 +1,113 @@
+"""
+Búsqueda de secuencias de valores a lo largo de cualquier dirección de una `Table`.
+
+Con todas las secuencias buscadas se construye una sola vez un autómata de Aho-Corasick. Después, cada línea de la
+tabla (filas, columnas, diagonales y antidiagonales) se recorre una vez en cada sentido a través del autómata, por lo
+que el coste total es lineal en el tamaño de la tabla más la cantidad de coincidencias, sin importar cuántas
+secuencias se busquen.
+"""
+
+from collections import deque, namedtuple
+
+from .scan import OPPOSITES, lines
+from .table import TYPES, VECTORS
+
+Match = namedtuple('Match', ('pattern', 'direction', 'row', 'column', 'length'))
+Match.__doc__ = """Coincidencia de la secuencia `patterns[pattern]` que empieza en (`row`, `column`) en dirección
+`direction` y abarca `length` celdas, es decir, `Table.section(direction, row, column, length)`."""
+
+
+class Automaton:
+    """Autómata de Aho-Corasick sobre secuencias de valores hashables."""
+
+    def __init__(self, patterns):
+        """
+        :param patterns: Secuencias de valores a buscar. Una cadena se interpreta como una secuencia de caracteres.
+
+        :raise ValueError: Si alguna secuencia está vacía.
+        """
+        self.patterns = [tuple(pattern) for pattern in patterns]
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError(f'La secuencia {index} está vacía.')
+            state = 0
+            for value in pattern:
+                following = self.goto[state].get(value)
+                if following is None:
+                    following = len(self.goto)
+                    self.goto[state][value] = following
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = following
+            self.output[state].append(index)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for value, following in self.goto[state].items():
+                queue.append(following)
+                fail = self.fail[state]
+                while fail and value not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[following] = self.goto[fail].get(value, 0)
+                self.output[following] = self.output[following] + self.output[self.fail[following]]
+
+    def feed(self, values):
+        """Recorre `values` a través del autómata.
+
+        :return: Un generador de tuplas `(end, pattern)`: la secuencia `pattern` termina en la posición `end`.
+        :rtype: generator
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for end, value in enumerate(values):
+            while state and value not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(value, 0)
+            for pattern in output[state]:
+                yield end, pattern
+
+
+def find_sequences(storage, patterns, directions=TYPES) -> list:
+    """Busca todas las apariciones de `patterns` a lo largo de las direcciones pedidas.
+
+    :param storage: Motor de almacenamiento de la tabla (ver `mystical.storage`).
+    :param patterns: Secuencias de valores a buscar, o un `Automaton` ya construido.
+    :param directions: Direcciones a recorrer, un subconjunto de `TYPES` sin distinguir mayúsculas.
+
+    :return: Lista de `Match`, ordenada por dirección de línea y posición.
+    :rtype: list
+
+    :raise ValueError: Si alguna dirección no es uno de `TYPES` o alguna secuencia está vacía.
+    """
+    automaton = patterns if isinstance(patterns, Automaton) else Automaton(patterns)
+    lengths = [len(pattern) for pattern in automaton.patterns]
+    directions = {direction.upper() for direction in directions}
+    if not directions.issubset(TYPES):
+        raise ValueError(f'Direcciones no válidas: {sorted(directions.difference(TYPES))}')
+
+    matches = []
+    rows, columns = storage.rows, storage.columns
+    for forward, backward in OPPOSITES.items():
+        want_forward, want_backward = forward in directions, backward in directions
+        if not (want_forward or want_backward):
+            continue
+        d_row, d_column = VECTORS[forward]
+        for row, column, length in lines(rows, columns, d_row, d_column):
+            line = storage.values(row, column, d_row, d_column, length)
+            if want_forward:
+                for end, pattern in automaton.feed(line):
+                    start = end - lengths[pattern] + 1
+                    matches.append(Match(pattern, forward, row + d_row * start, column + d_column * start,
+                                         lengths[pattern]))
+            if want_backward:
+                last = length - 1
+                for end, pattern in automaton.feed(line[::-1]):
+                    start = last - (end - lengths[pattern] + 1)
+                    matches.append(Match(pattern, backward, row + d_row * start, column + d_column * start,
+                                         lengths[pattern]))
+    return matches
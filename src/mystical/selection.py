@@ -0,0 +1,152 @@
+"""
+Selecciones perezosas sobre una `Table`.
+
+Una `Selection` queda definida, igual que un `range`, por su posición inicial, el vector (fila, columna) que avanza una
+celda y la cantidad de celdas. Cada posición se calcula cuando se pide, por lo que la memoria que ocupa una selección
+es constante sin importar su longitud.
+"""
+
+from collections.abc import Sequence
+
+from .table import VECTORS, _check_limits
+
+
+class Selection(Sequence):
+    """Secuencia de solo lectura con las posiciones (fila, columna) de una selección.
+
+    Admite `len`, indexado, slicing, iteración y `in`. Para los llamadores que esperan el diccionario de los métodos
+    `section_*`, admite el acceso por las llaves 'type' y 'position' y el método `to_dict`.
+    """
+
+    __slots__ = ('__type', '__row', '__column', '__d_row', '__d_column', '__length')
+
+    def __init__(self, _type: str, start: tuple, vector: tuple, length: int):
+        """
+        :param str _type: La orientación de la selección, uno de `TYPES`.
+        :param tuple start: Posición (fila, columna) de la primera celda.
+        :param tuple vector: Desplazamiento (fila, columna) entre dos celdas consecutivas.
+        :param int length: Cantidad de celdas de la selección.
+        """
+        self.__type = _type
+        self.__row, self.__column = start
+        self.__d_row, self.__d_column = vector
+        self.__length = length
+
+    @property
+    def type(self) -> str:
+        """La orientación de la selección."""
+        return self.__type
+
+    @property
+    def vector(self) -> tuple:
+        """Desplazamiento (fila, columna) entre dos celdas consecutivas."""
+        return self.__d_row, self.__d_column
+
+    @property
+    def start(self) -> tuple:
+        """Posición de la primera celda, o () si la selección está vacía."""
+        return (self.__row, self.__column) if self.__length else ()
+
+    @property
+    def stop(self) -> tuple:
+        """Posición de la última celda, o () si la selección está vacía."""
+        return self.__position(self.__length - 1) if self.__length else ()
+
+    def __position(self, index: int) -> tuple:
+        return self.__row + self.__d_row * index, self.__column + self.__d_column * index
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key == 'type':
+                return self.__type
+            if key == 'position':
+                return list(self)
+            raise KeyError(key)
+        if isinstance(key, slice):
+            indexes = range(self.__length)[key]
+            start = self.__position(indexes.start) if indexes else (self.__row, self.__column)
+            return Selection(self.__type, start,
+                             (self.__d_row * indexes.step, self.__d_column * indexes.step), len(indexes))
+        index = range(self.__length)[key]
+        return self.__position(index)
+
+    def __iter__(self):
+        row, column = self.__row, self.__column
+        for _ in range(self.__length):
+            yield row, column
+            row += self.__d_row
+            column += self.__d_column
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def index(self, value, start=0, stop=None) -> int:
+        """Devuelve el índice de la posición `value` dentro de la selección, calculado sin recorrerla.
+
+        :raise ValueError: Si la posición no pertenece a la selección.
+        """
+        try:
+            row, column = value
+            if self.__d_row:
+                index, remainder = divmod(row - self.__row, self.__d_row)
+            elif self.__d_column:
+                index, remainder = divmod(column - self.__column, self.__d_column)
+            else:
+                index, remainder = 0, 0
+        except (TypeError, ValueError):
+            raise ValueError(f'{value!r} no pertenece a la selección') from None
+        indexes = range(self.__length)[start:stop]
+        if remainder or index not in indexes or self.__position(index) != (row, column):
+            raise ValueError(f'{value!r} no pertenece a la selección')
+        return index
+
+    def count(self, value) -> int:
+        return 1 if value in self else 0
+
+    def __contains__(self, value):
+        try:
+            self.index(value)
+        except ValueError:
+            return False
+        return True
+
+    def __eq__(self, other):
+        if isinstance(other, Selection):
+            return self.__type == other.type and len(self) == len(other) and \
+                (not len(self) or (self.start == other.start and (len(self) == 1 or self.vector == other.vector)))
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__type!r}, {(self.__row, self.__column)!r}, " \
+               f"{(self.__d_row, self.__d_column)!r}, {self.__length!r})"
+
+    def to_dict(self) -> dict:
+        """Devuelve la selección con la forma de los métodos `section_*`: {'type': ..., 'position': [...]}."""
+        return {'type': self.__type, 'position': list(self)}
+
+
+def section_selection(rows: int, columns: int, direction, row: int, column: int, cell: int,
+                      vector=None) -> Selection:
+    """Construye la selección perezosa de `cell` celdas en dirección `direction` desde (`row`, `column`).
+
+    :param int rows: Número de filas de la tabla.
+    :param int columns: Número de columnas de la tabla.
+    :param direction: Dirección de la selección, uno de `TYPES`, o el vector si la selección no tiene nombre.
+    :param int row: Fila inicial de la selección.
+    :param int column: Columna inicial de la selección.
+    :param int cell: Cantidad de celdas a seleccionar.
+    :param tuple vector: Vector (fila, columna) de la selección. Si no se pasa, se usa el de `direction`.
+    :rtype: Selection
+
+    :raise TableSectionError: Si la primera o la última celda de la selección quedan fuera de la tabla.
+    """
+    d_row, d_column = VECTORS[direction] if vector is None else vector
+    _check_limits(rows, columns, d_row, d_column, row, column, cell)
+    return Selection(direction, (row, column), (d_row, d_column), cell)
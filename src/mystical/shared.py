@@ -0,0 +1,100 @@
+"""
+Tablas en memoria compartida entre procesos (`multiprocessing.shared_memory`).
+
+Un segmento contiene la misma cabecera que el formato binario (ver `mystical.binary`) seguida de las celdas en orden
+por filas, en el orden de bytes de la plataforma. Cualquier proceso de la misma máquina puede adjuntarse al segmento
+por su nombre y leer las celdas sin copiarlas.
+"""
+
+import sys
+import weakref
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .binary import HEADER_SIZE, pack_header, unpack_header
+from .storage import ArrayStorage, to_array
+
+
+def publish(storage, name: str = None) -> SharedMemory:
+    """Copia el contenido de `storage` en un segmento de memoria compartida nuevo.
+
+    :param storage: Motor de almacenamiento con contenido numérico (ver `storage.to_array`).
+    :param str name: Nombre del segmento. Si no se pasa, se genera uno.
+
+    :return: El segmento creado. El proceso que lo crea es responsable de liberarlo con `close` y `unlink`.
+    :rtype: SharedMemory
+
+    :raise ValueError: Si el contenido no es numérico.
+    :raise FileExistsError: Si ya existe un segmento con ese nombre.
+    """
+    storage = to_array(storage)
+    source = memoryview(storage.data).cast('B')
+    segment = SharedMemory(name, create=True, size=HEADER_SIZE + max(len(source), 1))
+    segment.buf[:HEADER_SIZE] = pack_header(storage.rows, storage.columns, storage.dtype)
+    segment.buf[HEADER_SIZE:HEADER_SIZE + len(source)] = source
+    return segment
+
+
+def _attach(name: str) -> SharedMemory:
+    # Antes de Python 3.13, adjuntarse a un segmento lo registra en el resource_tracker del proceso, que lo elimina
+    # al terminar el proceso aunque no lo haya creado. Solo el proceso que crea el segmento debe eliminarlo.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return SharedMemory(name)
+    finally:
+        resource_tracker.register = register
+
+
+def _detach(data: memoryview, view: memoryview, segment: SharedMemory) -> None:
+    # Las vistas sobre el segmento se liberan antes de cerrarlo: con vistas exportadas `SharedMemory.close` lanza
+    # BufferError.
+    data.release()
+    view.release()
+    segment.close()
+
+
+class SharedStorage(ArrayStorage):
+    """Almacenamiento contiguo de solo lectura sobre un segmento de memoria compartida creado con `publish`.
+
+    Las celdas se leen directamente del segmento, sin copiarse en el proceso, así que todos los procesos adjuntos
+    comparten las mismas páginas de memoria. Escribir una celda lanza TypeError.
+    """
+
+    resizable = False
+
+    def __init__(self, name: str):
+        """
+        :param str name: Nombre del segmento.
+
+        :raise FileNotFoundError: Si no existe un segmento con ese nombre.
+        :raise ValueError: Si el segmento no contiene una tabla.
+        """
+        self.name = name
+        self.__segment = _attach(name)
+        try:
+            rows, columns, dtype, flags = unpack_header(self.__segment.buf)
+            size = rows * columns * array(dtype).itemsize
+            self.__view = self.__segment.buf[HEADER_SIZE:HEADER_SIZE + size].cast(dtype)
+        except ValueError:
+            self.__segment.close()
+            raise
+        super().__init__(rows, columns, dtype, self.__view.toreadonly())
+        # Si el almacenamiento se descarta sin `close`, se separa del segmento al recolectarse.
+        self.__finalizer = weakref.finalize(self, _detach, self.data, self.__view, self.__segment)
+
+    def close(self) -> None:
+        """Se separa del segmento. Las vistas obtenidas con `values` deben liberarse antes."""
+        if self.data is not None:
+            _detach(self.data, self.__view, self.__segment)
+            self.data = None
+            self.__finalizer.detach()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
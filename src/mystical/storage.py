@@ -0,0 +1,489 @@
+"""
+Motores de almacenamiento para el contenido de las celdas de una `Table`.
+
+Hay cuatro motores disponibles:
+
+* `ListStorage`: guarda las celdas como una lista de listas. Admite contenido arbitrario (cadenas, objetos, etc.).
+* `ArrayStorage`: guarda las celdas en un único `array.array` contiguo, en orden por filas (row-major), con un tipo
+  de dato declarado (`dtype`). Pensado para tablas numéricas grandes.
+* `SparseStorage`: guarda solo las celdas distintas del contenido de relleno (`fill`). Pensado para tablas casi
+  vacías.
+* `MmapStorage`: igual que `ArrayStorage`, pero el buffer es un archivo binario proyectado en memoria con `mmap`.
+  Pensado para tablas más grandes que la memoria disponible.
+"""
+
+import mmap
+import sys
+from array import array
+from collections import Counter
+
+from .binary import HEADER_SIZE, pack_header, unpack_header
+
+# Tipos de dato admitidos por ArrayStorage, son los códigos de tipo del módulo array.
+DTYPES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd')
+
+
+def to_array(storage, dtype: str = None):
+    """Devuelve el contenido de `storage` en un `ArrayStorage`.
+
+    Un `ArrayStorage` se devuelve tal cual. Para el resto se copia fila a fila con `dtype`, o si no se pasa, con 'q'
+    si todo el contenido es entero y 'd' en otro caso.
+
+    :raise ValueError: Si el contenido no es numérico.
+    """
+    if isinstance(storage, ArrayStorage):
+        return storage
+    for typecode in ((dtype,) if dtype else ('q', 'd')):
+        data = array(typecode)
+        try:
+            for row in range(storage.rows):
+                data.extend(storage.get_row(row))
+        except (TypeError, OverflowError):
+            continue
+        return ArrayStorage(storage.rows, storage.columns, typecode, data)
+    raise ValueError('La tabla no tiene contenido numérico.')
+
+
+def transpose(storage):
+    """Devuelve un almacenamiento nuevo, del mismo tipo que `storage`, con la tabla traspuesta: la fila c contiene la
+    columna c de `storage`, por lo que cada columna queda contigua en memoria.
+    """
+    rows, columns = storage.rows, storage.columns
+    if isinstance(storage, ArrayStorage):
+        data = array(storage.dtype)
+        for column in range(columns):
+            data.frombytes(storage.values(0, column, 1, 0, rows).tobytes())
+        return ArrayStorage(columns, rows, storage.dtype, data)
+    if isinstance(storage, SparseStorage):
+        data = {}
+        for row, cells in storage.data.items():
+            for column, value in cells.items():
+                data.setdefault(column, {})[row] = value
+        return SparseStorage(columns, rows, storage.fill, data)
+    return ListStorage([list(column) for column in zip(*storage.tolist())])
+
+
+class ListStorage:
+    """Almacena la tabla como una lista de listas, una lista por fila."""
+
+    dtype = None
+
+    def __init__(self, data):
+        """
+        :param list[list, ..., list] data: Tabla previamente construida y validada.
+        """
+        self.data = data
+
+    @classmethod
+    def filled(cls, rows: int, columns: int, fill=0):
+        """Construye un almacenamiento de `rows` x `columns` con todas las celdas iguales a `fill`."""
+        return cls([[fill] * columns for _ in range(rows)])
+
+    @property
+    def rows(self) -> int:
+        """Número de filas almacenadas."""
+        return len(self.data)
+
+    @property
+    def columns(self) -> int:
+        """Número de columnas almacenadas."""
+        return len(self.data[0]) if self.data else 0
+
+    def get(self, row: int, column: int):
+        """Devuelve el contenido de la celda (`row`, `column`)."""
+        return self.data[row][column]
+
+    def set(self, row: int, column: int, value) -> None:
+        """Establece el contenido de la celda (`row`, `column`)."""
+        self.data[row][column] = value
+
+    def get_row(self, row: int) -> list:
+        """Devuelve la fila `row`. Es la propia lista almacenada, no una copia."""
+        return self.data[row]
+
+    def get_column(self, column: int) -> list:
+        """Devuelve una lista nueva con el contenido de la columna `column`."""
+        return [row[column] for row in self.data]
+
+    def tolist(self) -> list:
+        """Devuelve la tabla como lista de listas. Es el propio contenido almacenado, no una copia."""
+        return self.data
+
+    def values(self, row: int, column: int, d_row: int, d_column: int, cell: int) -> list:
+        """Devuelve una lista nueva con el contenido de `cell` celdas desde (`row`, `column`), avanzando
+        (`d_row`, `d_column`) en cada paso. La selección debe estar dentro de la tabla.
+        """
+        data = self.data
+        return [data[row + d_row * i][column + d_column * i] for i in range(cell)]
+
+    def insert_row(self, index: int, values) -> None:
+        """Inserta una fila antes de la fila `index`; con `index` igual a `rows` la añade al final en tiempo
+        amortizado constante.
+        """
+        self.data.insert(index, list(values))
+
+    def insert_column(self, index: int, values) -> None:
+        """Inserta una columna antes de la columna `index`; con `index` igual a `columns` la añade al final."""
+        for row, value in zip(self.data, values):
+            row.insert(index, value)
+
+    def resize(self, rows: int, columns: int, fill=0) -> None:
+        """Cambia las dimensiones conservando las celdas que siguen dentro de la tabla. Las nuevas contienen `fill`."""
+        data = self.data
+        del data[rows:]
+        for row in data:
+            del row[columns:]
+            row.extend([fill] * (columns - len(row)))
+        data.extend([fill] * columns for _ in range(rows - len(data)))
+
+
+class ArrayStorage:
+    """Almacena la tabla en un único `array.array` en orden por filas (row-major).
+
+    La celda (r, c) se encuentra en la posición `r * columns + c` del buffer, por lo que el acceso a una celda es una
+    sola operación de indexado, sin pasar por un objeto fila intermedio.
+    """
+
+    # False si el buffer es una proyección o un segmento compartido, que no se pueden redimensionar.
+    resizable = True
+
+    def __init__(self, rows: int, columns: int, dtype: str, data=None):
+        """
+        :param int rows: Número de filas.
+        :param int columns: Número de columnas.
+        :param str dtype: Código de tipo del módulo array, por ejemplo 'i', 'q' o 'd'.
+        :param data: Buffer con `rows * columns` celdas en orden por filas. Si no se pasa, se llena con 0.
+
+        :raise ValueError: Si `dtype` no es un tipo admitido o `data` no tiene el tamaño esperado.
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype debe ser uno de {DTYPES} y se paso {dtype!r}")
+        self.rows = rows
+        self.columns = columns
+        self.dtype = dtype
+        if data is None:
+            data = array(dtype, [0]) * (rows * columns)
+        if len(data) != rows * columns:
+            raise ValueError(f"se esperaban {rows * columns} celdas y se pasaron {len(data)}")
+        self.data = data
+
+    @classmethod
+    def filled(cls, rows: int, columns: int, fill=0, dtype: str = 'q'):
+        """Construye un almacenamiento de `rows` x `columns` con todas las celdas iguales a `fill`.
+        Un `fill` igual a None se interpreta como 0, ya que el buffer solo admite números.
+        """
+        if not fill:
+            return cls(rows, columns, dtype)
+        return cls(rows, columns, dtype, array(dtype, [fill]) * (rows * columns))
+
+    @classmethod
+    def from_rows(cls, value, dtype: str = 'q'):
+        """Copia una lista de listas, ya validada, en un buffer contiguo."""
+        data = array(dtype)
+        for row in value:
+            data.extend(row)
+        return cls(len(value), len(value[0]), dtype, data)
+
+    def get(self, row: int, column: int):
+        """Devuelve el contenido de la celda (`row`, `column`)."""
+        return self.data[row * self.columns + column]
+
+    def set(self, row: int, column: int, value) -> None:
+        """Establece el contenido de la celda (`row`, `column`)."""
+        self.data[row * self.columns + column] = value
+
+    def get_row(self, row: int) -> list:
+        """Devuelve una lista nueva con el contenido de la fila `row`."""
+        start = row * self.columns
+        return self.data[start:start + self.columns].tolist()
+
+    def get_column(self, column: int) -> list:
+        """Devuelve una lista nueva con el contenido de la columna `column`."""
+        return self.data[column::self.columns].tolist()
+
+    def tolist(self) -> list:
+        """Devuelve una copia de la tabla como lista de listas."""
+        return [self.get_row(r) for r in range(self.rows)]
+
+    def values(self, row: int, column: int, d_row: int, d_column: int, cell: int) -> memoryview:
+        """Devuelve una vista de solo lectura, sin copia, del contenido de `cell` celdas desde (`row`, `column`),
+        avanzando (`d_row`, `d_column`) en cada paso. La selección debe estar dentro de la tabla.
+
+        En orden por filas avanzar (`d_row`, `d_column`) equivale a avanzar `d_row * columns + d_column` posiciones en
+        el buffer, por lo que la selección es un slice con paso del buffer. La vista es de solo lectura porque una
+        escritura a través de ella no pasaría por `Table.set` y dejaría desactualizados los índices de la tabla.
+        """
+        start = row * self.columns + column
+        step = d_row * self.columns + d_column
+        view = memoryview(self.data).toreadonly()
+        if not step:
+            # Con una sola columna la antidiagonal no avanza en el buffer; la selección tiene a lo sumo una celda.
+            return view[start:start + cell]
+        stop = start + step * cell
+        return view[start:stop if stop >= 0 else None:step]
+
+    def __resizable(self) -> array:
+        if not isinstance(self.data, array):
+            if not self.resizable:
+                raise ValueError('El almacenamiento no se puede redimensionar: su buffer tiene tamaño fijo.')
+            # Un buffer ajeno (por ejemplo, recibido con pickle sin copiarse) se copia en un array la primera vez que
+            # cambia de tamaño; desde entonces las escrituras ya no llegan al buffer original.
+            data = array(self.dtype)
+            data.frombytes(memoryview(self.data).cast('B'))
+            self.data = data
+        return self.data
+
+    def insert_row(self, index: int, values) -> None:
+        """Inserta una fila antes de la fila `index`.
+
+        Con `index` igual a `rows` la fila se añade al final del buffer, que reserva capacidad de más al crecer, así
+        que añadir filas cuesta O(columns) amortizado. Insertar en otra posición desplaza las filas siguientes.
+        Mientras exista una vista de `values` el buffer no se puede redimensionar (BufferError).
+        """
+        data = self.__resizable()
+        values = array(self.dtype, values)
+        if index == self.rows:
+            data.extend(values)
+        else:
+            start = index * self.columns
+            data[start:start] = values
+        self.rows += 1
+
+    def insert_column(self, index: int, values) -> None:
+        """Inserta una columna antes de la columna `index`. En orden por filas cada fila se desplaza, así que cuesta
+        lo mismo que copiar la tabla.
+        """
+        data = self.__resizable()
+        values = array(self.dtype, values)
+        columns = self.columns
+        output = array(self.dtype)
+        for row in range(self.rows):
+            start = row * columns
+            output.extend(data[start:start + index])
+            output.append(values[row])
+            output.extend(data[start + index:start + columns])
+        self.data = output
+        self.columns += 1
+
+    def resize(self, rows: int, columns: int, fill=0) -> None:
+        """Cambia las dimensiones conservando las celdas que siguen dentro de la tabla. Las nuevas contienen `fill`,
+        o 0 si `fill` es None. Si solo cambia el número de filas, el buffer se recorta o crece por el final.
+        """
+        data = self.__resizable()
+        fill = fill or 0
+        if columns == self.columns:
+            del data[rows * columns:]
+            data.extend(array(self.dtype, [fill]) * (rows * columns - len(data)))
+        else:
+            kept = min(columns, self.columns)
+            padding = array(self.dtype, [fill]) * (columns - kept)
+            output = array(self.dtype)
+            for row in range(min(rows, self.rows)):
+                start = row * self.columns
+                output.extend(data[start:start + kept])
+                output.extend(padding)
+            output.extend(array(self.dtype, [fill]) * (rows * columns - len(output)))
+            self.data = output
+        self.rows = rows
+        self.columns = columns
+
+
+class SparseStorage:
+    """Almacena solo las celdas cuyo contenido es distinto de `fill`; el resto contiene `fill` de forma implícita.
+
+    Las celdas se guardan en un diccionario por fila, `{fila: {columna: contenido}}`, por lo que la memoria y el
+    coste de construcción dependen de la cantidad de celdas distintas de `fill` y no del área de la tabla.
+    """
+
+    dtype = None
+
+    def __init__(self, rows: int, columns: int, fill=0, data=None):
+        """
+        :param int rows: Número de filas.
+        :param int columns: Número de columnas.
+        :param fill: Contenido implícito de las celdas no almacenadas.
+        :param dict data: Celdas almacenadas, `{fila: {columna: contenido}}`, sin filas vacías.
+        """
+        self.rows = rows
+        self.columns = columns
+        self.fill = fill
+        self.data = {} if data is None else data
+
+    @classmethod
+    def filled(cls, rows: int, columns: int, fill=0):
+        """Construye un almacenamiento de `rows` x `columns` con todas las celdas iguales a `fill`, en tiempo
+        constante.
+        """
+        return cls(rows, columns, fill)
+
+    @classmethod
+    def from_rows(cls, value):
+        """Convierte una lista de listas, ya validada. Se usa como `fill` el contenido más frecuente de la tabla, que
+        es el que deja menos celdas almacenadas.
+        """
+        try:
+            fill = Counter(cell for row in value for cell in row).most_common(1)[0][0]
+        except TypeError:
+            fill = None
+        data = {}
+        for r, row in enumerate(value):
+            cells = {c: cell for c, cell in enumerate(row) if cell != fill}
+            if cells:
+                data[r] = cells
+        return cls(len(value), len(value[0]), fill, data)
+
+    @property
+    def stored(self) -> int:
+        """Cantidad de celdas almacenadas explícitamente."""
+        return sum(len(cells) for cells in self.data.values())
+
+    def get(self, row: int, column: int):
+        """Devuelve el contenido de la celda (`row`, `column`)."""
+        cells = self.data.get(row)
+        return self.fill if cells is None else cells.get(column, self.fill)
+
+    def set(self, row: int, column: int, value) -> None:
+        """Establece el contenido de la celda (`row`, `column`). Asignar `fill` libera la celda."""
+        if value == self.fill:
+            cells = self.data.get(row)
+            if cells is not None:
+                cells.pop(column, None)
+                if not cells:
+                    del self.data[row]
+        else:
+            self.data.setdefault(row, {})[column] = value
+
+    def get_row(self, row: int) -> list:
+        """Devuelve una lista nueva con el contenido de la fila `row`."""
+        output = [self.fill] * self.columns
+        for column, value in self.data.get(row, {}).items():
+            output[column] = value
+        return output
+
+    def get_column(self, column: int) -> list:
+        """Devuelve una lista nueva con el contenido de la columna `column`."""
+        output = [self.fill] * self.rows
+        for row, cells in self.data.items():
+            if column in cells:
+                output[row] = cells[column]
+        return output
+
+    def tolist(self) -> list:
+        """Devuelve una copia de la tabla como lista de listas."""
+        return [self.get_row(r) for r in range(self.rows)]
+
+    def values(self, row: int, column: int, d_row: int, d_column: int, cell: int) -> list:
+        """Devuelve una lista nueva con el contenido de `cell` celdas desde (`row`, `column`), avanzando
+        (`d_row`, `d_column`) en cada paso. La selección debe estar dentro de la tabla.
+        """
+        get = self.get
+        return [get(row + d_row * i, column + d_column * i) for i in range(cell)]
+
+    def insert_row(self, index: int, values) -> None:
+        """Inserta una fila antes de la fila `index`. Las filas siguientes se renumeran, recorriendo solo las filas
+        almacenadas.
+        """
+        if index < self.rows:
+            self.data = {row + 1 if row >= index else row: cells for row, cells in self.data.items()}
+        cells = {column: value for column, value in enumerate(values) if value != self.fill}
+        if cells:
+            self.data[index] = cells
+        self.rows += 1
+
+    def insert_column(self, index: int, values) -> None:
+        """Inserta una columna antes de la columna `index`, recorriendo solo las celdas almacenadas."""
+        if index < self.columns:
+            for row, cells in self.data.items():
+                self.data[row] = {column + 1 if column >= index else column: value for column, value in cells.items()}
+        self.columns += 1
+        for row, value in enumerate(values):
+            if value != self.fill:
+                self.data.setdefault(row, {})[index] = value
+
+    def resize(self, rows: int, columns: int, fill=None) -> None:
+        """Cambia las dimensiones descartando las celdas almacenadas que quedan fuera de la tabla. Las nuevas celdas
+        contienen el relleno del almacenamiento; `fill` se ignora.
+        """
+        data = {}
+        for row, cells in self.data.items():
+            if row < rows:
+                cells = {column: value for column, value in cells.items() if column < columns}
+                if cells:
+                    data[row] = cells
+        self.data = data
+        self.rows = rows
+        self.columns = columns
+
+
+class MmapStorage(ArrayStorage):
+    """Almacena la tabla en un archivo binario (ver `mystical.binary`) proyectado en memoria con `mmap`.
+
+    Las celdas se leen y escriben directamente sobre la proyección, así que el sistema operativo solo carga en memoria
+    las páginas que toca cada operación.
+    """
+
+    MODES = ('r', 'r+')
+    resizable = False
+
+    def __init__(self, path, mode: str = 'r'):
+        """
+        :param path: Ruta del archivo.
+        :param str mode: 'r' para solo lectura o 'r+' para lectura y escritura. Las escrituras llegan al archivo.
+
+        :raise ValueError: Si el modo no es válido, el archivo no contiene una tabla o la plataforma no es
+            little-endian.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"mode debe ser uno de {self.MODES} y se paso {mode!r}")
+        if sys.byteorder != 'little':
+            raise ValueError('La proyección en memoria solo está disponible en plataformas little-endian.')
+        self.path = path
+        self.mode = mode
+        with open(path, 'rb' if mode == 'r' else 'r+b') as file:
+            self.__mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ if mode == 'r' else mmap.ACCESS_WRITE)
+        try:
+            rows, columns, dtype, flags = unpack_header(self.__mmap)
+            if flags:
+                raise ValueError('El archivo no se puede proyectar en memoria: el contenido está comprimido.')
+            size = rows * columns * array(dtype).itemsize
+            if len(self.__mmap) < HEADER_SIZE + size:
+                raise ValueError('El archivo no contiene una tabla: contenido incompleto.')
+            data = memoryview(self.__mmap)[HEADER_SIZE:HEADER_SIZE + size].cast(dtype)
+        except ValueError:
+            self.__mmap.close()
+            raise
+        super().__init__(rows, columns, dtype, data)
+
+    @classmethod
+    def create(cls, path, rows: int, columns: int, dtype: str = 'q', fill=0):
+        """Crea el archivo de una tabla de `rows` x `columns` con todas las celdas iguales a `fill` y lo abre en modo
+        'r+'. Con `fill` igual a 0 el archivo se extiende sin escribir las celdas.
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype debe ser uno de {DTYPES} y se paso {dtype!r}")
+        with open(path, 'wb') as file:
+            file.write(pack_header(rows, columns, dtype))
+            file.truncate(HEADER_SIZE + rows * columns * array(dtype).itemsize)
+        storage = cls(path, 'r+')
+        if fill:
+            chunk = array(dtype, [fill]) * max(1, min(rows * columns, 1 << 16))
+            for start in range(0, rows * columns, len(chunk)):
+                stop = min(start + len(chunk), rows * columns)
+                storage.data[start:stop] = chunk[:stop - start]
+        return storage
+
+    def flush(self) -> None:
+        """Escribe en el archivo los cambios pendientes de la proyección."""
+        self.__mmap.flush()
+
+    def close(self) -> None:
+        """Cierra la proyección. Las vistas obtenidas con `values` deben liberarse antes."""
+        if not self.__mmap.closed:
+            self.data.release()
+            self.__mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
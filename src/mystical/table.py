@@ -1,5 +1,7 @@
-from tabulate import tabulate
-from random import randrange
+from array import array
+from itertools import repeat
+
+from .storage import ListStorage, ArrayStorage, SparseStorage, MmapStorage, to_array, transpose
 
 TYPES = ('UP', 'DOWN', 'RIGHT', 'LEFT', 'DIAGONAL-X', 'DIAGONAL-Y', 'DIAGONAL-XR', 'DIAGONAL-YR')
 UP = 'UP'
@@ -11,6 +13,21 @@ DIAGONAL_Y = 'DIAGONAL-Y'
 DIAGONAL_XR = 'DIAGONAL-XR'
 DIAGONAL_YR = 'DIAGONAL-YR'
 
+# Vector (fila, columna) que avanza una celda en cada dirección de selección.
+VECTORS = {
+    UP: (-1, 0),
+    DOWN: (1, 0),
+    RIGHT: (0, 1),
+    LEFT: (0, -1),
+    DIAGONAL_X: (-1, 1),
+    DIAGONAL_Y: (-1, -1),
+    DIAGONAL_XR: (1, -1),
+    DIAGONAL_YR: (1, 1)
+}
+
+# Modos de ejecución de las selecciones.
+ENGINES = ('python', 'numpy', 'lazy')
+
 
 class AnyError(Exception):
     """BaseError class for all Exceptions of type Tabla"""
@@ -42,6 +59,49 @@ class TableStructureError(AnyError):
         return self.msg
 
 
+def _check_limits(rows: int, columns: int, d_row: int, d_column: int, row: int, column: int, cell: int) -> None:
+    """Comprueba de forma analítica que la primera y la última celda de una selección estén dentro de la tabla.
+
+    :raise TableSectionError: Si alguna de las dos queda fuera de la tabla.
+    """
+    if cell:
+        stop = (row + d_row * (cell - 1), column + d_column * (cell - 1))
+        if not (0 <= row < rows and 0 <= column < columns and 0 <= stop[0] < rows and 0 <= stop[1] < columns):
+            raise TableSectionError((row, column), stop, 'Limites excedidos.')
+
+
+def _steps(start: int, step: int, count: int):
+    """Devuelve `count` índices desde `start` avanzando `step`."""
+    return range(start, start + step * count, step) if step else repeat(start, count)
+
+
+def _section_positions(rows: int, columns: int, _type, row: int, column: int, cell: int, vector=None) -> dict:
+    """Motor de selección del modo 'python': calcula la lista de posiciones de una selección sobre una tabla de
+    `rows` x `columns`.
+
+    La selección queda definida por la celda inicial, el vector (fila, columna) que avanza una celda y la cantidad de
+    celdas, así que cualquier dirección usa el mismo cálculo y los límites se comprueban de forma analítica.
+
+    :param _type: La orientación de la selección, uno de `TYPES`, o el vector si la selección no tiene nombre.
+    :param tuple vector: Vector (fila, columna) de la selección. Si no se pasa, se usa el de `_type`.
+
+    :raise TableSectionError: Si la primera o la última celda de la selección quedan fuera de la tabla.
+    """
+    d_row, d_column = VECTORS[_type] if vector is None else vector
+    # Mismo cálculo que `_check_limits`, escrito aquí porque es el camino más usado y las selecciones suelen ser cortas.
+    if cell:
+        last_row = row + d_row * (cell - 1)
+        last_column = column + d_column * (cell - 1)
+        if not (0 <= row < rows and 0 <= column < columns and 0 <= last_row < rows and 0 <= last_column < columns):
+            raise TableSectionError((row, column), (last_row, last_column), 'Limites excedidos.')
+    position = []
+    for _ in range(cell):
+        position.append((row, column))
+        row += d_row
+        column += d_column
+    return {'type': _type, 'position': position}
+
+
 class Table:
     """Permita la creación y manipulación de tablas.
 
@@ -61,6 +121,22 @@ class Table:
         `fill`, para pasar el contenido que desea que tengan las celdas inicialmente.
         `row`: para pasar el número de filas que debe tener la tabla.
         `column`: para pasar el número de columnas que debe tener la tabla.
+        `dtype`: código de tipo del módulo array ('i', 'q', 'd', ...). Si se pasa, las celdas se almacenan en un único
+        buffer contiguo en orden por filas en lugar de una lista de listas. Solo admite contenido numérico. Se puede
+        combinar tanto con *args como con **kwargs.
+        `sparse`: si es True, solo se almacenan las celdas distintas del contenido de relleno, que queda implícito en
+        las demás. Construir una tabla de `row` x `column` cuesta tiempo constante. Al pasar una tabla previamente
+        construida, se usa como relleno su contenido más frecuente. No se puede combinar con `dtype`.
+        `engine`: modo de ejecución de las selecciones, 'python' (por defecto), 'numpy' o 'lazy'. Con 'numpy' los
+        métodos `section_*` calculan la selección como dos arreglos de índices y devuelven un `SectionArrays`. Con
+        'lazy' devuelven una `Selection`, que calcula cada posición cuando se pide y ocupa memoria constante. Ambos
+        siguen admitiendo las llaves 'type' y 'position'. Se puede combinar tanto con *args como con **kwargs.
+        `cache`: cantidad máxima de resultados de `section` que se guardan en una caché LRU, 0 (por defecto) para no
+        usar caché. Se puede combinar tanto con *args como con **kwargs.
+        `column_major`: si es True, se mantiene además una copia traspuesta de la tabla en la que cada columna es
+        contigua, para leer columnas sin recorrer todas las filas. Se puede combinar tanto con *args como con **kwargs.
+        `metrics`: una `Metrics` (ver `mystical.instrument`) o True para crear una, para medir las selecciones y
+        lecturas de la tabla (ver la propiedad `metrics`). Se puede combinar tanto con *args como con **kwargs.
 
     Restricciones:
         * El paso de parámetros de forma arbitraria solo se permite mediante *args o **kwargs, no se puede usar ambos
@@ -70,18 +146,118 @@ class Table:
         pasada, las claves row y column pasa a ser obligatorias. La clave fill es opcional, sino se provee, se usa su
         valor por defecto que es 0.
 
-    :raise ValueError: Si se pasa parámetros por *args y **kwargs.
+    :raise ValueError: Si se pasa parámetros por *args y **kwargs, o `sparse` junto con `dtype`.
     :raise KeyError: Si se omite la clave table y no se pasa la clave row y column en su sustitución.
         """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, dtype=None, sparse=False, engine='python', cache=0, column_major=False, metrics=None,
+                 **kwargs):
+        if sparse and dtype is not None:
+            raise ValueError('No se permite usar sparse y dtype de forma simultanea.')
         self.__row = 0
         self.__column = 0
         self.__fill = 0
         self.__type = TYPES
-        self.__table = None
+        self.__dtype = dtype
+        self.__sparse = bool(sparse)
+        self.__storage = None
+        self.__engine = None
+        self.__engine_section = None
+        self.__prefix = None
+        self.__area = None
+        self.__cache = None
+        self.__column_major = bool(column_major)
+        self.__mirror = None
+        self.__dirty = {}
+        self.__metrics = None
+        self.engine = engine
+        self.cache = cache
+        self.metrics = metrics
         self.__make(*args, **kwargs)
 
+    # Documentado
+    @classmethod
+    def from_storage(cls, storage, engine='python'):
+        """Construye una tabla sobre un motor de almacenamiento ya existente, sin copiar su contenido.
+
+        :param storage: Motor de almacenamiento (ver `mystical.storage`).
+        :param str engine: Modo de ejecución de las selecciones, uno de `ENGINES`.
+
+        :return: La tabla que usa `storage`.
+        :rtype: Table
+        """
+        output = cls(engine=engine)
+        output.__storage = storage
+        output.__row = storage.rows
+        output.__column = storage.columns
+        output.__dtype = storage.dtype
+        output.__sparse = isinstance(storage, SparseStorage)
+        output.__fill = storage.fill if output.__sparse else None
+        return output
+
+    # Documentado
+    @classmethod
+    def open(cls, path, mode: str = 'r', engine='python'):
+        """Abre una tabla guardada en un archivo binario proyectándolo en memoria con `mmap`.
+
+        `get_row`, `get_column`, `section_values` y los agregados leen directamente de la proyección, por lo que el
+        sistema operativo solo carga las páginas que toca cada operación y la tabla puede ser mayor que la memoria.
+        Los setters `table`, `row` y `column` reemplazan el contenido por una tabla en memoria. Para cerrar el
+        archivo se usa `table.storage.close()`.
+
+        :param path: Ruta del archivo, con el formato de `mystical.binary`.
+        :param str mode: 'r' para solo lectura o 'r+' para lectura y escritura.
+        :param str engine: Modo de ejecución de las selecciones, uno de `ENGINES`.
+
+        :return: La tabla proyectada.
+        :rtype: Table
+
+        :raise ValueError: Si el modo no es válido o el archivo no contiene una tabla.
+        """
+        return cls.from_storage(MmapStorage(path, mode), engine)
+
+    # Documentado
+    def to_shared(self, name: str = None):
+        """Publica una copia de la tabla en un segmento de memoria compartida con nombre, para que otros procesos de
+        la misma máquina la usen con `attach` sin tener cada uno su propia copia.
+
+        El proceso que publica la tabla es el responsable del segmento: cuando ningún proceso lo necesite, se libera
+        con `segment.close()` y `segment.unlink()`. Los cambios posteriores en la tabla no llegan al segmento.
+
+        :param str name: Nombre del segmento. Si no se pasa, se genera uno, disponible en `segment.name`.
+
+        :return: El segmento creado (ver `mystical.shared`).
+        :rtype: multiprocessing.shared_memory.SharedMemory
+
+        :raise ValueError: Si la tabla no tiene contenido numérico.
+        :raise FileExistsError: Si ya existe un segmento con ese nombre.
+        """
+        from .shared import publish
+
+        return publish(self.__storage, name)
+
+    # Documentado
+    @classmethod
+    def attach(cls, name: str, engine='python'):
+        """Se adjunta a una tabla publicada con `to_shared`, sin copiar su contenido.
+
+        La tabla es de solo lectura: las celdas se leen directamente del segmento compartido, por lo que la memoria
+        residente no crece con la cantidad de procesos adjuntos. Para separarse del segmento se usa
+        `table.storage.close()`.
+
+        :param str name: Nombre del segmento.
+        :param str engine: Modo de ejecución de las selecciones, uno de `ENGINES`.
+
+        :return: La tabla adjunta.
+        :rtype: Table
+
+        :raise FileNotFoundError: Si no existe un segmento con ese nombre.
+        :raise ValueError: Si el segmento no contiene una tabla.
+        """
+        from .shared import SharedStorage
+
+        return cls.from_storage(SharedStorage(name), engine)
+
     def __make(self, *args, **kwargs):
         if args and kwargs:
             raise ValueError('No se permite el paso de parámetros por *args y **kwargs de forma simultanea.')
@@ -91,12 +267,12 @@ class Table:
                 self.__fill = args[2]
                 self.row = args[0]
                 self.column = args[1]
-                self.__table = [[self.__fill] * self.column for _ in range(self.row)]
+                self.__storage = self.__new_storage()
 
             elif len(args) == 2:
                 self.row = args[0]
                 self.column = args[1]
-                self.__table = [[self.__fill] * self.column for _ in range(self.row)]
+                self.__storage = self.__new_storage()
 
             elif len(args) == 1:
                 self.table = args[0]
@@ -121,14 +297,147 @@ class Table:
                 except KeyError:
                     raise KeyError(f'Numero de columnas no establecido')
 
-                self.__table = [[self.__fill] * self.column for _ in range(self.row)]
+                self.__storage = self.__new_storage()
+
+    def __new_storage(self):
+        if self.__sparse:
+            return SparseStorage.filled(self.row, self.column, self.fill)
+        if self.__dtype is None:
+            return ListStorage.filled(self.row, self.column, self.fill)
+        return ArrayStorage.filled(self.row, self.column, self.fill, self.__dtype)
 
     def __str__(self):
-        return tabulate(self.__table, tablefmt="grid")
+        from .render import DISPLAY_COLUMNS, DISPLAY_ROWS
+
+        if self.row <= DISPLAY_ROWS and self.column <= DISPLAY_COLUMNS:
+            from tabulate import tabulate
+            return tabulate(self.table, tablefmt="grid")
+        from io import StringIO
+
+        output = StringIO()
+        self.render(output, DISPLAY_ROWS, DISPLAY_COLUMNS)
+        return output.getvalue().rstrip('\n')
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.row}, {self.column}, {self.fill})"
 
+    def __getstate__(self):
+        # Los métodos instrumentados son atributos de la instancia y los hooks pueden no ser serializables: la tabla
+        # se serializa sin instrumentación.
+        state = self.__dict__.copy()
+        if self.__metrics is not None:
+            from .instrument import TABLE_METHODS
+
+            for name in TABLE_METHODS:
+                state.pop(name, None)
+            state['_Table__metrics'] = None
+        return state
+
+    def __reduce_ex__(self, protocol):
+        # Las tablas con almacenamiento contiguo se serializan como su buffer. Con el protocolo 5 el buffer viaja como
+        # un PickleBuffer, que puede transferirse fuera de banda (buffer_callback) sin copiarse. Se conservan el modo
+        # de ejecución, el tamaño de la caché (vacía) y column_major; la instrumentación no se serializa.
+        if not isinstance(self.__storage, ArrayStorage):
+            return super().__reduce_ex__(protocol)
+        storage = self.__storage
+        if protocol >= 5:
+            from pickle import PickleBuffer
+            buffer = PickleBuffer(storage.data)
+        else:
+            buffer = memoryview(storage.data).tobytes()
+        return _rebuild, (storage.rows, storage.columns, storage.dtype, buffer, self.engine, self.cache,
+                          self.column_major)
+
+    # Documentado
+    def save(self, path, compress=False, dtype: str = None) -> None:
+        """Guarda la tabla en un archivo binario compacto (ver `mystical.binary`): una cabecera con la versión del
+        formato, las dimensiones y el dtype, seguida de un único buffer con todas las celdas.
+
+        :param path: Ruta del archivo.
+        :param compress: False para no comprimir, True para comprimir con zlib o un nivel de compresión de 0 a 9.
+            Un archivo comprimido no se puede abrir con `open`, solo cargar con `load`.
+        :param str dtype: Código de tipo con el que guardar una tabla sin almacenamiento contiguo. Si no se pasa, se
+            usa 'q' si todo el contenido es entero y 'd' en otro caso.
+
+        :raise ValueError: Si la tabla no tiene contenido numérico.
+        """
+        from . import binary
+
+        storage = to_array(self.__storage, dtype)
+        binary.write(path, storage.rows, storage.columns, storage.dtype, storage.data, compress)
+
+    # Documentado
+    @classmethod
+    def load(cls, path, engine='python'):
+        """Carga una tabla guardada con `save`. El contenido se lee en bloque directamente hacia un buffer contiguo,
+        sin trabajo por celda.
+
+        :param path: Ruta del archivo.
+        :param str engine: Modo de ejecución de las selecciones, uno de `ENGINES`.
+
+        :return: Una tabla con almacenamiento contiguo (`dtype`).
+        :rtype: Table
+
+        :raise ValueError: Si el archivo no contiene una tabla.
+        """
+        from . import binary
+
+        rows, columns, dtype, data = binary.read(path)
+        return cls.from_storage(ArrayStorage(rows, columns, dtype, data), engine)
+
+    # Documentado
+    @classmethod
+    def from_rows(cls, rows, dtype: str = None, sparse=False, fill=0, convert=None, engine='python',
+                  chunk_size: int = None):
+        """Construye una tabla a partir de un iterable de filas, sin necesidad de tenerlas todas en memoria.
+
+        Las filas se leen por bloques, se validan y convierten en cuanto llegan y se escriben directamente en el
+        almacenamiento elegido (ver `mystical.ingest`).
+
+        :param rows: Iterable de filas; cada fila es un iterable de celdas. Por ejemplo un generador.
+        :param str dtype: Código de tipo del módulo array para usar almacenamiento contiguo.
+        :param bool sparse: Si es True, se usa almacenamiento disperso con relleno `fill`.
+        :param fill: Contenido de relleno del almacenamiento disperso.
+        :param convert: Función que se aplica a cada celda antes de almacenarla, por ejemplo `int`.
+        :param str engine: Modo de ejecución de las selecciones, uno de `ENGINES`.
+        :param int chunk_size: Cantidad de filas de cada bloque. Por defecto `ingest.CHUNK_ROWS`.
+
+        :return: La tabla construida.
+        :rtype: Table
+
+        :raise ValueError: Si se pasa `sparse` junto con `dtype` o alguna celda no se puede almacenar con `dtype`.
+        :raise TableStructureError: Si no hay filas o no todas tienen la misma cantidad de celdas.
+        """
+        from . import ingest
+
+        storage = ingest.build(rows, dtype, sparse, fill, convert, chunk_size or ingest.CHUNK_ROWS)
+        return cls.from_storage(storage, engine)
+
+    # Documentado
+    @classmethod
+    def from_csv(cls, path, dtype: str = None, sparse=False, fill=0, convert=None, header=False, engine='python',
+                 chunk_size: int = None, **fmtparams):
+        """Construye una tabla leyendo un archivo CSV por bloques, igual que `from_rows`.
+
+        Si se pasa `dtype` y no `convert`, las celdas se convierten a `float` ('f' y 'd') o a `int`. Sin ninguno de
+        los dos, las celdas son cadenas.
+
+        :param path: Ruta del archivo.
+        :param bool header: Si es True, se descarta la primera fila del archivo.
+        :param fmtparams: Parámetros de formato de `csv.reader`, por ejemplo `delimiter=';'`.
+
+        :return: La tabla construida.
+        :rtype: Table
+
+        :raise ValueError: Si se pasa `sparse` junto con `dtype` o alguna celda no se puede convertir.
+        :raise TableStructureError: Si el archivo no tiene filas o no todas tienen la misma cantidad de celdas.
+        """
+        from . import ingest
+
+        storage = ingest.read_csv(path, dtype, sparse, fill, convert, header, chunk_size or ingest.CHUNK_ROWS,
+                                  **fmtparams)
+        return cls.from_storage(storage, engine)
+
     # Documentado
     def dimension(self) -> str:
         """Devuelve la dimensiones de la tabla.
@@ -159,11 +468,158 @@ class Table:
         """
         return self.__fill
 
+    # Documentado
+    @property
+    def dtype(self):
+        """Devuelve el código de tipo del almacenamiento contiguo, o None si la tabla es una lista de listas."""
+        return self.__dtype
+
+    # Documentado
+    @property
+    def engine(self) -> str:
+        """Devuelve el modo de ejecución de las selecciones, 'python', 'numpy' o 'lazy'."""
+        return self.__engine
+
+    # Documentado
+    @engine.setter
+    def engine(self, value) -> None:
+        """Establece el modo de ejecución de las selecciones.
+
+        :param str value: 'python', 'numpy' o 'lazy'.
+        :raise ValueError: Si value no es uno de `ENGINES`.
+        :raise ImportError: Si value es 'numpy' y NumPy no está instalado.
+        """
+        if value not in ENGINES:
+            raise ValueError(f"engine debe ser uno de {ENGINES} y se paso {value!r}")
+        if value == 'numpy':
+            from .vectorized import section_indices
+            self.__engine_section = section_indices
+        elif value == 'lazy':
+            from .selection import section_selection
+            self.__engine_section = section_selection
+        else:
+            self.__engine_section = _section_positions
+        self.__engine = value
+        if self.__cache is not None:
+            self.__cache.clear()
+
+    # Documentado
+    @property
+    def cache(self) -> int:
+        """Devuelve el tamaño máximo de la caché de `section`, o 0 si no se usa caché."""
+        return 0 if self.__cache is None else self.__cache.maxsize
+
+    # Documentado
+    @cache.setter
+    def cache(self, value) -> None:
+        """Activa, redimensiona o desactiva la caché LRU de resultados de `section`.
+
+        Las consultas repetidas se resuelven con una búsqueda en un diccionario. La caché se vacía al cambiar la
+        tabla con los setters `table`, `row`, `column` o `engine`, o al llamar a `invalidate`.
+
+        :param int value: Cantidad máxima de resultados almacenados, 0 para desactivar la caché. Al cambiar el
+            tamaño se descartan los resultados y los contadores.
+        :raise ValueError: Si value no es un entero mayor o igual a 0.
+        """
+        if not isinstance(value, int) or value < 0:
+            raise ValueError("cache debe ser un número y debe ser mayor o igual que 0")
+        if value == 0:
+            self.__cache = None
+        elif self.__cache is None or self.__cache.maxsize != value:
+            from .cache import SectionCache
+            self.__cache = SectionCache(value)
+
+    # Documentado
+    def cache_info(self):
+        """Devuelve las estadísticas de la caché de `section`: aciertos, fallos, descartes, tamaño y tamaño máximo.
+
+        :return: Las estadísticas, o None si no se usa caché.
+        :rtype: CacheInfo
+        """
+        return None if self.__cache is None else self.__cache.info()
+
+    # Documentado
+    @property
+    def metrics(self):
+        """Devuelve la `Metrics` que mide las operaciones de la tabla, o None si la tabla no está instrumentada."""
+        return self.__metrics
+
+    # Documentado
+    @metrics.setter
+    def metrics(self, value) -> None:
+        """Activa o desactiva la instrumentación de la tabla.
+
+        Con la instrumentación activa, cada llamada a los métodos `section_*`, `section`, `section_vector`,
+        `section_values`, `section_sum`, `section_count`, `section_mean`, `section_many`, `get_row` y `get_column`
+        registra su método, dirección, latencia y celdas producidas, y los fallos por causa (ver
+        `mystical.instrument`). Sin instrumentación los métodos no tienen ningún costo adicional.
+
+        :param value: Una `Metrics`, que se puede compartir entre tablas, True para crear una nueva, o None o False
+            para desactivar la instrumentación.
+        :raise ValueError: Si value no es una `Metrics`, un bool o None.
+        """
+        if value is False or value is None:
+            if self.__metrics is None:
+                return
+            value = None
+        from .instrument import Metrics, uninstrument
+
+        if value is True:
+            value = Metrics()
+        if value is not None and not isinstance(value, Metrics):
+            raise ValueError('metrics debe ser una Metrics, True, False o None')
+        uninstrument(self)
+        self.__metrics = value
+        if value is not None:
+            value.instrument_table(self)
+
+    # Documentado
+    @property
+    def column_major(self) -> bool:
+        """Devuelve True si la tabla mantiene un espejo por columnas (column-major) de su contenido."""
+        return self.__column_major
+
+    # Documentado
+    @column_major.setter
+    def column_major(self, value) -> None:
+        """Activa o desactiva el espejo por columnas.
+
+        Con el espejo activo, cada columna está contigua en memoria: `get_column` la lee directamente y
+        `section_values` lee las selecciones verticales (UP y DOWN) del espejo. El espejo se construye la primera vez
+        que se usa, a costa de duplicar la memoria de la tabla, y se descarta junto con los demás índices en
+        `invalidate`.
+
+        :param bool value: True para activar el espejo, False para descartarlo.
+        """
+        self.__column_major = bool(value)
+        self.__mirror = None
+
+    def __columns(self):
+        """Devuelve el espejo por columnas, construyéndolo si hace falta."""
+        if self.__mirror is None:
+            self.__mirror = transpose(self.__storage)
+        return self.__mirror
+
+    # Documentado
+    @property
+    def sparse(self) -> bool:
+        """Devuelve True si la tabla solo almacena las celdas distintas del contenido de relleno."""
+        return self.__sparse
+
+    # Documentado
+    @property
+    def storage(self):
+        """Devuelve el motor de almacenamiento de la tabla (`ListStorage`, `ArrayStorage` o `SparseStorage`)."""
+        return self.__storage
+
     # Documentado
     @property
     def table(self) -> list[[list, ..., list]]:
-        """Devuelve la tabla."""
-        return self.__table
+        """Devuelve la tabla.
+        Con almacenamiento contiguo (`dtype`) o disperso (`sparse`) devuelve una copia de la tabla como lista de
+        listas.
+        """
+        return self.__storage.tolist()
 
     # Documentado
     @table.setter
@@ -184,9 +640,15 @@ class Table:
                 if len(row) <= 0 or _row != len(row):
                     raise TableStructureError(f'Las dimensiones de la tabla no son correctas.')
 
-            self.__table = value
-            self.__row = len(self.__table)
-            self.__column = len(self.__table[0])
+            if self.__sparse:
+                self.__storage = SparseStorage.from_rows(value)
+            elif self.__dtype is None:
+                self.__storage = ListStorage(value)
+            else:
+                self.__storage = ArrayStorage.from_rows(value, self.__dtype)
+            self.invalidate()
+            self.__row = len(value)
+            self.__column = len(value[0])
             self.__fill = None
         else:
             raise TableStructureError
@@ -200,7 +662,8 @@ class Table:
         """
         if isinstance(value, int) and value > 0:
             self.__row = value
-            self.__table = [[self.fill] * self.column for _ in range(self.row)]
+            self.__storage = self.__new_storage()
+            self.invalidate()
         else:
             raise ValueError("row debe ser un numero y deber mayor que 0")
 
@@ -215,7 +678,8 @@ class Table:
         """
         if isinstance(value, int) and value > 0:
             self.__column = value
-            self.__table = [[self.fill] * self.column for _ in range(self.row)]
+            self.__storage = self.__new_storage()
+            self.invalidate()
         else:
             raise ValueError("column debe ser un número y debe ser mayor que 0")
 
@@ -247,13 +711,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[0], 'position': []}
-        for i in range(cell):
-            if 0 > row - i:
-                raise TableSectionError()
-            output['position'].append((row - i, column))
-            # output['content-cell'] += self.table[row - i][column]
-        return output
+        return self.__engine_section(self.__row, self.__column, UP, row, column, cell)
 
     # Documentado
     def section_down(self, row: int, column: int, cell: int) -> dict:
@@ -285,14 +743,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[1], 'position': []}
-        for i in range(cell):
-            try:
-                output['position'].append((row + i, column))
-                # output['content-cell'] += self.table[row + i][column]
-            except IndexError:
-                raise TableSectionError("Limites excedidos.")
-        return output
+        return self.__engine_section(self.__row, self.__column, DOWN, row, column, cell)
 
     # Documentado
     def section_right(self, row: int, column: int, cell: int) -> dict:
@@ -323,14 +774,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[2], 'position': []}
-        for i in range(cell):
-            try:
-                output['position'].append((row, column + i))
-                # output['content-cell'] += self.table[row][column + i]
-            except IndexError:
-                raise TableSectionError()
-        return output
+        return self.__engine_section(self.__row, self.__column, RIGHT, row, column, cell)
 
     # Documentado
     def section_left(self, row: int, column: int, cell: int) -> dict:
@@ -361,13 +805,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[3], 'position': []}
-        for i in range(cell):
-            if column - i < 0:
-                raise TableSectionError()
-            output['position'].append((row, column - i))
-            # output['content-cell'] += self.table[row][column - i]
-        return output
+        return self.__engine_section(self.__row, self.__column, LEFT, row, column, cell)
 
     # Documentado
     def section_diagonal_x(self, row: int, column: int, cell: int) -> dict:
@@ -398,16 +836,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[4], 'position': []}
-        for i in range(cell):
-            try:
-                if row - i < 0:
-                    raise TableSectionError("Limites excedido.")
-                output['position'].append((row - i, column + i))
-                # output['content-cell'] += self.table[row - i][column + i]
-            except IndexError:
-                raise TableSectionError()
-        return output
+        return self.__engine_section(self.__row, self.__column, DIAGONAL_X, row, column, cell)
 
     # Documentado
     def section_diagonal_y(self, row: int, column: int, cell: int) -> dict:
@@ -438,16 +867,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[5], 'position': []}
-        for i in range(cell):
-            try:
-                if row - i < 0 or column - i < 0:
-                    raise ValueError("Limites excedidos.")
-                output['position'].append((row - i, column - i))
-                # output['content-cell'] += self.table[row - i][column - i]
-            except IndexError:
-                raise TableSectionError()
-        return output
+        return self.__engine_section(self.__row, self.__column, DIAGONAL_Y, row, column, cell)
 
     # Documentado
     def section_diagonal_xr(self, row: int, column: int, cell: int) -> dict:
@@ -479,16 +899,7 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[6], 'position': []}
-        for i in range(cell):
-            try:
-                if column - i < 0:
-                    raise TableSectionError('Limites excedidos')
-                output['position'].append((row + i, column - i))
-                # output['content-cell'] += self.table[row + i][column - i]
-            except IndexError:
-                raise TableSectionError()
-        return output
+        return self.__engine_section(self.__row, self.__column, DIAGONAL_XR, row, column, cell)
 
     # Documentado
     def section_diagonal_yr(self, row: int, column: int, cell: int) -> dict:
@@ -519,14 +930,19 @@ class Table:
             raise ValueError(
                 'Los parámetros no son válidos.'
             )
-        output = {'type': self.__type[7], 'position': []}
-        for i in range(cell):
-            try:
-                output['position'].append((row + i, column + i))
-                # output['content-cell'] += self.table[row + i][column + i]
-            except IndexError:
-                raise TableSectionError()
-        return output
+        return self.__engine_section(self.__row, self.__column, DIAGONAL_YR, row, column, cell)
+
+    # Método de selección de cada dirección, para que `section` despache con una sola búsqueda.
+    __SECTIONS = {
+        UP: section_up,
+        DOWN: section_down,
+        RIGHT: section_right,
+        LEFT: section_left,
+        DIAGONAL_X: section_diagonal_x,
+        DIAGONAL_Y: section_diagonal_y,
+        DIAGONAL_XR: section_diagonal_xr,
+        DIAGONAL_YR: section_diagonal_yr,
+    }
 
     # Documentado
     @staticmethod
@@ -542,10 +958,11 @@ class Table:
             :return: True si row, column y cell son válidos, False si uno o más de los parámetros es inválido.
             :rtype: bool
         """
-        return not any([not (isinstance(value, int) and value >= 0) for value in (row, column, cell)])
+        return isinstance(row, int) and row >= 0 and isinstance(column, int) and column >= 0 and \
+            isinstance(cell, int) and cell >= 0
 
     # Documentado
-    def section(self, direction: str, row_start, column_start, cell) -> dict:
+    def section(self, direction, row_start, column_start, cell, stride: int = 1) -> dict:
         """Obtiene un sección de la tabla en cualquier dirección.
         Combina los métodos de selección de la tabla.
 
@@ -558,11 +975,14 @@ class Table:
         y `cell` al método section_diagonal_x; 'DIAGONAL-Y', paso los parámetros `row_start`, `column_start`
         y `cell` al método section_diagonal_y; 'DIAGONAL-XR', paso los parámetros `row_start`, `column_start`
         y `cell` al método section_diagonal_xr; 'DIAGONAL-YR', paso los parámetros `row_start`, `column_start`
-        y `cell` al método section_diagonal_yr.
+        y `cell` al método section_diagonal_yr. También se puede pasar un vector (fila, columna), por ejemplo
+        (2, 1) para el salto del caballo, que se pasa al método section_vector.
 
         :param int row_start: Fila inicial de la selección. Debe ser mayor o igual a 0.
         :param int column_start: Columna inicial de la selección. Debe ser mayor o igual a 0.
         :param int cell: Cantidad de celdas de la tabla a seleccionar. Debe ser mayor o igual a 0.
+        :param int stride: Cantidad de pasos en la dirección entre dos celdas seleccionadas consecutivas. Con 2 se
+            selecciona una celda sí y otra no.
 
         :return: Diccionario que contiene información de la selección. Específicamente el tipo de selección,
                 la posición y el contenido de las celdas de las posiciones seleccionadas.
@@ -577,30 +997,363 @@ class Table:
         :raise TableSectionError: si la selección es incorrecta, es decir, que en la tabla no es
          posible realizar ese tipo de selección.
         """
+        name = direction if isinstance(direction, tuple) else direction.upper()
+        cache = self.__cache
+        if cache is None or isinstance(name, tuple) and not all(type(value) is int for value in name) or \
+                not type(row_start) is type(column_start) is type(cell) is type(stride) is int:
+            return self.__section(name, row_start, column_start, cell, stride)
+        key = (name, row_start, column_start, cell, stride)
+        output = cache.get(key)
+        if output is None:
+            output = self.__section(name, row_start, column_start, cell, stride)
+            if output is None:
+                return output
+            cache.put(key, output)
+        if isinstance(output, dict):
+            # Cada llamada recibe su propia lista de posiciones, igual que sin caché.
+            return {'type': output['type'], 'position': output['position'].copy()}
+        if self.__engine == 'numpy':
+            # Los arreglos de índices son mutables: cada llamada recibe los suyos.
+            return output.copy()
+        return output
+
+    def __section(self, name, row_start, column_start, cell, stride):
+        """Despacha una selección de `section`. `name` es la dirección ya normalizada en mayúsculas o un vector."""
+        if isinstance(name, tuple):
+            return self.section_vector(*name, row_start, column_start, cell, stride)
+        if stride != 1:
+            vector = VECTORS.get(name)
+            if vector is None:
+                return None
+            return self.__section_vector(name, *vector, row_start, column_start, cell, stride)
+        method = self.__SECTIONS.get(name)
+        if method is None:
+            return None
+        return method(self, row_start, column_start, cell)
+
+    # Documentado
+    def section_vector(self, d_row: int, d_column: int, row: int, column: int, cell: int, stride: int = 1):
+        """Permite realizar una selección sobre la tabla avanzando un vector (`d_row`, `d_column`) arbitrario,
+        partiendo del punto (`row`, `column`), abarcando un rango `cell`.
+
+        Las ocho direcciones de `TYPES` son los vectores de `VECTORS`; cualquier otro vector se selecciona igual, por
+        ejemplo (2, 1) para el salto del caballo o (0, 1) con `stride` 2 para una celda sí y otra no. Los límites se
+        comprueban de forma analítica a partir de la primera y la última celda.
+
+        :param int d_row: Filas que se avanza en cada paso.
+        :param int d_column: Columnas que se avanza en cada paso.
+        :param int row: Fila inicial de la selección. Debe ser mayor o igual a 0.
+        :param int column: Columna inicial de la selección. Debe ser mayor o igual a 0.
+        :param int cell: Cantidad de celdas de la tabla a seleccionar. Debe ser mayor o igual a 0.
+        :param int stride: Cantidad de pasos entre dos celdas seleccionadas consecutivas. Debe ser mayor que 0.
+
+        :return: La selección, con la misma forma que los métodos `section_*` según `engine`. La llave 'type' es el
+            vector (`d_row`, `d_column`).
+        :rtype: dict
+
+        :raise ValueError: si self.validate(row, column, cell) retorna Falso, el vector es (0, 0) o no es entero, o
+            `stride` no es un entero mayor que 0.
+        :raise TableSectionError: si la selección sale de los límites de la tabla.
+        """
+        return self.__section_vector((d_row, d_column), d_row, d_column, row, column, cell, stride)
+
+    def __section_vector(self, _type, d_row, d_column, row, column, cell, stride):
+        if not self.validate(row, column, cell):
+            raise ValueError(
+                'Los parámetros no son válidos.'
+            )
+        if not (isinstance(d_row, int) and isinstance(d_column, int)) or not (d_row or d_column):
+            raise ValueError(f'Vector de dirección no válido: {(d_row, d_column)!r}')
+        if not isinstance(stride, int) or stride <= 0:
+            raise ValueError("stride debe ser un número y debe ser mayor que 0")
+        return self.__engine_section(self.__row, self.__column, _type, row, column, cell,
+                                     (d_row * stride, d_column * stride))
+
+    # Documentado
+    def section_values(self, direction: str, row_start: int, column_start: int, cell: int):
+        """Obtiene directamente el contenido de las celdas de una sección de la tabla.
+
+        Con almacenamiento contiguo (`dtype`) devuelve un `memoryview` de solo lectura con paso (stride) sobre el
+        buffer de la tabla, sin copiar datos: las reducciones y comparaciones sobre la selección recorren el contenido
+        una sola vez. Las celdas se modifican con `set` o `set_many`.
+        Mientras la vista exista el buffer no se puede redimensionar; se puede liberar antes con `view.release()`.
+        Con una lista de listas devuelve una lista nueva con el contenido.
+
+        :param str direction: Dirección de la selección, uno de `TYPES` sin distinguir mayúsculas.
+        :param int row_start: Fila inicial de la selección. Debe ser mayor o igual a 0.
+        :param int column_start: Columna inicial de la selección. Debe ser mayor o igual a 0.
+        :param int cell: Cantidad de celdas de la tabla a seleccionar. Debe ser mayor o igual a 0.
+
+        :return: El contenido de las celdas seleccionadas, en el orden de la selección.
+        :rtype: memoryview | list
+
+        :raise ValueError: si la dirección no es válida o self.validate(row, column, cell) retorna Falso
+        :raise TableSectionError: si la selección sale de los límites de la tabla.
+        """
+        d_row, d_column = self.__resolve(direction, row_start, column_start, cell)
+        if self.__column_major and not d_column:
+            # En el espejo la celda (r, c) es la (c, r): la selección vertical es contigua.
+            return self.__columns().values(column_start, row_start, d_column, d_row, cell)
+        return self.__storage.values(row_start, column_start, d_row, d_column, cell)
+
+    def __resolve(self, direction, row, column, cell) -> tuple:
+        """Valida una selección en cualquier dirección y devuelve su vector de dirección."""
+        try:
+            d_row, d_column = VECTORS[direction.upper()]
+        except (AttributeError, KeyError):
+            raise ValueError(f'Dirección no válida: {direction!r}') from None
+        if not self.validate(row, column, cell):
+            raise ValueError(
+                'Los parámetros no son válidos.'
+            )
+        _check_limits(self.row, self.column, d_row, d_column, row, column, cell)
+        return d_row, d_column
+
+    # Documentado
+    def section_sum(self, direction: str, row_start: int, column_start: int, cell: int):
+        """Suma el contenido numérico de una sección de la tabla en tiempo constante.
+
+        La primera vez que se agrega en una familia de direcciones (filas, columnas, diagonales o antidiagonales) se
+        construye su índice de sumas acumuladas, que se descarta cuando la tabla se reemplaza mediante los setters
+        `table`, `row` o `column` y se actualiza de forma incremental tras `set` y `set_many`. Si se modifica el
+        contenido directamente a través de `storage`, hay que llamar a `invalidate`.
+        Con `sparse` no se construye el índice, que sería denso, y la suma recorre la selección.
+
+        :param str direction: Dirección de la selección, uno de `TYPES` sin distinguir mayúsculas.
+        :param int row_start: Fila inicial de la selección. Debe ser mayor o igual a 0.
+        :param int column_start: Columna inicial de la selección. Debe ser mayor o igual a 0.
+        :param int cell: Cantidad de celdas de la tabla a seleccionar. Debe ser mayor o igual a 0.
+
+        :return: La suma del contenido de las celdas seleccionadas.
+
+        :raise ValueError: si la dirección no es válida o self.validate(row, column, cell) retorna Falso
+        :raise TableSectionError: si la selección sale de los límites de la tabla.
+        """
+        d_row, d_column = self.__resolve(direction, row_start, column_start, cell)
+        if self.__sparse:
+            # Un índice denso ocuparía el área completa de la tabla; se recorre la selección.
+            return sum(self.__storage.values(row_start, column_start, d_row, d_column, cell))
+        self.__sync()
+        if self.__prefix is None:
+            from .index import PrefixIndex
+            self.__prefix = PrefixIndex(self.__storage)
+        return self.__prefix.sum(row_start, column_start, d_row, d_column, cell)
+
+    # Documentado
+    def section_count(self, direction: str, row_start: int, column_start: int, cell: int) -> int:
+        """Cuenta las celdas de una sección de la tabla, comprobando que la sección sea válida.
+
+        :return: La cantidad de celdas seleccionadas.
+        :rtype: int
+
+        :raise ValueError: si la dirección no es válida o self.validate(row, column, cell) retorna Falso
+        :raise TableSectionError: si la selección sale de los límites de la tabla.
+        """
+        self.__resolve(direction, row_start, column_start, cell)
+        return cell
+
+    # Documentado
+    def section_mean(self, direction: str, row_start: int, column_start: int, cell: int) -> float:
+        """Calcula la media del contenido numérico de una sección de la tabla en tiempo constante.
+        Ver `section_sum`.
+
+        :return: La media del contenido de las celdas seleccionadas.
+        :rtype: float
+
+        :raise ValueError: si la dirección no es válida, self.validate(row, column, cell) retorna Falso o `cell`
+            es 0.
+        :raise TableSectionError: si la selección sale de los límites de la tabla.
+        """
+        if cell == 0:
+            raise ValueError('La media de una selección vacía no está definida.')
+        return self.section_sum(direction, row_start, column_start, cell) / cell
+
+    # Documentado
+    def invalidate(self) -> None:
+        """Descarta los índices derivados del contenido de la tabla, que se volverán a construir cuando se usen.
+        Es necesario llamarlo después de modificar el contenido directamente, por ejemplo a través de `table`.
+        También vacía la caché de `section` y descarta el espejo por columnas.
+        """
+        self.__prefix = None
+        self.__area = None
+        self.__mirror = None
+        self.__dirty = {}
+        if self.__cache is not None:
+            self.__cache.clear()
+
+    def __summed_area(self, row_start, column_start, row_stop, column_stop):
+        """Valida una región rectangular y devuelve la tabla de áreas sumadas, construyéndola si hace falta."""
+        if not (self.validate(row_start, column_start, 0) and self.validate(row_stop, column_stop, 0)):
+            raise ValueError(
+                'Los parámetros no son válidos.'
+            )
+        if not (row_start <= row_stop < self.row and column_start <= column_stop < self.column):
+            raise TableSectionError((row_start, column_start), (row_stop, column_stop), 'Región no válida.')
+        self.__sync()
+        if self.__area is None:
+            from .index import SummedAreaTable, SparseRegions
+            self.__area = (SparseRegions if self.__sparse else SummedAreaTable)(self.__storage)
+        return self.__area
+
+    # Documentado
+    def region_sum(self, row_start: int, column_start: int, row_stop: int, column_stop: int):
+        """Suma el contenido numérico de una región rectangular de la tabla en tiempo constante.
+
+        La primera vez que se usa se construye, en una sola pasada, la tabla de áreas sumadas, que se descarta
+        igual que los demás índices (ver `invalidate`). Con `sparse` se recorren solo las celdas almacenadas.
+
+        :param int row_start: Fila de la esquina superior izquierda de la región.
+        :param int column_start: Columna de la esquina superior izquierda de la región.
+        :param int row_stop: Fila de la esquina inferior derecha de la región, incluida.
+        :param int column_stop: Columna de la esquina inferior derecha de la región, incluida.
+
+        :return: La suma del contenido de las celdas de la región.
+
+        :raise ValueError: si alguna coordenada no es un número mayor o igual a 0.
+        :raise TableSectionError: si la región sale de la tabla o alguna esquina final es menor que la inicial.
+        """
+        return self.__summed_area(row_start, column_start, row_stop, column_stop).sum(
+            row_start, column_start, row_stop, column_stop)
+
+    # Documentado
+    def region_count(self, row_start: int, column_start: int, row_stop: int, column_stop: int) -> int:
+        """Cuenta las celdas de una región rectangular de la tabla. Ver `region_sum`.
+
+        :rtype: int
+        """
+        self.__summed_area(row_start, column_start, row_stop, column_stop)
+        return (row_stop - row_start + 1) * (column_stop - column_start + 1)
+
+    # Documentado
+    def region_mean(self, row_start: int, column_start: int, row_stop: int, column_stop: int) -> float:
+        """Calcula la media del contenido numérico de una región rectangular en tiempo constante. Ver `region_sum`.
+
+        :rtype: float
+        """
+        return self.region_sum(row_start, column_start, row_stop, column_stop) / \
+            self.region_count(row_start, column_start, row_stop, column_stop)
+
+    # Documentado
+    def region_variance(self, row_start: int, column_start: int, row_stop: int, column_stop: int) -> float:
+        """Calcula la varianza poblacional del contenido numérico de una región rectangular en tiempo constante.
+        La primera vez que se usa se construye también la tabla de áreas sumadas de los cuadrados. Ver `region_sum`.
+
+        :rtype: float
+        """
+        area = self.__summed_area(row_start, column_start, row_stop, column_stop)
+        count = (row_stop - row_start + 1) * (column_stop - column_start + 1)
+        total = area.sum(row_start, column_start, row_stop, column_stop)
+        squares = area.sum_squares(row_start, column_start, row_stop, column_stop)
+        # n * Σx² - (Σx)² es exacto con contenido entero y nunca es negativo salvo por redondeo.
+        return max((count * squares - total * total) / (count * count), 0.0)
+
+    # Documentado
+    def scan(self, cell: int, directions=TYPES):
+        """Recorre todas las ventanas válidas de `cell` celdas de la tabla en las direcciones pedidas.
+
+        Equivale a llamar a `section` para cada celda y cada dirección, pero recorre cada fila, columna, diagonal y
+        antidiagonal una sola vez y obtiene de ella todas sus ventanas, en ambos sentidos.
+
+        :param int cell: Longitud de las ventanas. Debe ser mayor que 0.
+        :param directions: Direcciones a recorrer, un subconjunto de `TYPES`. Por defecto todas.
+
+        :return: Un generador de tuplas `(direction, row, column, values)`. (`row`, `column`) es la primera celda de
+            la ventana y `values` es una tupla con su contenido.
+        :rtype: generator
+
+        :raise ValueError: Si `cell` no es un entero mayor que 0 o alguna dirección no es válida.
+        """
+        if not (isinstance(cell, int) and cell > 0):
+            raise ValueError('cell debe ser un número y debe ser mayor que 0')
+        from .scan import scan
+        return scan(self.__storage, cell, directions)
+
+    # Documentado
+    def find_sequences(self, patterns, directions=TYPES) -> list:
+        """Busca dónde aparecen las secuencias de valores `patterns` a lo largo de cualquier dirección de la tabla.
+
+        Construye una sola vez un autómata de Aho-Corasick con todas las secuencias y recorre cada línea de la tabla
+        a través de él, por lo que el coste es lineal en el tamaño de la tabla más la cantidad de coincidencias.
+        Una secuencia de una sola celda, o un palíndromo, aparece una vez por cada dirección en que se lee.
+
+        :param patterns: Secuencias de valores a buscar. Una cadena se interpreta como una secuencia de caracteres,
+            por ejemplo 'XPJC' en una tabla de letras.
+        :param directions: Direcciones a recorrer, un subconjunto de `TYPES`. Por defecto todas.
+
+        :return: Lista de `Match(pattern, direction, row, column, length)`, donde `pattern` es el índice de la
+            secuencia encontrada y `section(direction, row, column, length)` es la selección que la contiene.
+        :rtype: list
+
+        :raise ValueError: Si alguna secuencia está vacía o alguna dirección no es válida.
+        """
+        from .search import find_sequences
+        return find_sequences(self.__storage, patterns, directions)
+
+    # Documentado
+    def section_many(self, queries):
+        """Obtiene muchas secciones de la tabla de una sola vez.
 
-        if direction.upper() == self.__type[0]:
-            return self.section_up(row_start, column_start, cell)
+        Equivale a llamar a `section` para cada consulta, pero normaliza cada dirección distinta una sola vez, comprueba
+        los límites de forma analítica y devuelve todas las posiciones en un único resultado por columnas. Las
+        consultas inválidas no lanzan excepciones, quedan marcadas en el resultado.
+        Con `engine='numpy'` el lote completo se resuelve con operaciones sobre arreglos.
 
-        elif direction.upper() == self.__type[1]:
-            return self.section_down(row_start, column_start, cell)
+        :param queries: Un diccionario con las llaves 'direction', 'row', 'column' y 'cell', cada una con una
+            secuencia de la misma longitud, o un iterable de tuplas `(direction, row, column, cell)`.
 
-        elif direction.upper() == self.__type[2]:
-            return self.section_right(row_start, column_start, cell)
+        :return: Resultado por columnas. `result[i]` devuelve el diccionario de la consulta i, o None si es inválida;
+            `result.valid` y `result.invalid` indican qué consultas son inválidas.
+        :rtype: SectionBatch
+        """
+        if self.__engine == 'numpy':
+            from .vectorized import section_many
+        else:
+            from .batch import section_many
+        return section_many(self.row, self.column, queries)
 
-        elif direction.upper() == self.__type[3]:
-            return self.section_left(row_start, column_start, cell)
+    # Documentado
+    def parallel(self, processes: int = None, shards: int = None):
+        """Crea un grupo de procesos para resolver lotes de selecciones y agregados usando varios núcleos.
 
-        elif direction.upper() == self.__type[4]:
-            return self.section_diagonal_x(row_start, column_start, cell)
+        El contenido de la tabla se copia una sola vez en memoria compartida y los procesos lo leen de ahí, por lo que
+        no se serializa en cada tarea. Los cambios posteriores en la tabla no se ven en el grupo.
 
-        elif direction.upper() == self.__type[5]:
-            return self.section_diagonal_y(row_start, column_start, cell)
+            with my_table.parallel() as executor:
+                batch = executor.section_many(queries)
+                sums = executor.aggregate_many(queries, 'sum')
 
-        elif direction.upper() == self.__type[6]:
-            return self.section_diagonal_xr(row_start, column_start, cell)
+        :param int processes: Cantidad de procesos. Por defecto, la cantidad de núcleos.
+        :param int shards: Cantidad de fragmentos en que se divide cada lote.
 
-        elif direction.upper() == self.__type[7]:
-            return self.section_diagonal_yr(row_start, column_start, cell)
+        :return: El grupo de procesos (ver `mystical.parallel`). Se debe cerrar con `close`.
+        :rtype: ParallelExecutor
+
+        :raise ValueError: Si la tabla no tiene contenido numérico.
+        """
+        from .parallel import ParallelExecutor
+
+        return ParallelExecutor(self.__storage, processes, shards)
+
+    # Documentado
+    def render(self, file=None, max_rows: int = None, max_cols: int = None) -> None:
+        """Escribe la tabla en formato de cuadrícula en `file`, línea por línea, sin construir antes el texto completo.
+
+        Con `max_rows` y `max_cols` solo se muestran las primeras y las últimas filas y columnas; las omitidas se
+        reemplazan por una fila y una columna de '...'. El tiempo y la memoria dependen de los límites y no del tamaño
+        de la tabla. `str(table)` usa este método con `render.DISPLAY_ROWS` y `render.DISPLAY_COLUMNS` para las
+        tablas que superan esos límites.
+
+        :param file: Objeto con un método `write`. Por defecto, `sys.stdout`.
+        :param int max_rows: Cantidad máxima de filas que se muestran, o None (por defecto) para mostrarlas todas.
+        :param int max_cols: Cantidad máxima de columnas que se muestran, o None (por defecto) para mostrarlas todas.
+        :raise ValueError: Si max_rows o max_cols no son None ni un entero mayor que 0.
+        """
+        from .render import render
+
+        if file is None:
+            import sys
+            file = sys.stdout
+        render(self.__storage, file, max_rows, max_cols)
 
     # Documentado
     def get_row(self, row: int) -> list:
@@ -612,34 +1365,212 @@ class Table:
         :rtype: list
         """
         # si es numero mayor o igual que 0 y menor o igual que la cantidad de filas de la tabla
-        if isinstance(row, int) and 0 <= row <= len(self.table):
-            return self.table[row]
+        if isinstance(row, int) and 0 <= row < self.row:
+            return self.__storage.get_row(row)
 
     # Documentado
     def get_column(self, column: int) -> list:
         """Obtiene una columna completa de la tabla.
 
+            Lee la columna directamente del almacenamiento, sin construir la lista de posiciones de la selección.
+            Con `column_major` la lee del espejo por columnas, donde está contigua. Siempre devuelve una lista
+            nueva: modificarla no cambia la tabla ni el espejo.
+
             :param int column: columna a obtener.
 
             :return: Retorna una lista que representa la columna obtenida. Retorna `None` si la columna no existe
             :rtype: list
             """
-        if isinstance(column, int) and column >= 0 and len(self.table[0]):
+        if isinstance(column, int) and 0 <= column < self.column:
+            if self.__column_major:
+                mirror = self.__columns()
+                values = mirror.get_row(column)
+                # ListStorage devuelve su propia fila: se copia para que el llamador no modifique el espejo.
+                return values.copy() if isinstance(mirror, ListStorage) else values
+            return self.__storage.get_column(column)
+
+    # Documentado
+    def set(self, row: int, column: int, value) -> None:
+        """Establece el contenido de la celda (`row`, `column`) en tiempo constante.
+
+        La escritura no reconstruye nada: se anota en el registro de celdas modificadas y los índices de
+        `section_sum` y `region_*` se actualizan de forma incremental la próxima vez que se usan, recorriendo solo la
+        parte afectada por cada celda. El espejo por columnas se actualiza en el momento. La caché de `section` no
+        cambia, porque guarda posiciones y no contenido.
+
+        :param int row: Fila de la celda. Debe ser mayor o igual a 0.
+        :param int column: Columna de la celda. Debe ser mayor o igual a 0.
+        :param value: Nuevo contenido de la celda.
+
+        :raise ValueError: si self.validate(row, column, 0) retorna Falso
+        :raise TableSectionError: si la celda no pertenece a la tabla.
+        :raise TypeError: si el almacenamiento no admite `value` o es de solo lectura.
+        """
+        self.set_many(((row, column, value),))
+
+    # Documentado
+    def set_many(self, cells) -> None:
+        """Establece el contenido de varias celdas, igual que llamar a `set` con cada una.
+
+        Los índices se actualizan una sola vez con todos los cambios; si actualizarlos costara más que construirlos,
+        se descartan y se construyen de nuevo cuando se usen.
+
+        :param cells: Iterable de tuplas `(row, column, value)`.
+
+        :raise ValueError: si alguna celda no es válida según self.validate(row, column, 0)
+        :raise TableSectionError: si alguna celda no pertenece a la tabla. Las celdas anteriores quedan escritas.
+        :raise TypeError: si el almacenamiento no admite algún contenido o es de solo lectura.
+        """
+        storage, mirror, dirty = self.__storage, self.__mirror, self.__dirty
+        indexed = self.__prefix is not None or self.__area is not None
+        for row, column, value in cells:
+            if not self.validate(row, column, 0):
+                raise ValueError(
+                    'Los parámetros no son válidos.'
+                )
+            if not (row < self.row and column < self.column):
+                raise TableSectionError((row, column), (self.row - 1, self.column - 1), 'Celda fuera de la tabla.')
+            if indexed and (row, column) not in dirty:
+                dirty[row, column] = storage.get(row, column)
+            storage.set(row, column, value)
+            if mirror is not None:
+                mirror.set(column, row, value)
+
+    def __sync(self) -> None:
+        """Aplica a los índices construidos las celdas modificadas desde la última vez que se usaron."""
+        if self.__dirty:
+            get = self.__storage.get
+            changes = [(row, column, old, get(row, column)) for (row, column), old in self.__dirty.items()]
+            self.__dirty = {}
             try:
-                return [self.table[x[0]][x[1]] for x in self.section_down(0, column, len(self.table))['position']]
-            except TableSectionError:
-                pass
+                for index in (self.__prefix, self.__area):
+                    if index is not None:
+                        index.update(changes)
+            except Exception:
+                # Un índice a medio actualizar daría sumas incorrectas: se descartan y se reconstruyen al usarse.
+                self.__prefix = self.__area = None
+                raise
+
+    # Documentado
+    def append_row(self, values=None) -> None:
+        """Añade una fila al final de la tabla conservando el contenido.
+
+        El almacenamiento reserva capacidad de más al crecer, así que añadir n filas cuesta O(columnas) amortizado por
+        fila en lugar de reconstruir la tabla. Los índices derivados y el espejo por columnas se descartan.
+
+        :param values: Contenido de la fila, con una celda por columna. Si no se pasa, la fila se llena con `fill`.
+
+        :raise TableStructureError: si `values` no tiene una celda por columna.
+        :raise ValueError: si el almacenamiento no se puede redimensionar, por ejemplo al estar proyectado en memoria.
+        """
+        self.insert_row(self.row, values)
+
+    # Documentado
+    def insert_row(self, index: int, values=None) -> None:
+        """Inserta una fila antes de la fila `index` conservando el contenido. Las filas siguientes se desplazan.
+
+        :param int index: Posición de la nueva fila, entre 0 y `row`.
+        :param values: Contenido de la fila, con una celda por columna. Si no se pasa, la fila se llena con `fill`.
+
+        :raise ValueError: si `index` no está entre 0 y `row`, o el almacenamiento no se puede redimensionar.
+        :raise TableStructureError: si `values` no tiene una celda por columna.
+        """
+        if not (isinstance(index, int) and 0 <= index <= self.row):
+            raise ValueError(f"index debe ser un número entre 0 y {self.row}")
+        self.__storage.insert_row(index, self.__new_cells(values, self.column))
+        self.__row += 1
+        self.invalidate()
+
+    # Documentado
+    def append_column(self, values=None) -> None:
+        """Añade una columna al final de la tabla conservando el contenido.
+
+        :param values: Contenido de la columna, con una celda por fila. Si no se pasa, la columna se llena con `fill`.
+
+        :raise TableStructureError: si `values` no tiene una celda por fila.
+        :raise ValueError: si el almacenamiento no se puede redimensionar.
+        """
+        self.insert_column(self.column, values)
+
+    # Documentado
+    def insert_column(self, index: int, values=None) -> None:
+        """Inserta una columna antes de la columna `index` conservando el contenido.
+        Con almacenamiento contiguo (`dtype`) las filas están una a continuación de otra, así que insertar una columna
+        cuesta lo mismo que copiar la tabla.
+
+        :param int index: Posición de la nueva columna, entre 0 y `column`.
+        :param values: Contenido de la columna, con una celda por fila. Si no se pasa, la columna se llena con `fill`.
+
+        :raise ValueError: si `index` no está entre 0 y `column`, o el almacenamiento no se puede redimensionar.
+        :raise TableStructureError: si `values` no tiene una celda por fila.
+        """
+        if not (isinstance(index, int) and 0 <= index <= self.column):
+            raise ValueError(f"index debe ser un número entre 0 y {self.column}")
+        self.__storage.insert_column(index, self.__new_cells(values, self.row))
+        self.__column += 1
+        self.invalidate()
+
+    # Documentado
+    def resize(self, row: int, column: int) -> None:
+        """Cambia las dimensiones de la tabla conservando las celdas que siguen dentro de ella; las nuevas celdas
+        contienen `fill`. A diferencia de los setters `row` y `column`, no descarta el contenido.
+
+        :param int row: Nuevo número de filas de la tabla.
+        :param int column: Nuevo número de columnas de la tabla.
+
+        :raise ValueError: si row o column no son de tipo int y mayores que 0, o el almacenamiento no se puede
+            redimensionar.
+        """
+        if not (isinstance(row, int) and row > 0 and isinstance(column, int) and column > 0):
+            raise ValueError("row y column deben ser números y deben ser mayores que 0")
+        self.__storage.resize(row, column, self.__new_fill())
+        self.__row = row
+        self.__column = column
+        self.invalidate()
+
+    def __new_fill(self):
+        """Contenido de las celdas nuevas al redimensionar: `fill`, o 0 si el almacenamiento es numérico."""
+        if self.__sparse:
+            return self.__storage.fill
+        return 0 if self.fill is None and self.__dtype is not None else self.fill
+
+    def __new_cells(self, values, count: int) -> list:
+        if values is None:
+            return [self.__new_fill()] * count
+        values = list(values)
+        if len(values) != count:
+            raise TableStructureError(f'Se esperaban {count} celdas y se pasaron {len(values)}.')
+        return values
+
+
+def _rebuild(rows: int, columns: int, dtype: str, buffer, engine: str, cache: int = 0,
+             column_major: bool = False) -> Table:
+    """Reconstruye una tabla con almacenamiento contiguo serializada con pickle. Si el buffer recibido admite
+    escritura se usa directamente, sin copiarlo; se copia en un array la primera vez que la tabla cambia de tamaño.
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        data = array(dtype)
+        data.frombytes(view)
+    else:
+        data = view.cast('B').cast(dtype)
+    output = Table.from_storage(ArrayStorage(rows, columns, dtype, data), engine)
+    output.cache = cache
+    output.column_major = column_major
+    return output
 
 
 class TableSection:
     """Selecciona partes de la tabla utilizando un algoritmo basado en cálculos de inecuaciones y no en iteraciones."""
 
-    def __init__(self, x, y, cells, table):
+    def __init__(self, x, y, cells, table, metrics=None):
         """
         :param int x: Representa la fila inicial de la selección.
         :param int y: Representa la columna inicial de la selección.
         :param int cells: Representa la cantidad de celdas a seleccionar de la tabla
         :param list[list, ..., list] table: Es la tabla sobre la cual se realizarán las operaciones de selección.
+        :param metrics: Una `Metrics` (ver `mystical.instrument`) en la que se registra cada recorrido de los
+        generadores gn_section_*: dirección, celdas generadas y latencia. Si es None no se mide nada.
         """
         self.__x__ = x
         self.__y__ = y
@@ -647,6 +1578,8 @@ class TableSection:
         self.__table__ = table
         self.__stop = ()
         self.__start = (x, y)
+        if metrics is not None:
+            metrics.instrument_section(self)
 
     # Documentado
     @property
@@ -670,6 +1603,30 @@ class TableSection:
         """
         return self.__stop
 
+    # Documentado
+    def gn_section(self, d_row: int, d_column: int, stride: int = 1):
+        """Permite obtener una selección avanzando un vector (`d_row`, `d_column`) arbitrario.
+        La selección inicia en (self.x, self.y) y abarca self.cells pasos más, es decir, self.cells + 1 celdas, sobre
+        self.table. Todos los métodos gn_section_* usan este método con el vector de su dirección (ver `VECTORS`).
+
+        Los límites se comprueban de forma analítica a partir de la primera y la última celda.
+
+        :param int d_row: Filas que se avanza en cada paso.
+        :param int d_column: Columnas que se avanza en cada paso.
+        :param int stride: Cantidad de pasos entre dos celdas seleccionadas consecutivas.
+        :return: Un generador que contiene las posiciones seleccionadas de la tabla. No genera posiciones si la
+        selección no se puede realizar.
+        :rtype: generator
+        """
+        d_row, d_column = d_row * stride, d_column * stride
+        x, y, cells = self.__x__, self.__y__, self.__cell__
+        try:
+            _check_limits(len(self.__table__), len(self.__table__[0]), d_row, d_column, x, y, cells + 1)
+        except TableSectionError:
+            return
+        self.__stop = (x + d_row * cells, y + d_column * cells)
+        yield from zip(_steps(x, d_row, cells + 1), _steps(y, d_column, cells + 1))
+
     # Documentado
     def gn_section_right(self):
         """Permite obtener una selección en sentido E (hacia la derecha).
@@ -682,12 +1639,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda hacia la derecha
-        # y + cell <= column - 1
-        if self.__y__ + self.__cell__ <= len(self.__table__[0]) - 1:
-            self.__stop = (self.__x__, self.__y__ + self.__cell__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__, self.__y__ + i
+        return self.gn_section(*VECTORS[RIGHT])
 
     # Documentado
     def gn_section_down(self):
@@ -701,12 +1653,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda hacia la abajo
-        # x + cell <= row - 1
-        if self.__x__ + self.__cell__ <= len(self.__table__) - 1:
-            self.__stop = (self.__x__ + self.__cell__, self.__y__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__ + i, self.__y__
+        return self.gn_section(*VECTORS[DOWN])
 
     # Documentado
     def gn_section_left(self):
@@ -720,13 +1667,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda hacia la izquierda
-        # y + 1 - cell >= 0
-
-        if self.__y__ + 1 - self.__cell__ >= 0:
-            self.__stop = (self.__x__, self.__y__ - self.__cell__)
-            for i in range(self.__cell__):
-                yield self.__x__, self.__y__ - i
+        return self.gn_section(*VECTORS[LEFT])
 
     # Documentado
     def gn_section_up(self):
@@ -740,13 +1681,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda hacia arriba
-        # x - cell >= 0
-
-        if self.__x__ - self.__cell__ >= 0:
-            self.__stop = (self.__x__ - self.__cell__, self.__y__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__ - i, self.__y__
+        return self.gn_section(*VECTORS[UP])
 
     # Documentado
     def gn_section_diagonal_x(self):
@@ -760,12 +1695,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda en diagonal-x
-        # x - cell >= 0 and y + cell <= column - 1
-        if self.__x__ - self.__cell__ >= 0 and self.__y__ + self.__cell__ <= len(self.__table__[0]) - 1:
-            self.__stop = (self.__x__ - self.__cell__, self.__y__ + self.__cell__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__ - i, self.__y__ + i
+        return self.gn_section(*VECTORS[DIAGONAL_X])
 
     # Documentado
     def gn_section_diagonal_y(self):
@@ -779,13 +1709,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda en diagonal-y
-        # x - cell >= 0 and y + 1 - cell >= 0
-
-        if self.__x__ - self.__cell__ >= 0 and self.__y__ + 1 - self.__cell__ >= 0:
-            self.__stop = (self.__x__ - self.__cell__, self.__y__ - self.__cell__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__ - i, self.__y__ - i
+        return self.gn_section(*VECTORS[DIAGONAL_Y])
 
     # Documentado
     def gn_section_diagonal_xr(self):
@@ -799,13 +1723,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda en diagonal-xr
-        # x + cell <= row - 1 and  y + 1 - cell >= 0
-
-        if self.__x__ + self.__cell__ <= len(self.__table__) - 1 and self.__y__ + 1 - self.__cell__ >= 0:
-            self.__stop = (self.__x__ + self.__cell__, self.__y__ - self.__cell__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__ + i, self.__y__ - i
+        return self.gn_section(*VECTORS[DIAGONAL_XR])
 
     # Documentado
     def gn_section_diagonal_yr(self):
@@ -819,13 +1737,7 @@ class TableSection:
         no se puede realizar.
         :rtype: generator
         """
-        # formula para validar la búsqueda en diagonal-yr
-        # x + cell <= row - 1 and y + cell <= column - 1
-        if self.__x__ + self.__cell__ <= len(self.__table__) - 1 and self.__y__ + self.__cell__ <= len(
-                self.__table__[0]) - 1:
-            self.__stop = (self.__x__ + self.__cell__, self.__y__ + self.__cell__)
-            for i in range(self.__cell__ + 1):
-                yield self.__x__ + i, self.__y__ + i
+        return self.gn_section(*VECTORS[DIAGONAL_YR])
 
 
 def create_table(row: int,
@@ -834,9 +1746,17 @@ def create_table(row: int,
                  random_fill: bool = False,
                  _min: int = 0,
                  _max: int = 100,
-                 exclude=None):
+                 exclude=None,
+                 seed=None,
+                 generator: str = 'python',
+                 processes: int = None):
     """Crea una tabla de con dimensiones y contenido personalizado
 
+    Con random_fill los números se generan por bloques de filas y se toman directamente de los valores permitidos
+    (ver `mystical.generate`), por lo que exclude no vuelve a sortear números y no hace más lento el llenado. Para
+    escribir la tabla directamente en un almacenamiento contiguo o en memoria compartida se usan `create_storage` y
+    `create_shared`.
+
     :param int row: Cantidad de filas que debe tener la tabla.
     :param int column: Cantidad de columnas que debe tener la tabla.
     :param int fill: Contenido de las celdas de la tabla. Si se random_fill igual a True, el valor de fill es ignorado.
@@ -845,27 +1765,89 @@ def create_table(row: int,
     :param int _max: Máximo número con el que se llenará la tabla.
     :param list exclude: Lista de números que desea excluir de las celdas de la tabla.
     Solo funciona si se usa random_fill.
+    :param seed: Semilla (entero o texto) de random_fill. Con la misma semilla se obtiene siempre la misma tabla.
+    :param str generator: Motor de random_fill, 'python' o 'numpy'. Cada motor genera números distintos para la misma
+    semilla.
+    :param int processes: Si se pasa, random_fill reparte los bloques de filas entre esa cantidad de procesos, que
+    escriben en memoria compartida con enteros de 64 bits. El resultado para una semilla es el mismo con cualquier
+    cantidad de procesos.
     :return: Retorna una tabla generada con los parámetros establecidos.
     :rtype: list
+
+    :raise ValueError: Si no hay números entre _min y _max que no estén excluidos, o generator no es válido.
     """
 
+    if random_fill and processes:
+        return create_storage(row, column, fill, random_fill, _min, _max, exclude, seed, 'q', generator,
+                              processes).tolist()
     if random_fill:
-        output = []
-        for r in range(row):
-            col = []
-            for c in range(column):
-                if exclude is not None:
-                    number = randrange(_min, _max)
-                    while number in exclude:
-                        number = randrange(_min, _max)
-                    col.append(number)
-                else:
-                    number = randrange(_min, _max)
-                    col.append(number)
-            output.append(col)
-        return output
-    else:
-        return [[fill] * column for _ in range(row)]
+        from .generate import random_table
+
+        return random_table(row, column, _min, _max, exclude, seed, None, generator)
+    return [[fill] * column for _ in range(row)]
+
+
+def create_storage(row: int,
+                   column: int,
+                   fill: int = 0,
+                   random_fill: bool = False,
+                   _min: int = 0,
+                   _max: int = 100,
+                   exclude=None,
+                   seed=None,
+                   dtype: str = 'q',
+                   generator: str = 'python',
+                   processes: int = None) -> ArrayStorage:
+    """Como `create_table`, pero escribe las celdas directamente en un `ArrayStorage` de tipo `dtype`, sin construir
+    listas intermedias. Se usa con `Table.from_storage`.
+
+    :param str dtype: Código de tipo del módulo array de las celdas.
+    :return: El almacenamiento con la tabla generada.
+    :rtype: ArrayStorage
+
+    :raise ValueError: Si no hay números entre _min y _max que no estén excluidos, no caben en dtype, o dtype o
+    generator no son válidos.
+    """
+    if random_fill and processes:
+        from .generate import parallel_table, take
+
+        return take(parallel_table(row, column, _min, _max, exclude, seed, dtype, generator, processes))
+    if random_fill:
+        from .generate import random_table
+
+        return ArrayStorage(row, column, dtype, random_table(row, column, _min, _max, exclude, seed, dtype, generator))
+    return ArrayStorage.filled(row, column, fill, dtype)
+
+
+def create_shared(row: int,
+                  column: int,
+                  fill: int = 0,
+                  random_fill: bool = False,
+                  _min: int = 0,
+                  _max: int = 100,
+                  exclude=None,
+                  seed=None,
+                  dtype: str = 'q',
+                  generator: str = 'python',
+                  processes: int = None,
+                  name: str = None):
+    """Como `create_storage`, pero deja la tabla en un segmento de memoria compartida nuevo, al que se adjunta con
+    `Table.attach`. Con random_fill los procesos escriben directamente en el segmento, sin copiar la tabla.
+
+    :param str name: Nombre del segmento. Si no se pasa, se genera uno.
+    :return: El segmento creado. El proceso que lo crea es responsable de liberarlo con `close` y `unlink`.
+    :rtype: SharedMemory
+
+    :raise ValueError: Si no hay números entre _min y _max que no estén excluidos, no caben en dtype, o dtype o
+    generator no son válidos.
+    """
+    if random_fill:
+        from .generate import parallel_table
+
+        return parallel_table(row, column, _min, _max, exclude, seed, dtype, generator, processes, name)
+    from .shared import publish
+
+    return publish(ArrayStorage.filled(row, column, fill, dtype), name)
 
 # Tabla creada automáticamente
 # t = create_table(3, 5, random_fill=True, _min=1, _max=50)
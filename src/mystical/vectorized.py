@@ -0,0 +1,135 @@
+"""
+Modo de ejecución vectorizado de las selecciones de `Table`, basado en NumPy.
+
+Una selección queda definida por el punto inicial, el vector de dirección y la cantidad de celdas, por lo que sus
+posiciones se calculan como dos arreglos de índices (filas y columnas) con una sola operación, y los límites de la
+tabla se comprueban una única vez de forma analítica a partir de la primera y la última celda.
+
+NumPy es una dependencia opcional: `pip install mystical[numpy]`.
+"""
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    raise ImportError('El modo de ejecución "numpy" requiere NumPy: pip install mystical[numpy]') from None
+
+from .table import VECTORS, _check_limits
+
+
+class SectionArrays:
+    """Resultado de una selección vectorizada.
+
+    Guarda las posiciones seleccionadas como dos arreglos de índices, `rows` y `columns`, de forma que
+    `table[rows[i]][columns[i]]` es la i-ésima celda de la selección. Para los llamadores que esperan el diccionario
+    de los métodos `section_*`, admite el acceso por las llaves 'type' y 'position' y el método `to_dict`.
+    """
+
+    __slots__ = ('type', 'rows', 'columns')
+
+    def __init__(self, _type: str, rows, columns):
+        """
+        :param str _type: La orientación de la selección, uno de `TYPES`.
+        :param numpy.ndarray rows: Índices de fila de las celdas seleccionadas.
+        :param numpy.ndarray columns: Índices de columna de las celdas seleccionadas.
+        """
+        self.type = _type
+        self.rows = rows
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, key):
+        if key == 'type':
+            return self.type
+        if key == 'position':
+            return list(zip(self.rows.tolist(), self.columns.tolist()))
+        raise KeyError(key)
+
+    def __eq__(self, other):
+        if isinstance(other, SectionArrays):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.type!r}, {self.rows!r}, {self.columns!r})"
+
+    def to_dict(self) -> dict:
+        """Devuelve la selección con la forma de los métodos `section_*`: {'type': ..., 'position': [...]}."""
+        return {'type': self.type, 'position': self['position']}
+
+    def copy(self):
+        """Devuelve una selección con copias propias de los arreglos de índices."""
+        return SectionArrays(self.type, self.rows.copy(), self.columns.copy())
+
+
+def section_indices(rows: int, columns: int, direction, row: int, column: int, cell: int,
+                    vector=None) -> SectionArrays:
+    """Calcula los índices de una selección sobre una tabla de `rows` x `columns`.
+
+    :param int rows: Número de filas de la tabla.
+    :param int columns: Número de columnas de la tabla.
+    :param direction: Dirección de la selección, uno de `TYPES`, o el vector si la selección no tiene nombre.
+    :param int row: Fila inicial de la selección.
+    :param int column: Columna inicial de la selección.
+    :param int cell: Cantidad de celdas a seleccionar.
+    :param tuple vector: Vector (fila, columna) de la selección. Si no se pasa, se usa el de `direction`.
+
+    :return: La selección como dos arreglos de índices.
+    :rtype: SectionArrays
+
+    :raise TableSectionError: Si la primera o la última celda de la selección quedan fuera de la tabla.
+    """
+    d_row, d_column = VECTORS[direction] if vector is None else vector
+    _check_limits(rows, columns, d_row, d_column, row, column, cell)
+    steps = numpy.arange(cell, dtype=numpy.intp)
+    return SectionArrays(direction, row + d_row * steps, column + d_column * steps)
+
+
+def section_many(rows: int, columns: int, queries):
+    """Versión vectorizada de `batch.section_many`: resuelve todo el lote con operaciones sobre arreglos.
+
+    Las direcciones se normalizan una vez por valor distinto. Si las filas, columnas o celdas no son enteras, el lote
+    se resuelve con la versión de `batch`, que valida consulta por consulta.
+
+    :param int rows: Número de filas de la tabla.
+    :param int columns: Número de columnas de la tabla.
+    :param queries: Consultas en cualquiera de los formatos que admite `batch.columnar`.
+    :rtype: SectionBatch
+    """
+    from .batch import SectionBatch, columnar, section_many as python_section_many
+
+    query = columnar(queries)
+    directions, starts_row, starts_column, cells = (numpy.asarray(values) for values in query)
+    if any(values.size and values.dtype.kind not in 'iu' for values in (starts_row, starts_column, cells)):
+        return python_section_many(rows, columns, dict(zip(('direction', 'row', 'column', 'cell'), query)))
+    starts_row = starts_row.astype(numpy.intp, copy=False)
+    starts_column = starts_column.astype(numpy.intp, copy=False)
+    cells = cells.astype(numpy.intp, copy=False)
+
+    unique, inverse = numpy.unique(directions.astype(str), return_inverse=True)
+    normalized = [value.upper() if value.upper() in VECTORS else None for value in unique.tolist()]
+    vectors = numpy.array([VECTORS.get(value, (0, 0)) for value in normalized], dtype=numpy.intp).reshape(-1, 2)
+    known = numpy.array([value is not None for value in normalized], dtype=bool)
+    d_row = vectors[inverse, 0]
+    d_column = vectors[inverse, 1]
+
+    last = cells - 1
+    stop_row = starts_row + d_row * last
+    stop_column = starts_column + d_column * last
+    valid = known[inverse] & (starts_row >= 0) & (starts_column >= 0) & (cells >= 0)
+    valid &= (cells == 0) | ((starts_row < rows) & (starts_column < columns) & (stop_row >= 0) & (stop_row < rows) &
+                             (stop_column >= 0) & (stop_column < columns))
+
+    lengths = numpy.where(valid, cells, 0)
+    offsets = numpy.zeros(len(lengths) + 1, dtype=numpy.intp)
+    numpy.cumsum(lengths, out=offsets[1:])
+    owner = numpy.repeat(numpy.arange(len(lengths)), lengths)
+    steps = numpy.arange(offsets[-1], dtype=numpy.intp) - offsets[owner]
+    types = [normalized[code] if ok else None for code, ok in zip(inverse.tolist(), valid.tolist())]
+    return SectionBatch(types, offsets,
+                        starts_row[owner] + d_row[owner] * steps,
+                        starts_column[owner] + d_column[owner] * steps,
+                        valid.astype(numpy.int8))
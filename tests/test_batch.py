@@ -0,0 +1,68 @@
+import unittest
+from src.mystical import table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_t_Table = [
+    ['A', 'B', 'C', 'D', 'F', 'G'],
+    ['H', 'I', 'J', 'K', 'L', 'M'],
+    ['Ñ', 'O', 'P', 'Q', 'R', 'S'],
+    ['T', 'V', 'X', 'Y', 'Z', '0'],
+    ['1', '2', '3', '4', '5', '6']]
+
+_queries = [
+    ('UP', 3, 2, 4),
+    ('down', 0, 3, 4),
+    ('Right', 1, 1, 4),
+    ('LEFT', 2, 5, 4),
+    ('DIAGONAL-X', 3, 1, 4),
+    ('DIAGONAL-Y', 4, 5, 4),
+    ('DIAGONAL-XR', 0, 5, 4),
+    ('DIAGONAL-YR', 0, 0, 4),
+    ('DIAGONAL-YR', 3, 3, 0),
+    ('NORTH', 0, 0, 1),
+    ('UP', -1, 0, 1),
+    ('UP', 0, 0, '1'),
+    ('DOWN', 2, 0, 4),
+    ('RIGHT', 0, 6, 1)]
+
+
+class SectionManyTest(unittest.TestCase):
+
+    def check(self, result):
+        object_table = table.Table(_t_Table)
+        self.assertEqual(len(result), len(_queries))
+        self.assertEqual(result.invalid, [9, 10, 11, 12, 13])
+        for index, query in enumerate(_queries[:9]):
+            self.assertEqual(result[index], object_table.section(*query))
+        self.assertIsNone(result[12])
+
+    def test_iterable(self):
+        self.check(table.Table(_t_Table).section_many(_queries))
+
+    def test_columnar(self):
+        directions, rows, columns, cells = zip(*_queries)
+        self.check(table.Table(_t_Table).section_many(
+            {'direction': directions, 'row': rows, 'column': columns, 'cell': cells}))
+
+    def test_empty(self):
+        result = table.Table(_t_Table).section_many([])
+        self.assertEqual(len(result), 0)
+        self.assertEqual(list(result.offsets), [0])
+
+    @unittest.skipIf(numpy is None, 'NumPy no está instalado')
+    def test_numpy(self):
+        object_table = table.Table(_t_Table, engine='numpy')
+        self.check(object_table.section_many(_queries))
+        valid = [query for query in _queries if isinstance(query[3], int)]
+        directions, rows, columns, cells = (numpy.array(values) for values in zip(*valid))
+        result = object_table.section_many({'direction': directions, 'row': rows, 'column': columns, 'cell': cells})
+        self.assertEqual(result.invalid, [9, 10, 11, 12])
+        self.assertEqual(result[0], table.Table(_t_Table).section(*_queries[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import pickle
+import tempfile
+import unittest
+from src.mystical import table, binary
+
+_numbers = [
+    [7, 30, 36, 16, 7, 43, 8, 47, 9, 20, 27, 4],
+    [1, 9, 2, 21, 42, 5, 13, 6, 47, 31, 34, 11],
+    [39, 39, 38, 15, 21, 23, 8, 4, 39, 2, 1, 7],
+    [7, 16, 34, 4, 4, 27, 1, 41, 9, 24, 45, 29],
+    [32, 36, 8, 38, 45, 10, 16, 6, 47, 1, 3, 2],
+    [1, 1, 45, 16, 37, 4, 11, 40, 27, 25, 8, 2],
+    [5, 31, 1, 49, 3, 17, 22, 4, 14, 19, 11, 2]
+]
+
+
+class SaveLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'table.bin')
+
+    def test_save_load(self):
+        for dtype in (None, 'i', 'd'):
+            for compress in (False, True, 9):
+                table.Table(_numbers, dtype=dtype).save(self.path, compress=compress)
+                loaded = table.Table.load(self.path)
+                self.assertEqual(loaded.table, _numbers)
+                self.assertEqual(loaded.dtype, dtype or 'q')
+
+    def test_open_saved(self):
+        table.Table(_numbers, dtype='h').save(self.path)
+        opened = table.Table.open(self.path)
+        self.assertEqual(opened.get_column(3), [row[3] for row in _numbers])
+        opened.storage.close()
+
+        table.Table(_numbers).save(self.path, compress=True)
+        self.assertRaises(ValueError, table.Table.open, self.path)
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, table.Table([['A', 'B']]).save, self.path)
+        table.Table([[1.5, 2]]).save(self.path)
+        self.assertEqual(table.Table.load(self.path).dtype, 'd')
+        with open(self.path, 'r+b') as file:
+            file.truncate(binary.HEADER_SIZE + 4)
+        self.assertRaises(ValueError, table.Table.load, self.path)
+
+
+class PickleTest(unittest.TestCase):
+
+    def test_out_of_band(self):
+        object_table = table.Table(_numbers, dtype='i', engine='lazy')
+        buffers = []
+        data = pickle.dumps(object_table, protocol=5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertLess(len(data), 200)
+        loaded = pickle.loads(data, buffers=[bytearray(buffer) for buffer in buffers])
+        self.assertEqual(loaded.table, _numbers)
+        self.assertEqual(loaded.engine, 'lazy')
+
+    def test_in_band(self):
+        for protocol in (2, 4, 5):
+            for object_table in (table.Table(_numbers, dtype='q'), table.Table(_numbers)):
+                loaded = pickle.loads(pickle.dumps(object_table, protocol=protocol))
+                self.assertEqual(loaded.table, _numbers)
+                self.assertEqual(loaded.dtype, object_table.dtype)
+
+    def test_resize_after_loading(self):
+        object_table = table.Table([row.copy() for row in _numbers], dtype='q', cache=4, column_major=True)
+        for protocol in (4, 5):
+            buffers = []
+            callback = buffers.append if protocol == 5 else None
+            data = pickle.dumps(object_table, protocol=protocol, buffer_callback=callback)
+            loaded = pickle.loads(data, buffers=[bytearray(buffer) for buffer in buffers])
+            self.assertEqual((loaded.cache, loaded.column_major), (4, True))
+            loaded.append_row(list(range(len(_numbers[0]))))
+            loaded.insert_column(0)
+            loaded.resize(2, 3)
+            self.assertEqual(loaded.table, [[0] + row[:2] for row in _numbers[:2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from src.mystical import table
+
+
+class SectionCacheTest(unittest.TestCase):
+
+    def test_hits_and_evictions(self):
+        object_table = table.Table(6, 6, cache=2)
+        expected = table.Table(6, 6).section('diagonal-yr', 0, 0, 4)
+        self.assertEqual(object_table.section('diagonal-yr', 0, 0, 4), expected)
+        result = object_table.section('DIAGONAL-YR', 0, 0, 4)
+        self.assertEqual(result, expected)
+        result['position'].clear()
+        self.assertEqual(object_table.section('DIAGONAL-YR', 0, 0, 4), expected)
+        object_table.section('UP', 5, 0, 3)
+        object_table.section('DOWN', 0, 0, 3)
+        info = object_table.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.size, info.maxsize), (2, 3, 1, 2, 2))
+        object_table = table.Table(6, 6, engine='numpy', cache=2)
+        result = object_table.section('RIGHT', 1, 0, 4)
+        result.columns[:] = 0
+        self.assertEqual(object_table.section('RIGHT', 1, 0, 4)['position'], [(1, 0), (1, 1), (1, 2), (1, 3)])
+        object_table.section('RIGHT', 1, 0, 4).rows[0] = 5
+        self.assertEqual(object_table.section('RIGHT', 1, 0, 4)['position'], [(1, 0), (1, 1), (1, 2), (1, 3)])
+
+    def test_invalidation(self):
+        object_table = table.Table(6, 6, engine='lazy', cache=8)
+        object_table.section('DOWN', 0, 0, 6)
+        object_table.row = 3
+        self.assertEqual(object_table.cache_info().size, 0)
+        self.assertRaises(table.TableSectionError, object_table.section, 'DOWN', 0, 0, 6)
+        object_table.section('RIGHT', 0, 0, 6)
+        object_table.engine = 'python'
+        self.assertIsInstance(object_table.section('RIGHT', 0, 0, 6), dict)
+        object_table.table = [[1, 2], [3, 4]]
+        self.assertEqual(object_table.cache_info().size, 0)
+
+    def test_disabled(self):
+        object_table = table.Table(3, 3)
+        self.assertEqual(object_table.cache, 0)
+        self.assertIsNone(object_table.cache_info())
+        self.assertRaises(ValueError, table.Table, 3, 3, cache=-1)
+        object_table.cache = 4
+        object_table.section('UP', 2, 2, 3)
+        self.assertRaises(ValueError, object_table.section, 'UP', 2.0, 2, 3)
+        self.assertEqual(object_table.cache_info().misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
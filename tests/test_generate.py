@@ -0,0 +1,26 @@
+import unittest
+from src.mystical import table
+
+
+class ParallelGenerationTest(unittest.TestCase):
+
+    def test_create_table(self):
+        options = {'random_fill': True, '_min': -5, '_max': 40, 'exclude': [0], 'seed': 11}
+        expected = table.create_storage(600, 1000, dtype='h', **options)
+        for processes in (1, 3):
+            self.assertEqual(table.create_storage(600, 1000, dtype='h', processes=processes, **options).data,
+                             expected.data)
+        self.assertEqual(table.create_table(4, 5, processes=2, **options), table.create_table(4, 5, **options))
+        segment = table.create_shared(4, 5, processes=2, **options)
+        try:
+            shared = table.Table.attach(segment.name)
+            self.assertEqual(shared.table, table.create_table(4, 5, **options))
+            shared.storage.close()
+        finally:
+            segment.close()
+            segment.unlink()
+        self.assertRaises(ValueError, table.create_storage, 2, 2, random_fill=True, processes=2, dtype='x')
+
+
+if __name__ == '__main__':
+    unittest.main()
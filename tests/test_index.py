@@ -0,0 +1,122 @@
+import unittest
+from src.mystical import table
+
+_numbers = [
+    [7, 30, 36, 16, 7, 43, 8, 47, 9, 20, 27, 4],
+    [1, 9, 2, 21, 42, 5, 13, 6, 47, 31, 34, 11],
+    [39, 39, 38, 15, 21, 23, 8, 4, 39, 2, 1, 7],
+    [7, 16, 34, 4, 4, 27, 1, 41, 9, 24, 45, 29],
+    [32, 36, 8, 38, 45, 10, 16, 6, 47, 1, 3, 2],
+    [1, 1, 45, 16, 37, 4, 11, 40, 27, 25, 8, 2],
+    [5, 31, 1, 49, 3, 17, 22, 4, 14, 19, 11, 2]
+]
+
+
+class PrefixIndexTest(unittest.TestCase):
+
+    def test_section_sum(self):
+        for dtype in (None, 'i', 'd'):
+            object_table = table.Table(_numbers, dtype=dtype)
+            for direction in table.TYPES:
+                for row in range(object_table.row):
+                    for column in range(object_table.column):
+                        for cell in (0, 1, 3, 7):
+                            try:
+                                values = object_table.section_values(direction, row, column, cell)
+                            except table.TableSectionError:
+                                continue
+                            self.assertEqual(object_table.section_sum(direction, row, column, cell), sum(values))
+
+    def test_section_mean_count(self):
+        object_table = table.Table(_numbers)
+        self.assertEqual(object_table.section_mean('diagonal-yr', 0, 0, 5), (7 + 9 + 38 + 4 + 45) / 5)
+        self.assertEqual(object_table.section_count(table.UP, 6, 0, 7), 7)
+        self.assertRaises(ValueError, object_table.section_mean, table.UP, 0, 0, 0)
+        self.assertRaises(table.TableSectionError, object_table.section_sum, table.DOWN, 3, 0, 5)
+
+    def test_invalidate(self):
+        object_table = table.Table([[1, 2], [3, 4]])
+        self.assertEqual(object_table.section_sum(table.RIGHT, 1, 0, 2), 7)
+        object_table.table = [[1, 2], [30, 40]]
+        self.assertEqual(object_table.section_sum(table.RIGHT, 1, 0, 2), 70)
+        object_table.table[1][1] = 400
+        object_table.invalidate()
+        self.assertEqual(object_table.section_sum(table.RIGHT, 1, 0, 2), 430)
+
+
+class SummedAreaTableTest(unittest.TestCase):
+
+    def test_region(self):
+        from statistics import pvariance
+        for dtype in (None, 'i', 'd'):
+            object_table = table.Table(_numbers, dtype=dtype)
+            for row_start, column_start, row_stop, column_stop in ((0, 0, 6, 11), (2, 3, 4, 8), (5, 5, 5, 5)):
+                values = [_numbers[r][c] for r in range(row_start, row_stop + 1)
+                          for c in range(column_start, column_stop + 1)]
+                region = (row_start, column_start, row_stop, column_stop)
+                self.assertEqual(object_table.region_sum(*region), sum(values))
+                self.assertEqual(object_table.region_count(*region), len(values))
+                self.assertAlmostEqual(object_table.region_mean(*region), sum(values) / len(values))
+                self.assertAlmostEqual(object_table.region_variance(*region), pvariance(values))
+
+    def test_invalid(self):
+        object_table = table.Table(_numbers)
+        self.assertRaises(table.TableSectionError, object_table.region_sum, 0, 0, 7, 0)
+        self.assertRaises(table.TableSectionError, object_table.region_sum, 3, 3, 2, 4)
+        self.assertRaises(ValueError, object_table.region_sum, -1, 0, 2, 2)
+
+
+class IncrementalUpdateTest(unittest.TestCase):
+
+    def assertIndexes(self, object_table, expected):
+        for direction in table.TYPES:
+            for row in range(0, 7, 3):
+                for column in range(0, 12, 4):
+                    try:
+                        values = expected.section_values(direction, row, column, 4)
+                    except table.TableSectionError:
+                        continue
+                    self.assertEqual(object_table.section_sum(direction, row, column, 4), sum(values))
+        for region in ((0, 0, 6, 11), (2, 3, 4, 8), (1, 1, 1, 1)):
+            self.assertEqual(object_table.region_sum(*region), expected.region_sum(*region))
+            self.assertAlmostEqual(object_table.region_variance(*region), expected.region_variance(*region))
+
+    def test_set(self):
+        for dtype in (None, 'q', 'd'):
+            object_table = table.Table([row.copy() for row in _numbers], dtype=dtype, column_major=True)
+            self.assertIndexes(object_table, table.Table(_numbers))
+            numbers = [row.copy() for row in _numbers]
+            for row, column, value in ((0, 0, 100), (3, 5, -4), (6, 11, 2), (3, 5, 9)):
+                object_table.set(row, column, value)
+                numbers[row][column] = value
+                self.assertIndexes(object_table, table.Table(numbers))
+            self.assertEqual(object_table.get_column(5), [row[5] for row in numbers])
+            cells = [(row, column, row - column) for row in range(7) for column in range(12)]
+            object_table.set_many(cells)
+            self.assertIndexes(object_table, table.Table([[row - column for column in range(12)] for row in range(7)]))
+
+    def test_set_errors(self):
+        object_table = table.Table(_numbers, dtype='q')
+        self.assertRaises(table.TableSectionError, object_table.set, 7, 0, 1)
+        self.assertRaises(ValueError, object_table.set, -1, 0, 1)
+        self.assertRaises(TypeError, object_table.set, 0, 0, 'A')
+        object_table = table.Table([row.copy() for row in _numbers])
+        object_table.section_sum('RIGHT', 0, 0, 3)
+        object_table.set(0, 1, 0.5)
+        self.assertEqual(object_table.section_sum('RIGHT', 0, 0, 3), 7 + 0.5 + 36)
+
+    def test_single_line(self):
+        for numbers in ([[1], [2], [3]], [[1, 2, 3]]):
+            object_table = table.Table([row.copy() for row in numbers])
+            for direction in table.TYPES:
+                object_table.section_sum(direction, 0, 0, 1)
+            object_table.set(len(numbers) - 1, len(numbers[0]) - 1, 10)
+            object_table.set(0, 0, -2)
+            self.assertEqual(object_table.section_sum('DOWN' if len(numbers) > 1 else 'RIGHT', 0, 0, 3), 10)
+            self.assertEqual(object_table.section_sum('DIAGONAL-XR', 0, 0, 1), -2)
+            self.assertEqual(object_table.section_sum('DIAGONAL-YR', 0, 0, 1), -2)
+            self.assertEqual(object_table.region_sum(0, 0, len(numbers) - 1, len(numbers[0]) - 1), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from src.mystical import table, storage
+
+_numbers = [
+    [7, 30, 36, 16, 7],
+    [1, 9, 2, 21, 42],
+    [39, 39, 38, 15, 21],
+    [7, 16, 34, 4, 4]
+]
+
+
+class FromRowsTest(unittest.TestCase):
+
+    def test_storages(self):
+        for options, kind in (({}, storage.ListStorage), ({'dtype': 'i'}, storage.ArrayStorage),
+                              ({'sparse': True, 'fill': 7}, storage.SparseStorage)):
+            object_table = table.Table.from_rows((tuple(row) for row in _numbers), chunk_size=3, **options)
+            self.assertIsInstance(object_table.storage, kind)
+            self.assertEqual(object_table.table, _numbers)
+            self.assertEqual(object_table.dimension(), '4x5')
+        self.assertEqual(table.Table.from_rows(_numbers, sparse=True, fill=7).storage.stored, 17)
+
+    def test_convert(self):
+        rows = [[str(value) for value in row] for row in _numbers]
+        self.assertEqual(table.Table.from_rows(rows, convert=int).table, _numbers)
+        self.assertEqual(table.Table.from_rows(rows, dtype='d', convert=float).table, _numbers)
+
+    def test_errors(self):
+        with self.assertRaises(table.TableStructureError):
+            table.Table.from_rows([])
+        with self.assertRaises(table.TableStructureError):
+            table.Table.from_rows([[1, 2], [3]])
+        with self.assertRaises(table.TableStructureError):
+            table.Table.from_rows([[]])
+        with self.assertRaises(ValueError):
+            table.Table.from_rows([[1, 'a']], dtype='q')
+        with self.assertRaises(ValueError):
+            table.Table.from_rows(_numbers, dtype='q', sparse=True)
+
+
+class FromCsvTest(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as file:
+            file.write('a;b;c;d;e\n')
+            for row in _numbers:
+                file.write(';'.join(map(str, row)) + '\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_from_csv(self):
+        object_table = table.Table.from_csv(self.path, dtype='q', header=True, delimiter=';', chunk_size=2)
+        self.assertEqual(object_table.table, _numbers)
+        self.assertEqual(object_table.dtype, 'q')
+        object_table = table.Table.from_csv(self.path, delimiter=';')
+        self.assertEqual(object_table.get_row(0), ['a', 'b', 'c', 'd', 'e'])
+        with self.assertRaises(ValueError):
+            table.Table.from_csv(self.path, dtype='q', delimiter=';')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import pickle
+import unittest
+from src.mystical import table, instrument
+
+
+class MetricsTest(unittest.TestCase):
+
+    def test_table(self):
+        events = []
+        metrics = instrument.Metrics(buckets=(1e-3, 1.0))
+        metrics.add_hook(events.append)
+        object_table = table.Table(5, 5, metrics=metrics)
+        object_table.section_up(4, 0, 3)
+        object_table.section('down', 0, 1, cell=5)
+        object_table.section_vector(1, 1, 0, 0, 3)
+        object_table.get_column(2)
+        self.assertRaises(table.TableSectionError, object_table.section_up, 1, 0, 4)
+        self.assertRaises(table.TableSectionError, object_table.section_up, 2, 0, 4)
+        self.assertRaises(ValueError, object_table.section_up, -1, 0, 4)
+        self.assertEqual(dict(metrics.calls), {('section_up', 'UP'): 4, ('section', 'DOWN'): 1,
+                                               ('section_vector', '1,1'): 1, ('get_column', None): 1})
+        self.assertEqual(metrics.cells[('section_up', 'UP')], 3)
+        self.assertEqual(metrics.cells[('section', 'DOWN')], 5)
+        self.assertEqual(dict(metrics.failures), {
+            ('section_up', 'UP', 'TableSectionError: Limites excedidos.'): 2,
+            ('section_up', 'UP', 'ValueError: Los parámetros no son válidos.'): 1,
+        })
+        self.assertEqual(len(events), 7)
+        self.assertIsInstance(events[-1].error, ValueError)
+        snapshot = metrics.snapshot()
+        self.assertEqual(sum(operation['calls'] for operation in snapshot['operations']), 7)
+        self.assertEqual(sum(operation['latency']['count'] for operation in snapshot['operations']), 7)
+        self.assertEqual(len(snapshot['operations'][0]['latency']['counts']), 3)
+
+    def test_section_many(self):
+        metrics = instrument.Metrics()
+        object_table = table.Table(4, 4, metrics=metrics)
+        batch = object_table.section_many([('RIGHT', 0, 0, 2), ('DOWN', 1, 3, 2), ('UP', 0, 0, 3)])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(metrics.calls[('section_many', None)], 1)
+        self.assertEqual(metrics.cells[('section_many', None)], 4)
+
+    def test_disabled(self):
+        object_table = table.Table(3, 3, metrics=True)
+        self.assertIsInstance(object_table.metrics, instrument.Metrics)
+        self.assertIn('section_up', vars(object_table))
+        copy = pickle.loads(pickle.dumps(object_table))
+        self.assertIsNone(copy.metrics)
+        self.assertEqual(copy.section_up(2, 0, 3), object_table.section_up(2, 0, 3))
+        object_table.metrics = None
+        self.assertNotIn('section_up', vars(object_table))
+        self.assertIsNone(table.Table(3, 3).metrics)
+        self.assertRaises(ValueError, table.Table, 3, 3, metrics='yes')
+        self.assertRaises(ValueError, instrument.Metrics, buckets=(1.0, 0.1))
+
+    def test_table_section(self):
+        metrics = instrument.Metrics()
+        numbers = table.create_table(4, 4)
+        self.assertEqual(list(table.TableSection(0, 0, 2, numbers, metrics).gn_section_right()),
+                         [(0, 0), (0, 1), (0, 2)])
+        self.assertEqual(list(table.TableSection(0, 0, 9, numbers, metrics).gn_section_down()), [])
+        self.assertEqual(metrics.cells[('gn_section_right', 'RIGHT')], 3)
+        self.assertEqual(dict(metrics.failures),
+                         {('gn_section_down', 'DOWN', 'TableSectionError: Limites excedidos.'): 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
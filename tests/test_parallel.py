@@ -0,0 +1,50 @@
+import unittest
+from src.mystical import table
+
+_numbers = [
+    [7, 30, 36, 16, 7, 43, 8],
+    [1, 9, 2, 21, 42, 5, 13],
+    [39, 39, 38, 15, 21, 23, 8],
+    [7, 16, 34, 4, 4, 27, 1],
+    [32, 36, 8, 38, 45, 10, 16]
+]
+
+
+class ParallelExecutorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.table = table.Table(_numbers)
+        cls.queries = [(direction, row, column, cell) for direction in table.TYPES for row in range(-1, 6)
+                       for column in range(8) for cell in (0, 1, 3)] + [('NORTE', 0, 0, 1), ('UP', 0, 0, -1)]
+        cls.executor = cls.table.parallel(2, shards=7)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.close()
+
+    def test_section_many(self):
+        expected = self.table.section_many(self.queries)
+        result = self.executor.section_many(self.queries)
+        self.assertEqual(list(result), list(expected))
+        self.assertEqual(result.invalid, expected.invalid)
+
+    def test_aggregate_many(self):
+        sums = self.executor.aggregate_many(self.queries)
+        counts = self.executor.aggregate_many(self.queries, 'count')
+        means = self.executor.aggregate_many(self.queries, 'mean')
+        for query, total, count, mean in zip(self.queries, sums, counts, means):
+            try:
+                expected = self.table.section_sum(*query)
+            except (ValueError, table.TableSectionError):
+                self.assertIsNone(total)
+                self.assertIsNone(count)
+                continue
+            self.assertEqual(total, expected)
+            self.assertEqual(count, query[3])
+            self.assertEqual(mean, expected / query[3] if query[3] else None)
+        self.assertRaises(ValueError, self.executor.aggregate_many, self.queries, 'max')
+
+
+if __name__ == '__main__':
+    unittest.main()
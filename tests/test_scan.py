@@ -0,0 +1,49 @@
+import unittest
+from src.mystical import table
+
+_t_Table = [
+    ['A', 'B', 'C', 'D', 'F', 'G'],
+    ['H', 'I', 'J', 'K', 'L', 'M'],
+    ['Ñ', 'O', 'P', 'Q', 'R', 'S'],
+    ['T', 'V', 'X', 'Y', 'Z', '0'],
+    ['1', '2', '3', '4', '5', '6']]
+
+
+class ScanTest(unittest.TestCase):
+
+    def brute_force(self, object_table, cell, directions=table.TYPES):
+        windows = set()
+        for direction in directions:
+            for row in range(object_table.row):
+                for column in range(object_table.column):
+                    try:
+                        values = object_table.section_values(direction, row, column, cell)
+                    except table.TableSectionError:
+                        continue
+                    windows.add((direction, row, column, tuple(values)))
+        return windows
+
+    def test_scan(self):
+        object_table = table.Table(_t_Table)
+        for cell in range(1, 7):
+            windows = list(object_table.scan(cell))
+            self.assertEqual(len(windows), len(set(windows)))
+            self.assertEqual(set(windows), self.brute_force(object_table, cell))
+
+    def test_directions(self):
+        numbers = [[r * 10 + c for c in range(7)] for r in range(4)]
+        object_table = table.Table(numbers, dtype='i')
+        directions = (table.DIAGONAL_X, 'down')
+        self.assertEqual(set(object_table.scan(3, directions)),
+                         self.brute_force(object_table, 3, (table.DIAGONAL_X, table.DOWN)))
+        self.assertIn((table.DIAGONAL_X, 3, 0, (30, 21, 12)), set(object_table.scan(3, directions)))
+
+    def test_invalid(self):
+        object_table = table.Table(_t_Table)
+        self.assertRaises(ValueError, object_table.scan, 0)
+        self.assertRaises(ValueError, list, object_table.scan(2, ('NORTH',)))
+        self.assertEqual(list(object_table.scan(7, (table.RIGHT,))), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
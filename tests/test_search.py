@@ -0,0 +1,61 @@
+import unittest
+from src.mystical import table, search
+
+_t_Table = [
+    ['A', 'B', 'C', 'D', 'F', 'G'],
+    ['H', 'I', 'J', 'K', 'L', 'M'],
+    ['Ñ', 'O', 'P', 'Q', 'R', 'S'],
+    ['T', 'V', 'X', 'Y', 'Z', '0'],
+    ['1', '2', '3', '4', '5', '6']]
+
+
+class FindSequencesTest(unittest.TestCase):
+
+    def test_find_sequences(self):
+        search_table = {
+            'UP': (3, 2, 'XPJC'),
+            'DOWN': (0, 3, 'DKQY'),
+            'RIGHT': (1, 1, 'IJKL'),
+            'LEFT': (2, 5, 'SRQP'),
+            'DIAGONAL-X': (3, 1, 'VPKF'),
+            'DIAGONAL-Y': (4, 5, '6ZQJ'),
+            'DIAGONAL-XR': (0, 5, 'GLQX'),
+            'DIAGONAL-YR': (0, 0, 'AIPY')}
+        patterns = [word for _, _, word in search_table.values()]
+        matches = table.Table(_t_Table).find_sequences(patterns)
+        self.assertEqual(len(matches), len(patterns))
+        for match in matches:
+            row, column, word = search_table[match.direction]
+            self.assertEqual((match.row, match.column, match.length), (row, column, 4))
+            self.assertEqual(patterns[match.pattern], word)
+
+    def test_overlapping(self):
+        object_table = table.Table([[1, 1, 1, 2], [0, 0, 0, 0]], dtype='i')
+        matches = object_table.find_sequences([(1, 1), (1, 1, 2), (1, 2)], (table.RIGHT,))
+        self.assertEqual(sorted(matches), [
+            search.Match(0, table.RIGHT, 0, 0, 2),
+            search.Match(0, table.RIGHT, 0, 1, 2),
+            search.Match(1, table.RIGHT, 0, 1, 3),
+            search.Match(2, table.RIGHT, 0, 2, 2)])
+
+    def test_brute_force(self):
+        letters = [list('ABAB'), list('BABA'), list('ABBA')]
+        object_table = table.Table(letters)
+        patterns = ['AB', 'BA', 'ABA', 'B']
+        expected = set()
+        for index, pattern in enumerate(patterns):
+            for direction, row, column, values in object_table.scan(len(pattern)):
+                if ''.join(values) == pattern:
+                    expected.add(search.Match(index, direction, row, column, len(pattern)))
+        matches = object_table.find_sequences(patterns)
+        self.assertEqual(len(matches), len(expected))
+        self.assertEqual(set(matches), expected)
+
+    def test_invalid(self):
+        object_table = table.Table(_t_Table)
+        self.assertRaises(ValueError, object_table.find_sequences, ['AB', ''])
+        self.assertRaises(ValueError, object_table.find_sequences, ['AB'], ('NORTH',))
+
+
+if __name__ == '__main__':
+    unittest.main()
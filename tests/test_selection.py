@@ -0,0 +1,61 @@
+import sys
+import unittest
+from src.mystical import table, selection
+
+_t_Table = [
+    ['A', 'B', 'C', 'D', 'F', 'G'],
+    ['H', 'I', 'J', 'K', 'L', 'M'],
+    ['Ñ', 'O', 'P', 'Q', 'R', 'S'],
+    ['T', 'V', 'X', 'Y', 'Z', '0'],
+    ['1', '2', '3', '4', '5', '6']]
+
+
+class SelectionTest(unittest.TestCase):
+
+    def test_section(self):
+        search = {
+            'UP': (3, 2, 4),
+            'DOWN': (0, 3, 4),
+            'RIGHT': (1, 1, 4),
+            'LEFT': (2, 5, 4),
+            'DIAGONAL-X': (3, 1, 4),
+            'DIAGONAL-Y': (4, 5, 4),
+            'DIAGONAL-XR': (0, 5, 4),
+            'DIAGONAL-YR': (0, 0, 4)}
+        python_table = table.Table(_t_Table)
+        lazy_table = table.Table(_t_Table, engine='lazy')
+        for direction, args in search.items():
+            result = lazy_table.section(direction, *args)
+            self.assertIsInstance(result, selection.Selection)
+            self.assertEqual(result, python_table.section(direction, *args))
+            self.assertEqual(result['position'], python_table.section(direction, *args)['position'])
+
+        self.assertRaises(table.TableSectionError, lazy_table.section_down, 2, 0, 4)
+        self.assertRaises(table.TableSectionError, lazy_table.section_left, 0, 2, 4)
+
+    def test_sequence(self):
+        result = selection.Selection(table.DIAGONAL_XR, (0, 5), (1, -1), 5)
+        self.assertEqual(len(result), 5)
+        self.assertEqual(result.start, (0, 5))
+        self.assertEqual(result.stop, (4, 1))
+        self.assertEqual(result[2], (2, 3))
+        self.assertEqual(result[-1], (4, 1))
+        self.assertRaises(IndexError, result.__getitem__, 5)
+        self.assertEqual(list(result[1:4]), [(1, 4), (2, 3), (3, 2)])
+        self.assertEqual(list(result[::2]), [(0, 5), (2, 3), (4, 1)])
+        self.assertEqual(list(reversed(result)), list(result)[::-1])
+        self.assertIn((3, 2), result)
+        self.assertNotIn((3, 3), result)
+        self.assertNotIn((5, 0), result)
+        self.assertEqual(result.index((4, 1)), 4)
+        self.assertEqual(selection.Selection(table.UP, (0, 0), (-1, 0), 0).start, ())
+
+    def test_constant_memory(self):
+        small = selection.Selection(table.DIAGONAL_YR, (0, 0), (1, 1), 5)
+        large = selection.Selection(table.DIAGONAL_YR, (0, 0), (1, 1), 10 ** 9)
+        self.assertEqual(sys.getsizeof(small), sys.getsizeof(large))
+        self.assertEqual(large[10 ** 9 - 1], (10 ** 9 - 1, 10 ** 9 - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
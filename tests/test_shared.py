@@ -0,0 +1,69 @@
+import gc
+import multiprocessing
+import sys
+import unittest
+from src.mystical import table
+
+_numbers = [
+    [7, 30, 36, 16, 7],
+    [1, 9, 2, 21, 42],
+    [39, 39, 38, 15, 21]
+]
+
+
+def _region_sum(name, queue):
+    object_table = table.Table.attach(name)
+    queue.put(object_table.region_sum(0, 0, 2, 4))
+    object_table.storage.close()
+
+
+class SharedTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.segment = table.Table(_numbers).to_shared()
+
+    def tearDown(self):
+        self.segment.close()
+        self.segment.unlink()
+
+    def test_attach(self):
+        object_table = table.Table.attach(self.segment.name)
+        self.assertEqual(object_table.table, _numbers)
+        self.assertEqual(object_table.dtype, 'q')
+        self.assertEqual(object_table.section_sum('DIAGONAL-YR', 0, 0, 3), 7 + 9 + 38)
+        with self.assertRaises(TypeError):
+            object_table.storage.set(0, 0, 1)
+        object_table.storage.close()
+
+    def test_drop_without_close(self):
+        errors = []
+        hook = sys.unraisablehook
+        sys.unraisablehook = errors.append
+        try:
+            object_table = table.Table.attach(self.segment.name)
+            self.assertEqual(object_table.section_sum('RIGHT', 0, 0, 5), 96)
+            del object_table
+            gc.collect()
+            object_table = table.Table.attach(self.segment.name)
+            object_table.table = [[1, 2]]
+            gc.collect()
+        finally:
+            sys.unraisablehook = hook
+        self.assertEqual(errors, [])
+
+    def test_attach_from_process(self):
+        queue = multiprocessing.Queue()
+        for _ in range(2):
+            process = multiprocessing.Process(target=_region_sum, args=(self.segment.name, queue))
+            process.start()
+            process.join()
+            self.assertEqual(queue.get(), sum(map(sum, _numbers)))
+
+    def test_errors(self):
+        self.assertRaises(FileNotFoundError, table.Table.attach, 'mystical-no-existe')
+        self.assertRaises(FileExistsError, table.Table(_numbers).to_shared, self.segment.name)
+        self.assertRaises(ValueError, table.Table([['A']]).to_shared)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+from src.mystical import table, storage
+
+
+class MmapStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'table.bin')
+
+    def test_create_open(self):
+        with storage.MmapStorage.create(self.path, 4, 5, 'i', fill=3) as mapped:
+            mapped.set(2, 4, 42)
+            mapped.flush()
+
+        object_table = table.Table.open(self.path)
+        self.assertEqual(object_table.dimension(), '4x5')
+        self.assertEqual(object_table.dtype, 'i')
+        self.assertEqual(object_table.get_row(2), [3, 3, 3, 3, 42])
+        self.assertEqual(object_table.get_column(4), [3, 3, 42, 3])
+        self.assertEqual(object_table.section_values(table.DIAGONAL_YR, 0, 2, 3).tolist(), [3, 3, 42])
+        self.assertEqual(object_table.section_sum(table.UP, 3, 4, 4), 51)
+        self.assertRaises(TypeError, object_table.storage.set, 0, 0, 1)
+        object_table.storage.close()
+
+    def test_read_write(self):
+        storage.MmapStorage.create(self.path, 3, 3, 'd').close()
+        object_table = table.Table.open(self.path, 'r+')
+        object_table.storage.set(1, 1, 2.5)
+        object_table.storage.close()
+        with storage.MmapStorage(self.path) as mapped:
+            self.assertEqual(mapped.get(1, 1), 2.5)
+
+    def test_invalid(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'no es una tabla' * 4)
+        self.assertRaises(ValueError, table.Table.open, self.path)
+        self.assertRaises(ValueError, table.Table.open, self.path, 'w')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
+import io
 import unittest
-from src.mystical import table
+from src.mystical import table, render
 from random import random, choice
 
 _t_Table = [
@@ -167,6 +168,172 @@ class MyTableTest(unittest.TestCase):
 
         self.assertIsNone(object_table.get_column(object_table.column + 3))
 
+    def test_array_storage(self):
+        numbers = [[r * 10 + c for c in range(6)] for r in range(5)]
+        object_table = table.Table(numbers, dtype='i')
+        self.assertEqual(object_table.dtype, 'i')
+        self.assertEqual(object_table.table, numbers)
+        self.assertEqual(object_table.get_row(2), numbers[2])
+        self.assertEqual(object_table.get_column(3), [row[3] for row in numbers])
+
+        object_table = table.Table(4, 3, 7, dtype='d')
+        self.assertEqual(object_table.table, [[7.0] * 3 for _ in range(4)])
+        object_table.row = 2
+        self.assertEqual(object_table.table, [[7.0] * 3 for _ in range(2)])
+
+        self.assertRaises(ValueError, table.Table, 2, 2, dtype='x')
+
+    def test_section_values(self):
+        object_table = table.Table(_t_Table)
+        self.assertEqual(''.join(object_table.section_values('UP', 3, 2, 4)), 'XPJC')
+        self.assertEqual(''.join(object_table.section_values('diagonal-y', 4, 5, 4)), '6ZQJ')
+        self.assertRaises(table.TableSectionError, object_table.section_values, 'DOWN', 2, 0, 4)
+        self.assertRaises(ValueError, object_table.section_values, 'NORTH', 0, 0, 1)
+
+        numbers = [[r * 10 + c for c in range(6)] for r in range(5)]
+        object_table = table.Table(numbers, dtype='i')
+        view = object_table.section_values(table.DIAGONAL_XR, 0, 5, 5)
+        self.assertEqual(view.tolist(), [5, 14, 23, 32, 41])
+        self.assertEqual(sum(view), 115)
+        with self.assertRaises(TypeError):
+            view[1] = -1
+        self.assertEqual(object_table.get_row(1)[4], 14)
+        self.assertEqual(object_table.section_values(table.LEFT, 0, 5, 6).tolist(), [5, 4, 3, 2, 1, 0])
+
+    def test_sparse_storage(self):
+        object_table = table.Table(10 ** 6, 10 ** 6, 0, sparse=True)
+        self.assertTrue(object_table.sparse)
+        self.assertEqual(object_table.storage.stored, 0)
+        object_table.storage.set(3, 999999, 5)
+        object_table.storage.set(999999, 0, 7)
+        self.assertEqual(object_table.storage.stored, 2)
+        self.assertEqual(object_table.section_values(table.DIAGONAL_X, 999999, 0, 3), [7, 0, 0])
+        self.assertEqual(object_table.section_sum(table.LEFT, 3, 999999, 10), 5)
+        self.assertEqual(object_table.section_up(999999, 0, 2)['position'], [(999999, 0), (999998, 0)])
+        self.assertEqual(object_table.region_sum(0, 0, 999999, 999999), 12)
+        self.assertEqual(object_table.region_sum(0, 0, 10, 10), 0)
+        object_table.storage.set(3, 999999, 0)
+        self.assertEqual(object_table.storage.stored, 1)
+
+        object_table = table.Table(_t_Table, sparse=True)
+        self.assertEqual(object_table.table, _t_Table)
+        self.assertEqual(object_table.get_row(1), _t_Table[1])
+        self.assertEqual(object_table.get_column(5), ['G', 'M', 'S', '0', '6'])
+        self.assertRaises(ValueError, table.Table, 2, 2, dtype='i', sparse=True)
+
+    def test_section_vector(self):
+        object_table = table.Table(_t_Table)
+        self.assertEqual(object_table.section_vector(1, 2, 0, 0, 3)['position'], [(0, 0), (1, 2), (2, 4)])
+        self.assertEqual(object_table.section((1, 2), 0, 0, 3), object_table.section_vector(1, 2, 0, 0, 3))
+        self.assertEqual(object_table.section('right', 1, 0, 3, stride=2),
+                         {'type': table.RIGHT, 'position': [(1, 0), (1, 2), (1, 4)]})
+        self.assertRaises(table.TableSectionError, object_table.section_vector, 2, 1, 0, 0, 4)
+        self.assertRaises(table.TableSectionError, object_table.section_down, 2, 0, 4)
+        self.assertRaises(ValueError, object_table.section_vector, 0, 0, 0, 0, 1)
+        self.assertRaises(ValueError, object_table.section, 'UP', 4, 0, 2, stride=0)
+        object_table.engine = 'lazy'
+        self.assertEqual(object_table.section_vector(-2, 1, 4, 0, 3, stride=1).stop, (0, 2))
+
+    def test_table_section(self):
+        section = table.TableSection(1, 1, 2, _t_Table)
+        self.assertEqual(list(section.gn_section_diagonal_yr()), [(1, 1), (2, 2), (3, 3)])
+        self.assertEqual(section.stop, (3, 3))
+        self.assertEqual(list(section.gn_section_left()), [])
+        self.assertEqual(list(section.gn_section(1, 2)), [(1, 1), (2, 3), (3, 5)])
+        section = table.TableSection(4, 5, 2, _t_Table)
+        self.assertEqual(list(section.gn_section_diagonal_y()), [(4, 5), (3, 4), (2, 3)])
+        self.assertEqual(list(section.gn_section(-1, 0, stride=2)), [(4, 5), (2, 5), (0, 5)])
+
+    def test_column_major(self):
+        numbers = [[r * 10 + c for c in range(6)] for r in range(5)]
+        for options in ({}, {'dtype': 'i'}, {'sparse': True}):
+            object_table = table.Table(numbers, column_major=True, **options)
+            self.assertTrue(object_table.column_major)
+            for column in range(6):
+                self.assertEqual(object_table.get_column(column), [row[column] for row in numbers])
+            self.assertEqual(list(object_table.section_values(table.UP, 4, 2, 3)), [42, 32, 22])
+            self.assertEqual(list(object_table.section_values(table.RIGHT, 1, 2, 3)), [12, 13, 14])
+            self.assertIsNone(object_table.get_column(6))
+            object_table.table = [[1, 2], [3, 4]]
+            self.assertEqual(object_table.get_column(1), [2, 4])
+        object_table = table.Table(_t_Table)
+        object_table.column_major = True
+        self.assertEqual(''.join(object_table.section_values('DOWN', 0, 3, 4)), 'DKQY')
+        object_table.get_column(3).clear()
+        self.assertEqual(object_table.get_column(3)[:4], ['D', 'K', 'Q', 'Y'])
+        object_table = table.Table([[1, 2], [3, 4]], dtype='i', column_major=True)
+        with self.assertRaises(TypeError):
+            object_table.section_values(table.DOWN, 0, 0, 2)[0] = 99
+        self.assertEqual(object_table.get_column(0), [1, 3])
+        self.assertEqual(object_table.get_row(0), [1, 2])
+
+    def test_resize(self):
+        numbers = [[r * 10 + c for c in range(4)] for r in range(3)]
+        for options in ({}, {'dtype': 'q'}, {'sparse': True}):
+            object_table = table.Table([row.copy() for row in numbers], **options)
+            expected = [row.copy() for row in numbers]
+            object_table.append_row([30, 31, 32, 33])
+            expected.append([30, 31, 32, 33])
+            object_table.insert_row(0, [-1, -2, -3, -4])
+            expected.insert(0, [-1, -2, -3, -4])
+            object_table.append_column(range(5))
+            for r, row in enumerate(expected):
+                row.append(r)
+            object_table.insert_column(1, [9] * 5)
+            for row in expected:
+                row.insert(1, 9)
+            self.assertEqual(object_table.table, expected)
+            self.assertEqual(object_table.dimension(), '5x6')
+            self.assertEqual(object_table.section_sum(table.DOWN, 0, 1, 5), 45)
+            object_table.resize(2, 3)
+            self.assertEqual(object_table.table, [row[:3] for row in expected[:2]])
+            object_table.resize(3, 4)
+            self.assertEqual(object_table.get_row(2), [0] * 4 if options else [None] * 4)
+            self.assertRaises(table.TableStructureError, object_table.append_row, [1, 2])
+            self.assertRaises(ValueError, object_table.insert_column, 5)
+        object_table = table.Table(2, 2, 7, dtype='i')
+        for _ in range(3):
+            object_table.append_row()
+        self.assertEqual(object_table.table, [[7, 7]] * 5)
+
+    def test_create_table(self):
+        self.assertEqual(table.create_table(2, 3, fill=5), [[5, 5, 5], [5, 5, 5]])
+        numbers = table.create_table(40, 9, random_fill=True, _min=1, _max=6, exclude=[2, 4], seed=7)
+        self.assertEqual(numbers, table.create_table(40, 9, random_fill=True, _min=1, _max=6, exclude=[2, 4], seed=7))
+        self.assertEqual(len(numbers), 40)
+        self.assertEqual({number for row in numbers for number in row}, {1, 3, 5})
+        self.assertRaises(ValueError, table.create_table, 2, 2, random_fill=True, _min=1, _max=3, exclude=[1, 2])
+        self.assertRaises(ValueError, table.create_table, 2, 2, random_fill=True, generator='fortran')
+
+    def test_create_storage(self):
+        numbers = table.create_table(40, 9, random_fill=True, _min=1, _max=6, exclude=[2, 4], seed=7)
+        storage = table.create_storage(40, 9, random_fill=True, _min=1, _max=6, exclude=[2, 4], seed=7, dtype='b')
+        self.assertEqual(storage.tolist(), numbers)
+        self.assertEqual(table.Table.from_storage(storage).get_row(0), numbers[0])
+        self.assertEqual(table.create_storage(2, 2, fill=3, dtype='i').tolist(), [[3, 3], [3, 3]])
+        for generator in ('python', 'numpy'):
+            self.assertRaises(ValueError, table.create_storage, 2, 2, random_fill=True, _max=200, dtype='b',
+                              generator=generator)
+            self.assertRaises(ValueError, table.create_storage, 2, 2, random_fill=True, _min=-1, dtype='B',
+                              generator=generator)
+        self.assertEqual(table.create_storage(2, 2, random_fill=True, _min=-128, _max=128, dtype='b').dtype, 'b')
+
+    def test_render(self):
+        object_table = table.Table([[1, 'ab'], [100, None]])
+        output = io.StringIO()
+        object_table.render(output)
+        self.assertEqual(output.getvalue(), str(object_table) + '\n')
+        numbers = [[r * 10 + c for c in range(6)] for r in range(7)]
+        for options in ({}, {'dtype': 'q'}, {'sparse': True}):
+            output = io.StringIO()
+            table.Table([row.copy() for row in numbers], **options).render(output, max_rows=3, max_cols=2)
+            lines = output.getvalue().splitlines()
+            self.assertEqual(lines[1::2], ['|   0 | ... |   5 |', '|  10 | ... |  15 |', '| ... | ... | ... |',
+                                           '|  60 | ... |  65 |'])
+            self.assertEqual(lines[0], '+-----+-----+-----+')
+        self.assertRaises(ValueError, object_table.render, output, 0)
+        self.assertEqual(len(str(table.Table(1000, 1000)).splitlines()), 2 * (render.DISPLAY_ROWS + 1) + 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from src.mystical import table
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_t_Table = [
+    ['A', 'B', 'C', 'D', 'F', 'G'],
+    ['H', 'I', 'J', 'K', 'L', 'M'],
+    ['Ñ', 'O', 'P', 'Q', 'R', 'S'],
+    ['T', 'V', 'X', 'Y', 'Z', '0'],
+    ['1', '2', '3', '4', '5', '6']]
+
+
+@unittest.skipIf(numpy is None, 'NumPy no está instalado')
+class VectorizedTest(unittest.TestCase):
+
+    def test_engine(self):
+        object_table = table.Table(_t_Table)
+        self.assertEqual(object_table.engine, 'python')
+        object_table.engine = 'numpy'
+        self.assertEqual(object_table.engine, 'numpy')
+        self.assertRaises(ValueError, table.Table, _t_Table, engine='fortran')
+
+    def test_section(self):
+        search = {
+            'UP': (3, 2, 4),
+            'DOWN': (0, 3, 4),
+            'RIGHT': (1, 1, 4),
+            'LEFT': (2, 5, 4),
+            'DIAGONAL-X': (3, 1, 4),
+            'DIAGONAL-Y': (4, 5, 4),
+            'DIAGONAL-XR': (0, 5, 4),
+            'DIAGONAL-YR': (0, 0, 4)}
+        python_table = table.Table(_t_Table)
+        numpy_table = table.Table(_t_Table, engine='numpy')
+        for direction, args in search.items():
+            selection = numpy_table.section(direction, *args)
+            self.assertEqual(selection.to_dict(), python_table.section(direction, *args))
+            self.assertEqual(selection['type'], direction)
+            self.assertEqual(len(selection), 4)
+
+    def test_section_indices(self):
+        selection = table.Table(_t_Table, engine='numpy').section_diagonal_yr(1, 1, 4)
+        self.assertEqual(selection.rows.tolist(), [1, 2, 3, 4])
+        self.assertEqual(selection.columns.tolist(), [1, 2, 3, 4])
+
+    def test_limits(self):
+        object_table = table.Table(_t_Table, engine='numpy')
+        self.assertRaises(table.TableSectionError, object_table.section_down, 2, 0, 4)
+        self.assertRaises(table.TableSectionError, object_table.section_right, 0, 3, 4)
+        self.assertRaises(table.TableSectionError, object_table.section_diagonal_y, 2, 5, 4)
+        self.assertRaises(ValueError, object_table.section_up, -1, 0, 1)
+        self.assertEqual(object_table.section_up(0, 0, 0)['position'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()